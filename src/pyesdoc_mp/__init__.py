@@ -13,14 +13,22 @@
 import optparse
 import os
 
+from pyesdoc_mp.generators.generator_manifest import GeneratorManifest
 from pyesdoc_mp.generators.generator_options import GeneratorOptions
+from pyesdoc_mp.generators.generator_pool import execute_generators
 from pyesdoc_mp.utils.exception import ESDOCException
 from pyesdoc_mp.utils.factory import (
     create_generators,
     create_ontology,
     create_ontology_schema
     )
+from pyesdoc_mp.utils.generation import create_standard_template_params
+from pyesdoc_mp.utils.output import (
+    create_output_sink,
+    FileSystemSink
+    )
 from pyesdoc_mp.utils.validation import (
+    validate_features,
     validate_language,
     validate_ontology_schema,
     validate_output_dir
@@ -32,61 +40,118 @@ __version__ = '0.2'
 
 
 
-def generate(ontology_schema, language, output_dir):
+def generate(ontology_schema, language, output_dir, cache_dir=None, jobs=1, incremental=False, sink=None, profiler=None,
+             features=None):
     """Generates code.
 
     :param ontology_schema: Ontology schema definition.
     :param language: Target programming language.
     :param output_dir: Target output directory.
+    :param cache_dir: Directory in which linked ontologies are cached (optional).
+    :param jobs: Number of worker processes across which generation is distributed.
+    :param incremental: Flag indicating whether only code affected by schema changes is regenerated.
+    :param sink: Output sink to which generated code is emitted (derived from output_dir if not passed, closed upon completion).
+    :param profiler: Profiler recording generation timings (optional).
+    :param features: Set of enabled optional generation features (optional).
     :type ontology_schema: dict
     :type language: str
     :type output_dir: str
+    :type cache_dir: str
+    :type jobs: int
+    :type incremental: bool
+    :type sink: pyesdoc_mp.utils.output.OutputSink
+    :type profiler: pyesdoc_mp.utils.profiling.Profiler
+    :type features: list
 
     """
     print("-------------------------------------------------------------------")
     print("ES-DOC :: Welcome to the ES-DOC code generator")
 
     # Defensive programming.
-    if can_generate(ontology_schema, language, output_dir):
+    if can_generate(ontology_schema, language, output_dir, features):
+        if sink is None:
+            sink = create_output_sink(output_dir)
+        if incremental and not isinstance(sink, FileSystemSink):
+            raise ESDOCException("Incremental generation requires output to a directory.")
+
         # Notify pre-generation.
         print("-------------------------------------------------------------------")
         print("ES-DOC :: GENERATION OPTION : schema = {0}".format(ontology_schema['name']))
         print("ES-DOC :: GENERATION OPTION : schema version = {0}".format(ontology_schema['version']))
         print("ES-DOC :: GENERATION OPTION : language = {0}".format(language))
         print("ES-DOC :: GENERATION OPTION : output directory = {0}".format(output_dir))
+        if cache_dir is not None:
+            print("ES-DOC :: GENERATION OPTION : cache directory = {0}".format(cache_dir))
+        if jobs > 1:
+            print("ES-DOC :: GENERATION OPTION : jobs = {0}".format(jobs))
+        if incremental:
+            print("ES-DOC :: GENERATION OPTION : incremental = {0}".format(incremental))
+        if features:
+            print("ES-DOC :: GENERATION OPTION : features = {0}".format(', '.join(sorted(features))))
         
         # Initialise ontology.
-        ontology = create_ontology(ontology_schema)        
+        if profiler is not None:
+            started = profiler.start()
+        ontology = create_ontology(ontology_schema, cache_dir)
+        if profiler is not None:
+            profiler.record_ontology(started)
         print("-------------------------------------------------------------------")
         print("ES-DOC :: ONTOLOGY = {0} (packages={1}, classes={2}, enums={3})".format(
             ontology, len(ontology.packages), len(ontology.classes), len(ontology.enums)))
 
-        # Invoke generators.
-        generators = create_generators(language)
-        for generator_key in create_generators(language):
-            print("-------------------------------------------------------------------")
-            print("ES-DOC :: GENERATOR = {0} :: generation begins".format(generator_key))
+        # Snapshot standard template params (shared by all generators).
+        template_params = create_standard_template_params(ontology)
+
+        # Load manifest of previously generated output.
+        manifest = None
+        if incremental:
+            manifest = GeneratorManifest(output_dir, ontology, template_params, features=features)
+
+        try:
+            # Invoke generators across a pool of worker processes.
+            if jobs > 1:
+                print("-------------------------------------------------------------------")
+                print("ES-DOC :: GENERATORS :: parallel generation begins")
+                for generator_key in execute_generators(ontology, language, output_dir, template_params, jobs, manifest, sink, profiler, features):
+                    print("ES-DOC :: GENERATOR = {0} :: generation complete".format(generator_key))
+
+            # Invoke generators.
+            else:
+                generators = create_generators(language)
+                for generator_key in generators:
+                    print("-------------------------------------------------------------------")
+                    print("ES-DOC :: GENERATOR = {0} :: generation begins".format(generator_key))
+
+                    options = GeneratorOptions(generator_key, language, output_dir, template_params, manifest, sink, profiler, features)
+                    generator = generators[generator_key]()
+                    generator.execute(ontology, options)
+
+                    print("ES-DOC :: GENERATOR = {0} :: generation complete".format(generator_key))
+
+        # Flush pending output.
+        finally:
+            sink.close()
 
-            options = GeneratorOptions(generator_key, language, output_dir)
-            generator = generators[generator_key]()
-            generator.execute(ontology, options)
-            
-            print("ES-DOC :: GENERATOR = {0} :: generation complete".format(generator_key))
+        # Save manifest of generated output.
+        if manifest is not None:
+            manifest.save()
 
     print("-------------------------------------------------------------------")
     print("ES-DOC :: Thank you for using the ES-DOC code generator")
     print("-------------------------------------------------------------------")
 
 
-def can_generate(ontology_schema, language, output_dir):
+def can_generate(ontology_schema, language, output_dir, features=None):
     """Verifies whether the generation options are in a state such that generation can occur.
 
     :param ontology_schema: Ontology schema definition.
     :param language: Target programming language.
     :param output_dir: Target output directory.
+    :param features: Set of optional generation features.
     :type ontology_schema: dict
     :type language: str
     :type output_dir: str
+    :type features: list
     :returns: True if generation can occur, False otherwise.
     :rtype: bool
 
@@ -94,6 +159,7 @@ def can_generate(ontology_schema, language, output_dir):
     # Validate.
     errors = validate_language(language)
     errors += validate_output_dir(output_dir)
+    errors += validate_features(features)
     errors += validate_ontology_schema(ontology_schema)
     
     # Report errors.
@@ -11,9 +11,16 @@
 """
 
 import optparse
+import sys
 
 from pyesdoc_mp import generate
+from pyesdoc_mp.generators.generator_options import FEATURES
 from pyesdoc_mp.utils.factory import create_ontology_schema
+from pyesdoc_mp.utils.output import (
+    create_output_sink,
+    STDOUT
+    )
+from pyesdoc_mp.utils.profiling import Profiler
 
 
 def _get_options():
@@ -47,7 +54,42 @@ def _get_options():
                  action="store",
                  dest="output_dir",
                  type="string",
-                 help="Target directory into which code will be generated.")
+                 help="Target directory into which code will be generated (or a .zip, .whl or .tar archive, or - to stream a tar archive to stdout).")
+    p.add_option("-c",
+                 action="store",
+                 dest="cache_dir",
+                 type="string",
+                 default=None,
+                 help="Directory in which parsed ontologies are cached between runs (optional).")
+    p.add_option("-j",
+                 action="store",
+                 dest="jobs",
+                 type="int",
+                 default=1,
+                 help="Number of worker processes across which generation is distributed. [default = %default]")
+    p.add_option("-i",
+                 action="store_true",
+                 dest="incremental",
+                 default=False,
+                 help="Regenerate only code affected by schema changes, leaving unchanged files untouched.")
+    p.add_option("-f",
+                 action="append",
+                 dest="features",
+                 type="choice",
+                 choices=list(FEATURES),
+                 default=[],
+                 help="Optional generation feature (may be repeated). [choices = {0}]".format(', '.join(FEATURES)))
+    p.add_option("--profile",
+                 action="store_true",
+                 dest="profile",
+                 default=False,
+                 help="Print a report of generation timings, emitted output and template render counts.")
+    p.add_option("--profile-json",
+                 action="store",
+                 dest="profile_json",
+                 type="string",
+                 default=None,
+                 help="File to which the generation profile is written as JSON (optional).")
 
     return p.parse_args()[0]
 
@@ -58,6 +100,27 @@ options = _get_options()
 # Get ontology schema.
 ontology_schema = create_ontology_schema(options.schema_name, options.schema_version)
 
+# Stream archive to stdout, in which case progress is reported on stderr.
+sink = None
+if options.output_dir == STDOUT:
+    sink = create_output_sink(STDOUT)
+    sys.stdout = sys.stderr
+
+# Instantiate profiler.
+profiler = None
+if options.profile or options.profile_json:
+    profiler = Profiler()
+
 # Generate.
-generate(ontology_schema, options.language, options.output_dir)
+generate(ontology_schema, options.language, options.output_dir, options.cache_dir, options.jobs, options.incremental, sink, profiler,
+         options.features)
+
+# Report profile.
+if options.profile:
+    print("ES-DOC :: PROFILE")
+    for line in profiler.get_report():
+        print("ES-DOC :: PROFILE :: {0}".format(line))
+    print("-------------------------------------------------------------------")
+if options.profile_json:
+    profiler.save(options.profile_json)
 
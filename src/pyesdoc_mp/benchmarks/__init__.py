@@ -0,0 +1,14 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.__init__.py
+   :copyright: Copyright "Feb 7, 2013", Earth System Documentation
+   :license: GPL/CeCIL
+   :platform: Unix, Windows
+   :synopsis: Performance benchmarks over synthetic ontologies.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+from pyesdoc_mp.benchmarks.synthetic import create_schema
@@ -0,0 +1,125 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.batch
+   :platform: Unix, Windows
+   :synopsis: Measures throughput of batch decoding of a directory of XML documents with & without a process pool.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+N.B. Generated types import simplejson and generated XML decoders import lxml, both must therefore be installed.
+
+"""
+
+# Module imports.
+import importlib
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+
+from pyesdoc_mp.benchmarks.decoding import (
+    create_xml_document,
+    generate_decoders
+    )
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    get_best_time,
+    report
+    )
+from pyesdoc_mp.generators.python.utils import (
+    get_ontology_name,
+    get_ontology_version
+    )
+
+
+
+def _write_documents(ontology, documents_dir, files):
+    """Writes a set of synthetic XML documents (one per file) cycling through the entities of an ontology.
+
+    N.B. Synthetic entities of different packages may share a root tag, only the first such entity is written.
+
+    """
+    entities = []
+    for cls in ontology.entities:
+        if cls.name not in [e.name for e in entities]:
+            entities.append(cls)
+    documents = [create_xml_document(ontology, cls) for cls in entities]
+
+    os.makedirs(documents_dir)
+    for index in range(files):
+        with open(os.path.join(documents_dir, 'document-{0:06d}.xml'.format(index)), 'wb') as f:
+            f.write(documents[index % len(documents)])
+
+
+def run(packages=4, classes=25, properties=8, depth=3, files=500, processes=None, chunk_size=8, repeat=3):
+    """Measures throughput of batch decoding of a directory of XML documents within a process & over a process pool.
+
+    :param packages: Number of packages.
+    :param classes: Number of classes per package.
+    :param properties: Number of properties per class.
+    :param depth: Depth of class inheritance chains.
+    :param files: Number of XML documents (one per file).
+    :param processes: Number of worker processes of pool (defaults to number of cpus).
+    :param chunk_size: Number of files submitted to a worker process at a time.
+    :param repeat: Number of times each measurement is repeated (the best time is reported).
+    :type packages: int
+    :type classes: int
+    :type properties: int
+    :type depth: int
+    :type files: int
+    :type processes: int
+    :type chunk_size: int
+    :type repeat: int
+    :returns: Throughput (files per second) keyed by variant.
+    :rtype: dict
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    sys.path.insert(0, output_dir)
+    try:
+        ontology = generate_decoders(create_schema(packages, classes, properties, depth), output_dir)
+        documents_dir = os.path.join(output_dir, 'documents')
+        _write_documents(ontology, documents_dir, files)
+        batch = importlib.import_module('{0}.v{1}.serialization.decoder_xml_batch'.format(
+            get_ontology_name(ontology), get_ontology_version(ontology)))
+
+        processes = processes or multiprocessing.cpu_count()
+        results = batch.decode_directory(documents_dir, processes=processes, chunk_size=chunk_size)
+        assert [len(r[1] or ()) for r in results] == [1] * files
+
+        result = {}
+        for as_dict in (False, True):
+            for variant_processes in sorted(set((1, processes))):
+                variant = '{0} process{1}{2}'.format(
+                    variant_processes, 'es' if variant_processes > 1 else '', ' (as_dict)' if as_dict else '')
+                elapsed = get_best_time(lambda: batch.decode_directory(
+                    documents_dir, processes=variant_processes, chunk_size=chunk_size, as_dict=as_dict), repeat)
+                result[variant] = files / elapsed
+
+        return result
+    finally:
+        sys.path.remove(output_dir)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC generated batch XML decoding benchmark")
+    p.add_option("--files", dest="files", type="int", default=500, help="Number of XML documents. [default = %default]")
+    p.add_option("--processes", dest="processes", type="int", default=None, help="Number of worker processes. [default = number of cpus]")
+    p.add_option("--chunk-size", dest="chunk_size", type="int", default=8, help="Number of files submitted to a worker process at a time. [default = %default]")
+    p.add_option("--repeat", dest="repeat", type="int", default=3, help="Number of times each measurement is repeated. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    result = run(options.packages, options.classes, options.properties, options.depth,
+                 options.files, options.processes, options.chunk_size, options.repeat)
+    report("batch XML decoding", "files = {0}, cpus = {1}".format(options.files, multiprocessing.cpu_count()))
+    for variant in sorted(result):
+        report("{0} = {1:.1f} files/s".format(variant, result[variant]))
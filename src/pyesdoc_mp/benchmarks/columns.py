@@ -0,0 +1,146 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.columns
+   :platform: Unix, Windows
+   :synopsis: Times bulk analysis of instances of generated types held in lists versus columnar containers.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+N.B. Generated types import simplejson and generated columnar containers import numpy, both must therefore be installed.
+
+"""
+
+# Module imports.
+import random
+import shutil
+import sys
+import tempfile
+
+from pyesdoc_mp.benchmarks.instances import generate_types
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    get_best_time,
+    report
+    )
+from pyesdoc_mp.generators.generator_options import FEATURE_COLUMNAR
+
+
+
+def _get_column(generated_columns, kind):
+    """Returns name of first column of a kind (or None)."""
+    for name, column_kind, enum_type_name in generated_columns._columns:
+        if column_kind == kind:
+            return name
+
+
+def _create_instances(generated_type, generated_columns, instances, rnd):
+    """Returns a set of instances of a generated type whose int, float & str properties are randomly assigned.
+
+    """
+    result = []
+    for i in range(instances):
+        instance = generated_type()
+        for name, kind, enum_type_name in generated_columns._columns:
+            if kind == 'int':
+                setattr(instance, name, rnd.randrange(1000))
+            elif kind == 'float':
+                setattr(instance, name, rnd.random())
+            elif kind == 'str':
+                setattr(instance, name, 'value-{0}'.format(rnd.randrange(10)))
+        result.append(instance)
+
+    return result
+
+
+def _time_type(generated_type, generated_columns, instances, repeat, rnd):
+    """Returns timings of bulk analysis of instances of a generated type held in a list versus a columnar container.
+
+    """
+    objects = _create_instances(generated_type, generated_columns, instances, rnd)
+    columns = generated_columns(objects)
+    # N.B. conversions are timed for columnar containers only.
+    result = {
+        'build' : (None, get_best_time(lambda: generated_columns(objects), repeat)),
+        'to_objects' : (None, get_best_time(columns.to_objects, repeat))
+    }
+
+    name = _get_column(generated_columns, 'str')
+    if name is not None:
+        result['filter_str'] = (
+            get_best_time(lambda: [o for o in objects if getattr(o, name) == 'value-1'], repeat),
+            get_best_time(lambda: columns.filter(columns.get_mask(name, ['value-1'])), repeat))
+
+    name = _get_column(generated_columns, 'float')
+    if name is not None:
+        result['filter_float'] = (
+            get_best_time(lambda: [o for o in objects if getattr(o, name) > 0.5], repeat),
+            get_best_time(lambda: columns.filter(columns.get_array(name) > 0.5), repeat))
+
+    name = _get_column(generated_columns, 'int')
+    if name is not None:
+        result['sum_int'] = (
+            get_best_time(lambda: sum(getattr(o, name) for o in objects), repeat),
+            get_best_time(lambda: columns.get_array(name).sum(), repeat))
+
+    return result
+
+
+def run(packages=4, classes=25, properties=8, depth=3, instances=10000, repeat=3, seed=1):
+    """Times bulk analysis of instances of generated types held in lists versus columnar containers.
+
+    :param packages: Number of packages.
+    :param classes: Number of classes per package.
+    :param properties: Number of properties per class.
+    :param depth: Depth of class inheritance chains.
+    :param instances: Number of instances per generated type.
+    :param repeat: Number of times each measurement is repeated (the best time is reported).
+    :param seed: Seed of random number generator from which property values are drawn.
+    :type packages: int
+    :type classes: int
+    :type properties: int
+    :type depth: int
+    :type instances: int
+    :type repeat: int
+    :type seed: int
+    :returns: Total (list, columns) timings keyed by operation (list timings of conversions are None).
+    :rtype: dict
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    sys.path.insert(0, output_dir)
+    try:
+        schema = create_schema(packages, classes, properties, depth)
+        schema['name'] = 'syntheticcolumns'
+        rnd = random.Random(seed)
+        result = {}
+        for generated_type in generate_types(schema, output_dir, [FEATURE_COLUMNAR]):
+            generated_columns = getattr(sys.modules[generated_type.__module__], generated_type.__name__ + 'Columns')
+            for operation, timings in _time_type(generated_type, generated_columns, instances, repeat, rnd).items():
+                totals = result.get(operation, (None if timings[0] is None else 0.0, 0.0))
+                result[operation] = (None if timings[0] is None else totals[0] + timings[0], totals[1] + timings[1])
+
+        return result
+    finally:
+        sys.path.remove(output_dir)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC generated columnar container benchmark")
+    p.add_option("--instances", dest="instances", type="int", default=10000, help="Number of instances per type. [default = %default]")
+    p.add_option("--repeat", dest="repeat", type="int", default=3, help="Number of times each measurement is repeated. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    results = run(options.packages, options.classes, options.properties, options.depth, options.instances, options.repeat)
+    report("generated columnar containers (seconds per {0} instances per type)".format(options.instances))
+    for operation in sorted(results):
+        list_timing, columns_timing = results[operation]
+        report(operation, "list = {0}, columns = {1:.4f}s".format(
+            'n/a' if list_timing is None else '{0:.4f}s'.format(list_timing), columns_timing))
@@ -0,0 +1,111 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.construction
+   :platform: Unix, Windows
+   :synopsis: Times construction of instances of generated types with eager & lazy default values.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+N.B. Generated types import simplejson which must therefore be installed.
+
+"""
+
+# Module imports.
+import shutil
+import sys
+import tempfile
+
+from pyesdoc_mp.benchmarks.instances import generate_types
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    get_best_time,
+    report
+    )
+from pyesdoc_mp.generators.generator_options import FEATURE_LAZY_DEFAULTS
+
+
+
+# Benchmarked variants: (name, optional generation features).
+VARIANTS = (
+    ('eager', []),
+    ('lazy', [FEATURE_LAZY_DEFAULTS]),
+)
+
+
+def _get_type_key(generated_type):
+    """Returns package qualified name of a generated type."""
+    return '{0}.{1}'.format(generated_type.__module__.split('.')[-2], generated_type.__name__)
+
+
+def run_variant(schema, features, instances, repeat):
+    """Times construction & dictionary decoding of instances of each type generated with a set of optional features.
+
+    :param schema: Synthetic ontology schema.
+    :param features: Set of optional generation features.
+    :param instances: Number of instances created per generated type.
+    :param repeat: Number of times each measurement is repeated (the best time is reported).
+    :type schema: dict
+    :type features: list
+    :type instances: int
+    :type repeat: int
+    :returns: Construction & decoding times keyed by package qualified type name.
+    :rtype: dict
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    sys.path.insert(0, output_dir)
+    try:
+        result = {}
+        for generated_type in generate_types(schema, output_dir, features):
+            dicts = [generated_type().as_dict()] * instances
+            result[_get_type_key(generated_type)] = {
+                'construct' : get_best_time(lambda: [generated_type() for i in range(instances)], repeat),
+                'from_dict' : get_best_time(lambda: generated_type.from_dict_list(dicts), repeat)
+            }
+
+        return result
+    finally:
+        sys.path.remove(output_dir)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def run(packages=4, classes=25, properties=8, depth=3, instances=1000, repeat=3):
+    """Times construction of instances of generated types with eager & lazy default values.
+
+    :returns: Benchmark results keyed by variant.
+    :rtype: dict
+
+    """
+    result = {}
+    for variant, features in VARIANTS:
+        # N.B. ontology name differs per variant so that generated modules do not clash.
+        schema = create_schema(packages, classes, properties, depth)
+        schema['name'] = 'synthetic' + variant
+        result[variant] = run_variant(schema, features, instances, repeat)
+
+    return result
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC generated type construction benchmark")
+    p.add_option("--instances", dest="instances", type="int", default=1000, help="Number of instances per type. [default = %default]")
+    p.add_option("--repeat", dest="repeat", type="int", default=3, help="Number of times each measurement is repeated. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    results = run(options.packages, options.classes, options.properties, options.depth, options.instances, options.repeat)
+    report("generated type construction (seconds per {0} instances)".format(options.instances))
+    variants = [v[0] for v in VARIANTS]
+    for type_key in sorted(results[variants[0]]):
+        for timing in ('construct', 'from_dict'):
+            report(type_key, timing, ', '.join(
+                '{0} = {1:.4f}s'.format(v, results[v][type_key][timing]) for v in variants))
+    for timing in ('construct', 'from_dict'):
+        report("total", timing, ', '.join(
+            '{0} = {1:.4f}s'.format(v, sum(r[timing] for r in results[v].values())) for v in variants))
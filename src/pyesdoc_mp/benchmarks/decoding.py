@@ -0,0 +1,272 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.decoding
+   :platform: Unix, Windows
+   :synopsis: Times decoding of instances of generated types from dictionary, JSON & XML representations.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+N.B. Generated types import simplejson which must therefore be installed.  Generated XML decoders
+import lxml, if unavailable XML decoding is not timed.
+
+"""
+
+# Module imports.
+import datetime
+import importlib
+import json
+import shutil
+import sys
+import tempfile
+import uuid
+from xml.etree import ElementTree
+
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    get_best_time,
+    report
+    )
+from pyesdoc_mp.generators.generator_options import GeneratorOptions
+from pyesdoc_mp.generators.python.decoding_generator import get_class_decoder_function_name
+from pyesdoc_mp.generators.python.utils import (
+    get_class_import_name,
+    get_class_name,
+    get_ontology_name,
+    get_ontology_version,
+    get_package_module_name,
+    get_package_name
+    )
+from pyesdoc_mp.utils.factory import (
+    create_generators,
+    create_ontology
+    )
+from pyesdoc_mp.utils.generation import create_standard_template_params
+
+
+
+# Language whose generated types are decoded.
+_LANGUAGE = 'python'
+
+# Generators emitting the types & decoders.
+_GENERATORS = ('root', 'types', 'decoding')
+
+# Namespace of synthetic XML documents.
+_NAMESPACE = 'http://es-doc.org/synthetic'
+
+# XML namespace mappings passed to generated decoders.
+_NSMAP = {'cim' : _NAMESPACE}
+
+# Synthetic simple type values.
+_SIMPLE_VALUES = {
+    'bool' : True,
+    'date' : datetime.date(2013, 2, 7),
+    'datetime' : datetime.datetime(2013, 2, 7, 12, 30, 15, 500),
+    'float' : 1.5,
+    'int' : 42,
+    'str' : 'synthetic',
+    'uri' : 'http://es-doc.org',
+    'uuid' : uuid.UUID('0b3c3d1c-2d4e-4bd4-a5a4-2a3b0c1d2e3f'),
+}
+
+
+def generate_decoders(schema, output_dir):
+    """Generates types & decoders of a schema.
+
+    N.B. The output directory must be on the python path in order for the generated types & decoders to be imported.
+
+    :param schema: Ontology schema.
+    :param output_dir: Directory into which code is generated.
+    :type schema: dict
+    :type output_dir: str
+    :returns: The ontology.
+    :rtype: pyesdoc_mp.ontology.ontology.Ontology
+
+    """
+    ontology = create_ontology(schema)
+    template_params = create_standard_template_params(ontology)
+    generators = create_generators(_LANGUAGE)
+    for generator_key in _GENERATORS:
+        options = GeneratorOptions(generator_key, _LANGUAGE, output_dir, template_params)
+        generators[generator_key]().execute(ontology, options)
+
+    # N.B. generated types are imported via the py prefixed ontology name whilst decoders import types via the ontology name.
+    root = get_ontology_name(ontology)
+    shutil.copytree('{0}/{1}'.format(output_dir, root), '{0}/py{1}'.format(output_dir, root))
+
+    return ontology
+
+
+def _get_type(ontology, cls):
+    """Returns generated type of an ontology class.
+
+    """
+    module = importlib.import_module('py{0}.v{1}.types.{2}.{3}'.format(
+        get_ontology_name(ontology), get_ontology_version(ontology), get_package_name(cls.package), get_class_import_name(cls)))
+
+    return getattr(module, get_class_name(cls))
+
+
+def _get_decoder(ontology, cls):
+    """Returns generated XML decoder of an ontology class (or None if decoders cannot be imported).
+
+    """
+    try:
+        module = importlib.import_module('{0}.v{1}.serialization.{2}'.format(
+            get_ontology_name(ontology), get_ontology_version(ontology), get_package_module_name(cls.package, 'decoder')))
+    except ImportError:
+        return None
+
+    return getattr(module, get_class_decoder_function_name(cls))
+
+
+def _create_instance(ontology, cls):
+    """Returns a fully populated instance of the generated type of an ontology class.
+
+    """
+    instance = _get_type(ontology, cls)()
+    for prp in [cls.get_property(p.name) for p in cls.all_properties]:
+        if prp.type.is_simple:
+            value = _SIMPLE_VALUES[prp.type.name]
+        elif prp.type.is_enum:
+            value = ontology.get_type(prp.type.name).members[0].name
+        else:
+            value = _create_instance(ontology, ontology.get_type(prp.type.name))
+        setattr(instance, prp.name, [value, value] if prp.is_iterative else value)
+
+    return instance
+
+
+def _get_xml_text(value):
+    """Returns XML text representation of a simple value."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    elif isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+
+    return str(value)
+
+
+def _encode_xml(ontology, cls, instance, element):
+    """Encodes an instance as XML in accordance with the (synthetic) decodings of its ontology class.
+
+    """
+    for prp in [cls.get_property(p.name) for p in cls.all_properties]:
+        value = getattr(instance, prp.name)
+        for dc in cls.get_property_decodings(prp):
+            axis, tag = dc.decoding.split('::cim:')
+            values = value if prp.is_iterative else [value]
+            for item in values:
+                if axis == 'self':
+                    _encode_xml(ontology, ontology.get_type(prp.type.name), item, element)
+                else:
+                    child = ElementTree.SubElement(element, '{{{0}}}{1}'.format(_NAMESPACE, tag))
+                    if prp.type.is_class:
+                        _encode_xml(ontology, ontology.get_type(prp.type.name), item, child)
+                    else:
+                        child.text = _get_xml_text(item)
+
+
+def create_xml_document(ontology, cls):
+    """Returns a synthetic XML document of a fully populated instance of the generated type of an ontology (entity) class.
+
+    :param ontology: Ontology whose types & decoders have been generated (see generate_decoders).
+    :param cls: Ontology entity class.
+    :type ontology: pyesdoc_mp.ontology.ontology.Ontology
+    :type cls: pyesdoc_mp.ontology.class_.Class
+    :returns: XML document.
+    :rtype: str
+
+    """
+    # N.B. documents declare the cim prefix (upon which decodings depend) as do CIM documents.
+    ElementTree.register_namespace('cim', _NAMESPACE)
+    element = ElementTree.Element('{{{0}}}{1}'.format(_NAMESPACE, cls.name.replace('_', '')))
+    _encode_xml(ontology, cls, _create_instance(ontology, cls), element)
+
+    return ElementTree.tostring(element)
+
+
+def _get_json_value(value):
+    """Returns JSON representation of a simple value."""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+
+    return str(value)
+
+
+def run(packages=4, classes=25, properties=8, depth=3, instances=100, repeat=3):
+    """Times decoding of instances of generated (document) types from their dictionary, JSON & XML representations.
+
+    :param packages: Number of packages.
+    :param classes: Number of classes per package.
+    :param properties: Number of properties per class.
+    :param depth: Depth of class inheritance chains.
+    :param instances: Number of instances decoded per document type.
+    :param repeat: Number of times each measurement is repeated (the best time is reported).
+    :type packages: int
+    :type classes: int
+    :type properties: int
+    :type depth: int
+    :type instances: int
+    :type repeat: int
+    :returns: Benchmark result (XML timings are None if generated decoders cannot be imported).
+    :rtype: dict
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    sys.path.insert(0, output_dir)
+    try:
+        ontology = generate_decoders(create_schema(packages, classes, properties, depth), output_dir)
+        timings = {
+            'from_dict' : 0.0,
+            'from_dict_list' : 0.0,
+            'read_json' : 0.0,
+            'xml' : 0.0
+        }
+        for cls in ontology.entities:
+            instance = _create_instance(ontology, cls)
+            dicts = [instance.as_dict()] * instances
+            documents = [json.dumps(d, default=_get_json_value) for d in dicts]
+            generated_type = type(instance)
+
+            timings['from_dict'] += get_best_time(lambda: [generated_type.from_dict(d) for d in dicts], repeat)
+            timings['from_dict_list'] += get_best_time(lambda: generated_type.from_dict_list(dicts), repeat)
+            timings['read_json'] += get_best_time(lambda: [generated_type.read_json(d) for d in documents], repeat)
+
+            decoder = _get_decoder(ontology, cls)
+            if decoder is None or timings['xml'] is None:
+                timings['xml'] = None
+                continue
+            from lxml import etree
+            documents = [create_xml_document(ontology, cls)] * instances
+            timings['xml'] += get_best_time(lambda: [decoder(etree.fromstring(d), _NSMAP) for d in documents], repeat)
+
+        return {
+            'types' : len(ontology.entities),
+            'instances' : len(ontology.entities) * instances,
+            'timings' : timings
+        }
+    finally:
+        sys.path.remove(output_dir)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC generated type decoding benchmark")
+    p.add_option("--instances", dest="instances", type="int", default=100, help="Number of instances per document type. [default = %default]")
+    p.add_option("--repeat", dest="repeat", type="int", default=3, help="Number of times each measurement is repeated. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    result = run(options.packages, options.classes, options.properties, options.depth, options.instances, options.repeat)
+    report("generated type decoding", "types = {0}, instances = {1}".format(result['types'], result['instances']))
+    for timing in sorted(result['timings']):
+        if result['timings'][timing] is None:
+            report("{0} = n/a (generated decoders cannot be imported)".format(timing))
+        else:
+            report("{0} = {1:.4f}s".format(timing, result['timings'][timing]))
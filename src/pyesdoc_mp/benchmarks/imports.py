@@ -0,0 +1,170 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.imports
+   :platform: Unix, Windows
+   :synopsis: Times cold imports of generated package roots across package layouts (eager, lazy & bundled).
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+N.B. Each import is timed within a fresh interpreter, both from a directory and from a zip archive
+(from which compiled modules are not cached).  Lazy package initialisers require python 3.7
+or later (prior to which names are imported eagerly).  Generated types import simplejson which must
+therefore be installed.
+
+"""
+
+# Module imports.
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    report
+    )
+from pyesdoc_mp.generators.generator_options import (
+    FEATURE_BUNDLE_ONTOLOGY,
+    FEATURE_BUNDLE_PACKAGES,
+    FEATURE_LAZY_IMPORTS,
+    GeneratorOptions
+    )
+from pyesdoc_mp.generators.python.utils import (
+    get_ontology_name,
+    get_ontology_version
+    )
+from pyesdoc_mp.utils.factory import (
+    create_generators,
+    create_ontology
+    )
+from pyesdoc_mp.utils.generation import create_standard_template_params
+
+
+
+# Benchmarked variants: (name, optional generation features).
+VARIANTS = (
+    ('eager', []),
+    ('lazy', [FEATURE_LAZY_IMPORTS]),
+    ('bundle-packages', [FEATURE_BUNDLE_PACKAGES]),
+    ('bundle-ontology', [FEATURE_BUNDLE_ONTOLOGY]),
+)
+
+# Language whose generated packages are imported.
+_LANGUAGE = 'python'
+
+# Generators emitting the packages.
+_GENERATORS = ('root', 'types', 'validation')
+
+# Generated package roots that are imported.
+_ROOTS = ('types', 'validation')
+
+# Locations from which generated packages are imported.
+_LOCATIONS = ('dir', 'zip')
+
+# Script timing an import within a fresh interpreter (prints elapsed time & number of loaded modules).
+_SCRIPT = '''
+import sys, timeit
+modules = len(sys.modules)
+started = timeit.default_timer()
+import {0}
+print(timeit.default_timer() - started)
+print(len(sys.modules) - modules)
+'''
+
+
+def _generate(schema, output_dir, features):
+    """Generates packages of a schema and returns the names of the package roots.
+
+    """
+    ontology = create_ontology(schema)
+    template_params = create_standard_template_params(ontology)
+    generators = create_generators(_LANGUAGE)
+    for generator_key in _GENERATORS:
+        options = GeneratorOptions(generator_key, _LANGUAGE, output_dir, template_params, features=features)
+        generators[generator_key]().execute(ontology, options)
+
+    # N.B. generated code imports packages via the py prefixed ontology name.
+    root = get_ontology_name(ontology)
+    shutil.move('{0}/{1}'.format(output_dir, root), '{0}/py{1}'.format(output_dir, root))
+
+    return ['py{0}.v{1}.{2}'.format(root, get_ontology_version(ontology), r) for r in _ROOTS]
+
+
+def _time_import(module, path, repeat):
+    """Returns best cold import time of a module together with the number of modules loaded.
+
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([path] + [p for p in sys.path if p])
+    timings = []
+    for i in range(max(1, repeat)):
+        output = subprocess.check_output([sys.executable, '-c', _SCRIPT.format(module)], env=env)
+        elapsed, modules = output.decode().split()
+        timings.append(float(elapsed))
+
+    return {
+        'best' : min(timings),
+        'modules' : int(modules)
+    }
+
+
+def run_variant(schema, features, repeat):
+    """Times cold imports of package roots generated with a set of optional features.
+
+    :param schema: Synthetic ontology schema.
+    :param features: Set of optional generation features.
+    :param repeat: Number of times each import is timed (the best time is reported).
+    :type schema: dict
+    :type features: list
+    :type repeat: int
+    :returns: Import timings keyed by package root & location.
+    :rtype: dict
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    try:
+        modules = _generate(schema, output_dir, features)
+        paths = {
+            'dir' : output_dir,
+            'zip' : shutil.make_archive(os.path.join(output_dir, 'generated'), 'zip', output_dir)
+        }
+
+        return dict(((module.split('.')[-1], location), _time_import(module, paths[location], repeat))
+                    for module in modules for location in _LOCATIONS)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def run(packages=4, classes=25, properties=8, depth=3, repeat=5):
+    """Times cold imports of generated package roots across package layouts (eager, lazy & bundled).
+
+    :returns: Benchmark results keyed by variant.
+    :rtype: dict
+
+    """
+    schema = create_schema(packages, classes, properties, depth)
+
+    return dict((variant, run_variant(schema, features, repeat)) for variant, features in VARIANTS)
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC generated package import benchmark")
+    p.add_option("--repeat", dest="repeat", type="int", default=5, help="Number of times each import is timed. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    results = run(options.packages, options.classes, options.properties, options.depth, options.repeat)
+    report("generated package cold import")
+    for variant, features in VARIANTS:
+        for root in _ROOTS:
+            for location in _LOCATIONS:
+                result = results[variant][(root, location)]
+                report(variant, location, "{0} = {1:.4f}s ({2} modules)".format(
+                    root, result['best'], result['modules']))
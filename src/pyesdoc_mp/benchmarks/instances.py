@@ -0,0 +1,158 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.instances
+   :platform: Unix, Windows
+   :synopsis: Measures the memory footprint of instances of generated types with and without optional features.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+N.B. Generated types import simplejson which must therefore be installed.
+
+"""
+
+# Module imports.
+import importlib
+import shutil
+import sys
+import tempfile
+
+from pyesdoc_mp.benchmarks.memory import get_deep_size
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    report,
+    report_values
+    )
+from pyesdoc_mp.generators.generator_options import (
+    FEATURE_SLOTS,
+    GeneratorOptions
+    )
+from pyesdoc_mp.generators.python.utils import (
+    get_class_import_name,
+    get_class_name,
+    get_ontology_name,
+    get_ontology_version,
+    get_package_name
+    )
+from pyesdoc_mp.utils.factory import (
+    create_generators,
+    create_ontology
+    )
+from pyesdoc_mp.utils.generation import create_standard_template_params
+
+
+
+# Language whose generated types are measured.
+_LANGUAGE = 'python'
+
+# Generators emitting the types.
+_GENERATORS = ('root', 'types')
+
+
+def generate_types(schema, output_dir, features):
+    """Generates types of a schema and returns the generated (concrete) classes.
+
+    N.B. The output directory must be on the python path in order for the generated classes to be imported.
+
+    :param schema: Synthetic ontology schema.
+    :param output_dir: Directory to which types are generated.
+    :param features: Set of optional generation features.
+    :type schema: dict
+    :type output_dir: str
+    :type features: list
+    :returns: Generated (concrete) classes.
+    :rtype: list
+
+    """
+    ontology = create_ontology(schema)
+    template_params = create_standard_template_params(ontology)
+    generators = create_generators(_LANGUAGE)
+    for generator_key in _GENERATORS:
+        options = GeneratorOptions(generator_key, _LANGUAGE, output_dir, template_params, features=features)
+        generators[generator_key]().execute(ontology, options)
+
+    # N.B. generated code imports the types via the py prefixed ontology name.
+    root = get_ontology_name(ontology)
+    shutil.move('{0}/{1}'.format(output_dir, root), '{0}/py{1}'.format(output_dir, root))
+
+    result = []
+    for cls in [c for c in ontology.classes if not c.is_abstract]:
+        module = importlib.import_module('py{0}.v{1}.types.{2}.{3}'.format(
+            root, get_ontology_version(ontology), get_package_name(cls.package), get_class_import_name(cls)))
+        result.append(getattr(module, get_class_name(cls)))
+
+    return result
+
+
+def _get_shallow_size(obj):
+    """Returns size in bytes of an instance including its attribute dictionary (if any)."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def run_variant(schema, features, instances):
+    """Measures memory footprint of instances of types generated with a set of optional features.
+
+    :param schema: Synthetic ontology schema.
+    :param features: Set of optional generation features.
+    :param instances: Number of instances created per generated type.
+    :type schema: dict
+    :type features: list
+    :type instances: int
+    :returns: Benchmark result.
+    :rtype: dict
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    sys.path.insert(0, output_dir)
+    try:
+        types = generate_types(schema, output_dir, features)
+        objects = [t() for t in types for i in range(instances)]
+        count = max(1, len(objects))
+
+        return {
+            'features' : sorted(features),
+            'types' : len(types),
+            'instances' : len(objects),
+            'bytes_per_instance_shallow' : float(sum(_get_shallow_size(o) for o in objects)) / count,
+            'bytes_per_instance_deep' : float(get_deep_size(objects) - sys.getsizeof(objects)) / count
+        }
+    finally:
+        sys.path.remove(output_dir)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def run(packages=4, classes=25, properties=8, depth=3, instances=1000):
+    """Measures memory footprint of instances of generated types with and without __slots__.
+
+    :returns: Benchmark results keyed by variant.
+    :rtype: dict
+
+    """
+    result = {}
+    for variant, features in (('dict', []), ('slots', [FEATURE_SLOTS])):
+        # N.B. ontology name differs per variant so that generated modules do not clash.
+        schema = create_schema(packages, classes, properties, depth)
+        schema['name'] = 'synthetic' + variant
+        result[variant] = run_variant(schema, features, instances)
+
+    return result
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC generated type instance memory benchmark")
+    p.add_option("--instances", dest="instances", type="int", default=1000, help="Number of instances per type. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    results = run(options.packages, options.classes, options.properties, options.depth, options.instances)
+    report("generated type instance memory")
+    for variant in sorted(results):
+        report_values(results[variant], variant)
@@ -0,0 +1,186 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.interning
+   :platform: Unix, Windows
+   :synopsis: Measures the memory footprint of a decoded multi-document corpus with and without an intern pool.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+N.B. Generated types import simplejson which must therefore be installed.
+
+"""
+
+# Module imports.
+import datetime
+import json
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+import uuid
+
+from pyesdoc_mp.benchmarks.instances import generate_types
+from pyesdoc_mp.benchmarks.memory import get_deep_size
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    report,
+    report_values
+    )
+
+
+
+# Factories of synthetic simple values keyed by simple type (a value is derived from an index into a vocabulary).
+_SIMPLE_VALUE_FACTORIES = {
+    'bool' : lambda i: i % 2 == 0,
+    'date' : lambda i: datetime.date(2013, 2, 1 + i % 28),
+    'datetime' : lambda i: datetime.datetime(2013, 2, 1 + i % 28, 12, 30),
+    'float' : lambda i: i + 0.5,
+    'int' : lambda i: i,
+    'str' : lambda i: 'value-{0}'.format(i),
+    'uri' : lambda i: 'http://es-doc.org/{0}'.format(i),
+    'uuid' : lambda i: uuid.UUID(int=i),
+}
+
+
+def _create_value(value_type, rnd, variety):
+    """Returns a synthetic simple or enum value drawn from a vocabulary.
+
+    """
+    if '.' in value_type:
+        module, name = value_type.rsplit('.', 1)
+        members = getattr(sys.modules[module], name).members
+
+        return rnd.choice(members) if members else ''
+
+    return _SIMPLE_VALUE_FACTORIES[value_type](rnd.randrange(variety))
+
+
+def _get_nested_dict(generated_type, rnd, variety, vocabulary):
+    """Returns a synthetic dictionary representation of a nested instance drawn from a vocabulary.
+
+    N.B. Each type has a vocabulary of a few distinct nested instances, hence nested instances recur
+    across documents as they do within CIM corpora (e.g. citations, responsible parties, units).
+
+    """
+    key = (generated_type, rnd.randrange(variety))
+    if key not in vocabulary:
+        vocabulary[key] = _create_dict(generated_type, rnd, variety, vocabulary)
+
+    return vocabulary[key]
+
+
+def _create_dict(generated_type, rnd, variety, vocabulary):
+    """Returns a synthetic (deep) dictionary representation of an instance of a generated type.
+
+    """
+    result = {}
+    for name, is_iterative, value_type, type_name in generated_type._from_dict_fields:
+        if type_name is not None:
+            module, type_name = type_name.rsplit('.', 1)
+            create = lambda: _get_nested_dict(getattr(sys.modules[module], type_name), rnd, variety, vocabulary)
+        else:
+            create = lambda: _create_value(value_type, rnd, variety)
+        result[name] = [create(), create()] if is_iterative else create()
+
+    return result
+
+
+def _create_corpus(types, documents, variety, seed):
+    """Returns a synthetic multi-document corpus, i.e. a set of (type, JSON representation) pairs.
+
+    """
+    rnd = random.Random(seed)
+    vocabulary = {}
+    result = []
+    for generated_type in [t for t in types if 'cim_info' in [f[0] for f in t._from_dict_fields]]:
+        for i in range(documents):
+            d = _create_dict(generated_type, rnd, variety, vocabulary)
+            # ... document information is unique per document.
+            d['cim_info'] = dict(d['cim_info'], id=uuid.uuid4(), create_date=datetime.datetime.now())
+            result.append((generated_type, json.dumps(d, default=str)))
+
+    return result
+
+
+def _decode(corpus, pool):
+    """Returns a corpus of documents decoded from their JSON representations.
+
+    """
+    return [generated_type.read_json(document, pool) for generated_type, document in corpus]
+
+
+def run(packages=4, classes=25, properties=8, depth=3, documents=20, variety=3, seed=1):
+    """Measures memory footprint of a decoded multi-document corpus with and without an intern pool.
+
+    :param packages: Number of packages.
+    :param classes: Number of classes per package.
+    :param properties: Number of properties per class.
+    :param depth: Depth of class inheritance chains.
+    :param documents: Number of documents per document type.
+    :param variety: Number of distinct values per simple type & of distinct nested instances per type.
+    :param seed: Seed of random number generator from which corpus is synthesised.
+    :type packages: int
+    :type classes: int
+    :type properties: int
+    :type depth: int
+    :type documents: int
+    :type variety: int
+    :type seed: int
+    :returns: Benchmark result.
+    :rtype: dict
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    sys.path.insert(0, output_dir)
+    try:
+        schema = create_schema(packages, classes, properties, depth)
+        schema['name'] = 'syntheticinterning'
+        types = generate_types(schema, output_dir, [])
+        representations = sys.modules['pysyntheticinterning.v1_0.types.representations']
+        corpus = _create_corpus(types, documents, variety, seed)
+
+        started = timeit.default_timer()
+        decoded = _decode(corpus, None)
+        elapsed = timeit.default_timer() - started
+        size = get_deep_size(decoded)
+
+        pool = representations.InternPool()
+        started = timeit.default_timer()
+        interned = _decode(corpus, pool)
+        elapsed_interned = timeit.default_timer() - started
+        size_interned = get_deep_size(interned)
+
+        assert all(a.is_equivalent(b) for a, b in zip(decoded, interned))
+
+        return {
+            'documents' : len(corpus),
+            'bytes' : size,
+            'bytes_interned' : size_interned,
+            'reduction' : 1.0 - float(size_interned) / max(1, size),
+            'seconds' : elapsed,
+            'seconds_interned' : elapsed_interned,
+            'pooled_instances' : len(pool),
+            'pool_hits' : pool.hits
+        }
+    finally:
+        sys.path.remove(output_dir)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC generated type interning benchmark")
+    p.add_option("--documents", dest="documents", type="int", default=20, help="Number of documents per document type. [default = %default]")
+    p.add_option("--variety", dest="variety", type="int", default=3, help="Number of distinct values (or nested instances) per type. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    result = run(options.packages, options.classes, options.properties, options.depth, options.documents, options.variety)
+    report("decoded corpus interning")
+    report_values(result)
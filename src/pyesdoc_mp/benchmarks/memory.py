@@ -0,0 +1,113 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.memory
+   :platform: Unix, Windows
+   :synopsis: Measures the memory footprint of ontologies built from synthetic schemas.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import sys
+
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_option_parser,
+    create_schema,
+    report,
+    report_values
+    )
+from pyesdoc_mp.utils.factory import create_ontology
+
+
+
+def _get_slots(obj):
+    """Returns set of slot names declared across the type hierarchy of an object.
+
+    :param obj: Object being inspected.
+    :type obj: object
+
+    """
+    result = []
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots, )
+        for slot in slots:
+            # ... apply private name mangling.
+            if slot.startswith('__') and not slot.endswith('__'):
+                slot = '_{0}{1}'.format(cls.__name__.lstrip('_'), slot)
+            result.append(slot)
+    return result
+
+
+def get_deep_size(root):
+    """Returns total size in bytes of an object graph, each object being counted once.
+
+    :param root: Root of object graph.
+    :type root: object
+    :returns: Size of object graph in bytes.
+    :rtype: int
+
+    """
+    seen = set()
+    size = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or obj is None or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            if hasattr(obj, '__dict__'):
+                stack.append(obj.__dict__)
+            for slot in _get_slots(obj):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+
+    return size
+
+
+def run(packages=10, classes=250, properties=20, depth=4, enums=10, enum_members=8):
+    """Measures memory footprint of an ontology built from a synthetic schema.
+
+    N.B. The defaults synthesise an ontology of 50,000 properties.
+
+    :returns: Benchmark result.
+    :rtype: dict
+
+    """
+    schema = create_schema(packages, classes, properties, depth, enums, enum_members)
+    ontology = create_ontology(schema)
+    size = get_deep_size(ontology)
+
+    return {
+        'packages' : len(ontology.packages),
+        'classes' : len(ontology.classes),
+        'enums' : len(ontology.enums),
+        'properties' : len(ontology.properties),
+        'bytes' : size,
+        'bytes_per_property' : float(size) / max(1, len(ontology.properties)),
+    }
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = create_option_parser("ES-DOC ontology memory benchmark", 10, 250, 20, 4)
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    result = run(options.packages, options.classes, options.properties, options.depth)
+    report("ontology memory")
+    report_values(result)
@@ -0,0 +1,258 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.synthetic
+   :platform: Unix, Windows
+   :synopsis: Synthesises CIM shaped ontology schemas of configurable size (plus command line & reporting utilities shared by benchmarks).
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import optparse
+import string
+import timeit
+
+
+
+# Set of simple types assigned to synthetic properties.
+_SIMPLE_TYPES = ['str', 'int', 'float', 'bool', 'datetime', 'uuid', 'uri', 'date']
+
+# Set of cardinalities assigned to synthetic properties.
+_CARDINALITIES = ['0.1', '1.1', '0.N', '1.N']
+
+# Name of package hosting the shared document information class.
+_SHARED_PACKAGE = 'shared'
+
+
+def _get_alpha(index):
+    """Converts an index to a lower case alphabetic suffix (a, b, ..., z, ba, bb, ...).
+
+    :param index: Index being converted.
+    :type index: int
+
+    """
+    result = ''
+    while True:
+        result = string.ascii_lowercase[index % 26] + result
+        index //= 26
+        if index == 0:
+            return result
+
+
+def _get_package_name(index):
+    """Returns name of a synthetic package."""
+    return _SHARED_PACKAGE if index == 0 else 'package' + _get_alpha(index)
+
+
+def _get_class_name(index):
+    """Returns name of a synthetic class."""
+    return 'class_{0}'.format(index)
+
+
+def _get_enum_name(index):
+    """Returns name of a synthetic enum."""
+    return 'enum_' + _get_alpha(index)
+
+
+def _get_property_name(index):
+    """Returns name of a synthetic property."""
+    return 'property_' + _get_alpha(index)
+
+
+def _create_cim_info():
+    """Returns declaration of the shared document information class."""
+    return {
+        'type' : 'class',
+        'name' : 'cim_info',
+        'base' : None,
+        'abstract' : False,
+        'doc' : 'Encapsulates common document information.',
+        'properties' : [
+            ('create_date', 'datetime', '1.1', None),
+            ('id', 'uuid', '1.1', None),
+            ('project', 'str', '1.1', None),
+            ('version', 'str', '1.1', None),
+        ],
+        'decodings' : [
+            ('create_date', 'child::cim:documentCreationDate'),
+            ('id', 'child::cim:documentID'),
+            ('project', 'child::cim:project'),
+            ('version', 'child::cim:documentVersion'),
+        ]
+    }
+
+
+def _create_class(pkg_index, cls_index, packages, classes, properties, depth, enums):
+    """Returns declaration of a synthetic class.
+
+    Classes within a package form inheritance chains of length depth, the last class of each
+    chain being a concrete document (entity) class.  Property names are unique across a chain.
+    Classes reference classes of the preceding package only, hence generated packages import acyclically.
+
+    """
+    chain_index = cls_index % depth
+    is_entity = chain_index == depth - 1
+    name = _get_class_name(cls_index)
+
+    # Base class.
+    base = None
+    if chain_index > 0:
+        base = '{0}.{1}'.format(_get_package_name(pkg_index), _get_class_name(cls_index - 1))
+
+    # Properties: cycle through simple, enum & class types.
+    prp_cfgs = []
+    dc_cfgs = []
+    for prp_index in range(properties):
+        prp_name = _get_property_name(chain_index * properties + prp_index)
+        selector = (cls_index + prp_index) % 4
+        if selector == 2 and enums > 0:
+            prp_type = '{0}.{1}'.format(_get_package_name(pkg_index), _get_enum_name(prp_index % enums))
+        elif selector == 3 and classes > depth and pkg_index > 0:
+            ref_pkg_index = pkg_index - 1
+            ref_cls_index = (cls_index + depth) % classes
+            prp_type = '{0}.{1}'.format(_get_package_name(ref_pkg_index), _get_class_name(ref_cls_index))
+        else:
+            prp_type = _SIMPLE_TYPES[(cls_index + prp_index) % len(_SIMPLE_TYPES)]
+        prp_cardinality = _CARDINALITIES[prp_index % len(_CARDINALITIES)]
+        prp_cfgs.append((prp_name, prp_type, prp_cardinality, 'Synthetic property.'))
+        dc_cfgs.append((prp_name, 'child::cim:{0}'.format(prp_name.replace('_', ''))))
+
+    # Document information.
+    if is_entity:
+        prp_cfgs.append(('cim_info', '{0}.cim_info'.format(_SHARED_PACKAGE), '1.1', None))
+        dc_cfgs.append(('cim_info', 'self::cim:{0}'.format(name.replace('_', ''))))
+
+    return {
+        'type' : 'class',
+        'name' : name,
+        'base' : base,
+        'abstract' : not is_entity,
+        'doc' : 'Synthetic class.',
+        'properties' : prp_cfgs,
+        'decodings' : dc_cfgs,
+    }
+
+
+def _create_enum(index, members):
+    """Returns declaration of a synthetic enum."""
+    return {
+        'type' : 'enum',
+        'name' : _get_enum_name(index),
+        'is_open' : index % 2 == 1,
+        'doc' : 'Synthetic enum.',
+        'members' : [('Member' + _get_alpha(i).upper(), None) for i in range(members)],
+    }
+
+
+def create_schema(packages=4, classes=25, properties=8, depth=3, enums=4, enum_members=6):
+    """Creates a synthetic CIM shaped ontology schema declaration.
+
+    :param packages: Number of packages.
+    :param classes: Number of classes per package.
+    :param properties: Number of properties per class.
+    :param depth: Depth of class inheritance chains.
+    :param enums: Number of enums per package.
+    :param enum_members: Number of members per enum.
+    :type packages: int
+    :type classes: int
+    :type properties: int
+    :type depth: int
+    :type enums: int
+    :type enum_members: int
+    :returns: An ontology schema declaration.
+    :rtype: dict
+
+    """
+    depth = max(1, depth)
+    pkg_cfgs = []
+    for pkg_index in range(packages):
+        cls_cfgs = [_create_class(pkg_index, i, packages, classes, properties, depth, enums) for i in range(classes)]
+        if pkg_index == 0:
+            cls_cfgs.append(_create_cim_info())
+        pkg_cfgs.append({
+            'name' : _get_package_name(pkg_index),
+            'doc' : 'Synthetic package.',
+            'classes' : cls_cfgs,
+            'enums' : [_create_enum(i, enum_members) for i in range(enums)],
+        })
+
+    return {
+        'name' : 'synthetic',
+        'version' : '1.0',
+        'is_latest' : False,
+        'doc' : 'Synthetic ontology schema ({0} packages x {1} classes x {2} properties).'.format(
+            packages, classes, properties),
+        'packages' : pkg_cfgs
+    }
+
+
+def create_option_parser(prog, packages=4, classes=25, properties=8, depth=3):
+    """Returns a command line option parser declaring the synthetic schema size options.
+
+    N.B. Benchmarks add their own options to the returned parser.
+
+    :param prog: Benchmark name.
+    :param packages: Default number of packages.
+    :param classes: Default number of classes per package.
+    :param properties: Default number of properties per class.
+    :param depth: Default depth of class inheritance chains.
+    :type prog: str
+    :type packages: int
+    :type classes: int
+    :type properties: int
+    :type depth: int
+    :returns: A command line option parser.
+    :rtype: optparse.OptionParser
+
+    """
+    p = optparse.OptionParser(prog=prog)
+    p.add_option("--packages", dest="packages", type="int", default=packages, help="Number of packages. [default = %default]")
+    p.add_option("--classes", dest="classes", type="int", default=classes, help="Number of classes per package. [default = %default]")
+    p.add_option("--properties", dest="properties", type="int", default=properties, help="Number of properties per class. [default = %default]")
+    p.add_option("--depth", dest="depth", type="int", default=depth, help="Depth of inheritance chains. [default = %default]")
+
+    return p
+
+
+def get_best_time(func, repeat):
+    """Returns best wall time of a function.
+
+    :param func: Function being timed (invoked without arguments).
+    :param repeat: Number of times function is invoked.
+    :type func: function
+    :type repeat: int
+    :returns: Best time in seconds.
+    :rtype: float
+
+    """
+    timings = []
+    for i in range(max(1, repeat)):
+        started = timeit.default_timer()
+        func()
+        timings.append(timeit.default_timer() - started)
+
+    return min(timings)
+
+
+def report(*fields):
+    """Prints a benchmark report line.
+
+    :param fields: Report line fields (delimited by ' :: ').
+    :type fields: list
+
+    """
+    print("ES-DOC :: BENCHMARK :: " + ' :: '.join(str(f) for f in fields))
+
+
+def report_values(values, *fields):
+    """Prints a benchmark report line per value (in key order).
+
+    :param values: Reported values keyed by name.
+    :param fields: Report line fields preceding each key = value pair.
+    :type values: dict
+    :type fields: list
+
+    """
+    for key in sorted(values):
+        report(*(fields + ('{0} = {1}'.format(key, values[key]), )))
@@ -0,0 +1,320 @@
+"""
+.. module:: pyesdoc_mp.benchmarks.timing
+   :platform: Unix, Windows
+   :synopsis: Times ontology construction and code generation over synthetic schemas of increasing size.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import glob
+import json
+import optparse
+import os
+import platform
+import shutil
+import tempfile
+import timeit
+
+from pyesdoc_mp.benchmarks.synthetic import (
+    create_schema,
+    report
+    )
+from pyesdoc_mp.generators.generator_options import GeneratorOptions
+from pyesdoc_mp.ontology import Ontology
+from pyesdoc_mp.utils.factory import (
+    create_generators,
+    create_ontology,
+    create_packages
+    )
+from pyesdoc_mp.utils.generation import (
+    create_standard_template_params,
+    TEMPLATE_FOLDER
+    )
+from pyesdoc_mp.utils.output import (
+    FileSystemSink,
+    MemorySink
+    )
+from pyesdoc_mp.utils.template import Template
+
+
+
+# Benchmark result format identifier.
+RESULT_FORMAT = '1'
+
+# Synthetic schema scales (packages, classes per package, properties per class, inheritance depth, enums per package, enum members).
+SCALES = {
+    'small' : (2, 10, 4, 2, 2, 4),
+    'medium' : (4, 25, 8, 3, 4, 6),
+    'large' : (8, 100, 12, 4, 8, 8),
+    'xlarge' : (10, 250, 20, 4, 10, 8),
+}
+
+# Default set of scales benchmarked.
+DEFAULT_SCALES = ['small', 'medium', 'large']
+
+# Default number of times each measurement is repeated (the best time is reported).
+DEFAULT_REPEAT = 3
+
+# Default relative slowdown above which a timing is reported as a regression.
+DEFAULT_THRESHOLD = 0.1
+
+# Language whose generators are benchmarked.
+_LANGUAGE = 'python'
+
+# Number of template renders per template per measurement.
+_TEMPLATE_RENDERS = 100
+
+
+def _time(func, repeat):
+    """Returns best and mean wall time of a function.
+
+    :param func: Function being timed (invoked without arguments).
+    :param repeat: Number of times function is invoked.
+    :type func: function
+    :type repeat: int
+    :returns: Best and mean time in seconds.
+    :rtype: dict
+
+    """
+    timings = []
+    for i in range(max(1, repeat)):
+        started = timeit.default_timer()
+        func()
+        timings.append(timeit.default_timer() - started)
+
+    return {
+        'best' : min(timings),
+        'mean' : sum(timings) / len(timings)
+    }
+
+
+def _execute_generator(ontology, generator_type, generator_key, output_dir, template_params):
+    """Executes a generator emitting code to memory.
+
+    :returns: Emitted code keyed by relative path.
+    :rtype: dict
+
+    """
+    sink = MemorySink(output_dir)
+    options = GeneratorOptions(generator_key, _LANGUAGE, output_dir, template_params, sink=sink)
+    generator_type().execute(ontology, options)
+
+    return sink.files
+
+
+def _emit_files(files, output_dir, threads):
+    """Writes a set of files to the file system.
+
+    """
+    sink = FileSystemSink(output_dir, threads=threads)
+    for path in files:
+        dir, file = os.path.split(os.path.join(output_dir, path))
+        sink.write(files[path], dir, file)
+    sink.close()
+
+
+def _render_templates(templates, params):
+    """Renders a set of templates with the standard template params.
+
+    """
+    for template in templates:
+        for i in range(_TEMPLATE_RENDERS):
+            template.render(params)
+
+
+def run_scale(packages, classes, properties, depth, enums, enum_members, repeat=DEFAULT_REPEAT):
+    """Times ontology construction and code generation over a synthetic schema.
+
+    :param packages: Number of packages.
+    :param classes: Number of classes per package.
+    :param properties: Number of properties per class.
+    :param depth: Depth of class inheritance chains.
+    :param enums: Number of enums per package.
+    :param enum_members: Number of members per enum.
+    :param repeat: Number of times each measurement is repeated.
+    :type packages: int
+    :type classes: int
+    :type properties: int
+    :type depth: int
+    :type enums: int
+    :type enum_members: int
+    :type repeat: int
+    :returns: Benchmark result.
+    :rtype: dict
+
+    """
+    schema = create_schema(packages, classes, properties, depth, enums, enum_members)
+    ontology = create_ontology(schema)
+    template_params = create_standard_template_params(ontology)
+    timings = {}
+
+    # Ontology construction.
+    timings['create_ontology'] = _time(lambda: create_ontology(schema), repeat)
+    timings['create_packages'] = _time(lambda: create_packages(schema), repeat)
+    package_sets = [create_packages(schema) for i in range(max(1, repeat))]
+    timings['ontology_init'] = _time(
+        lambda: Ontology(schema['name'], schema['version'], schema['doc'], package_sets.pop()), repeat)
+
+    output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-benchmark-')
+    try:
+        # Generators (code emitted to memory).
+        files = {}
+        for generator_key, generator_type in sorted(create_generators(_LANGUAGE).items()):
+            timings['generator_' + generator_key] = _time(
+                lambda: _execute_generator(ontology, generator_type, generator_key, output_dir, template_params), repeat)
+            files.update(_execute_generator(ontology, generator_type, generator_key, output_dir, template_params))
+
+        # Template rendering.
+        templates = []
+        for path in sorted(glob.glob(os.path.join(TEMPLATE_FOLDER, _LANGUAGE, '*', '*.txt'))):
+            with open(path) as f:
+                templates.append(Template(f.read()))
+        timings['template_render'] = _time(lambda: _render_templates(templates, template_params), repeat)
+
+        # File emission.
+        timings['emit_sync'] = _time(lambda: _emit_files(files, output_dir, 0), repeat)
+        timings['emit_threaded'] = _time(lambda: _emit_files(files, output_dir, 4), repeat)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return {
+        'schema' : {
+            'packages' : packages,
+            'classes' : classes,
+            'properties' : properties,
+            'depth' : depth,
+            'enums' : enums,
+            'enum_members' : enum_members
+        },
+        'ontology' : {
+            'packages' : len(ontology.packages),
+            'classes' : len(ontology.classes),
+            'enums' : len(ontology.enums),
+            'properties' : len(ontology.properties)
+        },
+        'output' : {
+            'files' : len(files),
+            'bytes' : sum(len(code) for code in files.values())
+        },
+        'timings' : timings
+    }
+
+
+def run(scales=None, repeat=DEFAULT_REPEAT):
+    """Runs benchmark suite over a set of scales.
+
+    :param scales: Names of scales to benchmark (see SCALES).
+    :param repeat: Number of times each measurement is repeated.
+    :type scales: list
+    :type repeat: int
+    :returns: Benchmark results.
+    :rtype: dict
+
+    """
+    if scales is None:
+        scales = DEFAULT_SCALES
+
+    return {
+        'format' : RESULT_FORMAT,
+        'environment' : {
+            'python' : platform.python_version(),
+            'implementation' : platform.python_implementation(),
+            'platform' : platform.platform(),
+            'repeat' : repeat
+        },
+        'scales' : dict((name, run_scale(*SCALES[name], repeat=repeat)) for name in scales)
+    }
+
+
+def compare(results, baseline):
+    """Compares benchmark results against a baseline.
+
+    :param results: Benchmark results.
+    :param baseline: Baseline benchmark results.
+    :type results: dict
+    :type baseline: dict
+    :returns: List of (scale, timing, baseline time, time, ratio) tuples, one per timing common to both.
+    :rtype: list
+
+    """
+    result = []
+    for scale in sorted(results['scales']):
+        if scale not in baseline.get('scales', {}):
+            continue
+        current = results['scales'][scale]['timings']
+        previous = baseline['scales'][scale]['timings']
+        for timing in sorted(current):
+            if timing not in previous:
+                continue
+            before = previous[timing]['best']
+            after = current[timing]['best']
+            ratio = after / before if before > 0 else 1.0
+            result.append((scale, timing, before, after, ratio))
+
+    return result
+
+
+def get_regressions(comparison, threshold=DEFAULT_THRESHOLD):
+    """Returns subset of a comparison whose slowdown exceeds a threshold.
+
+    :param comparison: Comparison as returned by compare().
+    :param threshold: Relative slowdown above which a timing is reported as a regression.
+    :type comparison: list
+    :type threshold: float
+    :returns: List of (scale, timing, baseline time, time, ratio) tuples.
+    :rtype: list
+
+    """
+    return [c for c in comparison if c[4] > 1.0 + threshold]
+
+
+def _get_options():
+    """Returns command line options.
+
+    """
+    p = optparse.OptionParser(prog="ES-DOC code generation benchmark")
+    p.add_option("--scales", dest="scales", type="string", default=','.join(DEFAULT_SCALES),
+                 help="Comma delimited scales to benchmark. [default = %default] [choices = {0}]".format(
+                     ', '.join(sorted(SCALES))))
+    p.add_option("--repeat", dest="repeat", type="int", default=DEFAULT_REPEAT,
+                 help="Number of times each measurement is repeated. [default = %default]")
+    p.add_option("--output", dest="output", type="string", default=None,
+                 help="File to which results are written as JSON (optional).")
+    p.add_option("--baseline", dest="baseline", type="string", default=None,
+                 help="JSON results file against which results are compared (optional).")
+    p.add_option("--threshold", dest="threshold", type="float", default=DEFAULT_THRESHOLD,
+                 help="Relative slowdown reported as a regression. [default = %default]")
+
+    return p.parse_args()[0]
+
+
+if __name__ == '__main__':
+    options = _get_options()
+    results = run(options.scales.split(','), options.repeat)
+
+    report("code generation")
+    for scale in sorted(results['scales'], key=lambda s: SCALES[s]):
+        result = results['scales'][scale]
+        report(scale, "classes = {0}, properties = {1}, files = {2}".format(
+            result['ontology']['classes'], result['ontology']['properties'], result['output']['files']))
+        for timing in sorted(result['timings']):
+            report(scale, "{0} = {1:.4f}s".format(timing, result['timings'][timing]['best']))
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(results, f, indent=4, sort_keys=True, separators=(',', ': '))
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        comparison = compare(results, baseline)
+        for scale, timing, before, after, ratio in comparison:
+            report(scale, timing, "{0:.4f}s -> {1:.4f}s ({2:+.1%})".format(before, after, ratio - 1.0))
+        regressions = get_regressions(comparison, options.threshold)
+        for scale, timing, before, after, ratio in regressions:
+            report("REGRESSION", scale, "{0} ({1:+.1%})".format(timing, ratio - 1.0))
+        if regressions:
+            raise SystemExit(1)
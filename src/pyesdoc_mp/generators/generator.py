@@ -12,56 +12,123 @@
 from abc import ABCMeta
 
 from pyesdoc_mp.generators.generator_context import GeneratorContext
-from pyesdoc_mp.utils.generation import write_file
 
 
 
+# Parsing event types (raised in this order).
+EVENT_ONTOLOGY = 'ontology'
+EVENT_PACKAGE = 'package'
+EVENT_CLASS = 'class'
+EVENT_ENUM = 'enum'
+
+
+def get_events(ontology):
+    """Returns full set of parsing event ranges raised over an ontology.
+
+    :param ontology: Ontology being processed.
+    :type ontology: pyesdoc_mp.ontology.Ontology
+    :returns: List of (event type, start index, end index) tuples.
+    :rtype: list
+
+    """
+    return [
+        (EVENT_ONTOLOGY, 0, 1),
+        (EVENT_PACKAGE, 0, len(ontology.packages)),
+        (EVENT_CLASS, 0, len(ontology.classes)),
+        (EVENT_ENUM, 0, len(ontology.enums))
+    ]
+
+
 class Generator(object):
     """Base class encapsulating functionality common to all code generators.
 
+    :ivar is_partitionable: Flag indicating whether parsing events are independent of each other
+                            and may therefore be raised across separate executions (e.g. in worker processes).
+
     """
     # Abstract Base Class module - see http://docs.python.org/library/abc.html
     __metaclass__ = ABCMeta
 
-    def execute(self, ontology, options):
+    # By default generators may accumulate state across events.
+    is_partitionable = False
+
+    def execute(self, ontology, options, events=None):
         """Executes the code generator.
 
         :param ontology: Ontology being processed.
         :param options: Generation options.
+        :param events: Subset of parsing event ranges to raise (defaults to all events).
         :type ontology: pyesdoc_mp.ontology.Ontology
         :type options: pyesdoc_mp.GeneratorOptions
+        :type events: list
 
         """
-        # Emits generated code to file system.
-        def emit_code(code):
+        # Invokes a parsing event handler, returning emitted code as a list.
+        def invoke_handler(handler):
+            if profiler is None:
+                code = handler(ctx)
+            else:
+                started = profiler.start()
+                code = handler(ctx)
+                profiler.record_event(ctx.generator_key, handler.__name__, started)
             if code is None:
-                return
+                return []
             if not isinstance(code, list):
-                code = [code]                
-            for code in code:
-                write_file(code[0], code[1], code[2])
+                code = [code]
+            return code
+
+        # Raises a parsing event, in incremental mode only if the parsed element's dependencies have changed.
+        def raise_event(event_type, element, handler):
+            manifest = ctx.options.manifest
+            if manifest is None:
+                written = invoke_handler(handler)
+                for code in written:
+                    sink.write(code[0], code[1], code[2])
+            else:
+                key = manifest.get_event_key(ctx.generator_key, event_type, element)
+                dependencies = manifest.get_dependencies_fingerprint(element)
+                if manifest.is_current(key, dependencies):
+                    return
+                written = manifest.emit(key, dependencies, invoke_handler(handler), sink)
+            # ... N.B. files skipped by the manifest (i.e. whose content is unchanged) are not recorded.
+            if profiler is not None:
+                profiler.record_output(ctx.generator_key, written)
 
         # Instantiate context.
         ctx = GeneratorContext(ontology, options)
+        sink = options.sink
+        profiler = options.profiler
+        if profiler is not None:
+            started = profiler.start()
 
         # Notify start.
         self.on_start(ctx)
 
         # Raise parsing events and emit code accordingly.
-        emit_code(self.on_ontology_parse(ctx))
-        for pkg in ctx.ontology.packages:
-            ctx.set_package(pkg)
-            emit_code(self.on_package_parse(ctx))
-        for cls in ctx.ontology.classes:
-            ctx.set_class(cls)
-            emit_code(self.on_class_parse(ctx))
-        for enum in ctx.ontology.enums:
-            ctx.set_enum(enum)
-            emit_code(self.on_enum_parse(ctx))
+        if events is None:
+            events = get_events(ctx.ontology)
+        for event_type, start, end in events:
+            if event_type == EVENT_ONTOLOGY:
+                raise_event(event_type, ctx.ontology, self.on_ontology_parse)
+            elif event_type == EVENT_PACKAGE:
+                for pkg in ctx.ontology.packages[start:end]:
+                    ctx.set_package(pkg)
+                    raise_event(event_type, pkg, self.on_package_parse)
+            elif event_type == EVENT_CLASS:
+                for cls in ctx.ontology.classes[start:end]:
+                    ctx.set_class(cls)
+                    raise_event(event_type, cls, self.on_class_parse)
+            elif event_type == EVENT_ENUM:
+                for enum in ctx.ontology.enums[start:end]:
+                    ctx.set_enum(enum)
+                    raise_event(event_type, enum, self.on_enum_parse)
             
         # Notify end.
         self.on_end(ctx)
 
+        if profiler is not None:
+            profiler.record_generator(ctx.generator_key, started)
+
 
     def on_start(self, ctx):
         """Event handler for the parsing start event.
@@ -15,6 +15,7 @@ class GeneratorContext(object):
 
     :ivar ontology: Ontology being processed.
     :ivar options: Generation options.
+    :ivar template_params: Standard template params (snapshotted once per generation).
 
     """
     def __init__(self, ontology, options):
@@ -31,6 +32,7 @@ class GeneratorContext(object):
         self.pkg = None
         self.cls = None
         self.enum = None
+        self.template_params = options.template_params
         
 
     @property
@@ -51,6 +53,18 @@ class GeneratorContext(object):
         return self.options.output_dir
 
 
+    def has_feature(self, feature):
+        """Returns flag indicating whether an optional generation feature is enabled.
+
+        :param feature: Name of an optional generation feature.
+        :type feature: str
+        :returns: True if feature is enabled, False otherwise.
+        :rtype: bool
+
+        """
+        return feature in self.options.features
+
+
     def set_package(self, pkg):
         """Sets current package being processed.
 
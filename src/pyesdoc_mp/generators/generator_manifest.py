@@ -0,0 +1,382 @@
+"""
+.. module:: pyesdoc_mp.generators.generator_manifest
+   :platform: Unix, Windows
+   :synopsis: Manifest of generated output supporting incremental regeneration.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import hashlib
+import json
+import os
+
+from pyesdoc_mp.ontology import (
+    Class,
+    Enum,
+    Ontology,
+    Package
+    )
+from pyesdoc_mp.utils.generation import TEMPLATE_FOLDER
+from pyesdoc_mp.utils.output import write_file_atomically
+
+
+
+# Manifest file name (written to root of output directory).
+MANIFEST_FILE = '.pyesdoc_mp-manifest.json'
+
+# Manifest format identifier.
+_MANIFEST_FORMAT = '2'
+
+# Package source directory.
+_PACKAGE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Source directories & modules shaping generated output (changes invalidate manifests).
+_CODE_FOLDERS = (
+    os.path.join(_PACKAGE_FOLDER, 'generators'),
+    os.path.join(_PACKAGE_FOLDER, 'ontology'),
+)
+_CODE_FILES = (
+    os.path.join(_PACKAGE_FOLDER, 'utils', 'generation.py'),
+    os.path.join(_PACKAGE_FOLDER, 'utils', 'template.py'),
+)
+
+
+def _get_digest(*values):
+    """Returns hex digest of a set of values.
+
+    """
+    h = hashlib.sha1()
+    for value in values:
+        if not isinstance(value, bytes):
+            value = value.encode('utf-8')
+        h.update(value)
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _get_files(folder, extension):
+    """Returns set of paths of files with an extension within a directory (and its sub-directories)."""
+    result = []
+    for root, dirs, files in os.walk(folder):
+        result += [os.path.join(root, f) for f in files if f.endswith(extension)]
+    return result
+
+
+def get_code_fingerprint():
+    """Returns fingerprint of the source code shaping generated output, i.e. generators, ontology model,
+    template engine & templates.
+
+    :returns: Hex digest.
+    :rtype: str
+
+    """
+    paths = list(_CODE_FILES) + _get_files(TEMPLATE_FOLDER, '.txt')
+    for folder in _CODE_FOLDERS:
+        paths += _get_files(folder, '.py')
+
+    h = hashlib.sha1()
+    for path in sorted(paths):
+        h.update(os.path.relpath(path, _PACKAGE_FOLDER).replace(os.sep, '/').encode('utf-8'))
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _get_type_name(type):
+    """Returns fully qualified name of a type (class or enum)."""
+    return type.package.name + '.' + type.name
+
+
+def get_element_fingerprint(element):
+    """Returns fingerprint of the definition of an ontology element.
+
+    :param element: An ontology element, i.e. an ontology, package, class or enum.
+    :type element: object
+    :returns: Hex digest.
+    :rtype: str
+
+    """
+    if isinstance(element, Class):
+        return _get_digest(repr((
+            'class',
+            _get_type_name(element),
+            _get_type_name(element.base) if isinstance(element.base, Class) else element.base,
+            element.is_abstract,
+            element.doc_string,
+            [(p.name, p.type.name, p.min_occurs, p.max_occurs, p.doc_string) for p in element.properties],
+            list(element.constants),
+            [(d.property_name, d.decoding, d.type) for d in element.decodings]
+        )))
+    elif isinstance(element, Enum):
+        return _get_digest(repr((
+            'enum',
+            _get_type_name(element),
+            element.is_open,
+            element.doc_string,
+            [(m.name, m.doc_string) for m in element.members]
+        )))
+    elif isinstance(element, Package):
+        return _get_digest(repr(('package', element.name, element.doc_string)))
+    elif isinstance(element, Ontology):
+        return _get_digest(repr(('ontology', element.name, element.version, element.doc_string)))
+
+    raise TypeError("Unsupported ontology element: {0}".format(element))
+
+
+class GeneratorManifest(object):
+    """Manifest of generated files keyed by parsing event.
+
+    Each entry records the fingerprint of the ontology elements upon which an event depends
+    together with the content hash of each file emitted by that event.  Events whose dependencies
+    are unchanged are not re-raised, and files whose content is unchanged are not rewritten.
+
+    N.B. Files are recorded by path relative to the output directory (using forward slashes), hence
+    an output directory may be moved or copied, or referred to by a relative path, between runs.
+
+    :ivar output_dir: Target output directory.
+    :ivar path: Path to manifest file.
+    :ivar ontology: Ontology being processed.
+    :ivar entries: Entries loaded from a previous generation run.
+    :ivar previous_files: Files emitted by a previous generation run.
+    :ivar updated_entries: Entries of the current generation run.
+
+    """
+    def __init__(self, output_dir, ontology, template_params, entries=None, features=None):
+        """Constructor.
+
+        :param output_dir: Target output directory.
+        :param ontology: Ontology being processed.
+        :param template_params: Standard template params of the current generation run.
+        :param entries: Entries of a previous run (loaded from manifest file if not passed).
+        :param features: Set of enabled optional generation features.
+        :type output_dir: str
+        :type ontology: pyesdoc_mp.ontology.Ontology
+        :type template_params: dict
+        :type entries: dict
+        :type features: list
+
+        """
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_FILE)
+        self.__features = sorted(features or ())
+        self.__datetime_now = template_params['datetime-now']
+        self.__fingerprints = {}
+        self.__referencing_classes = None
+        self.ontology = ontology
+        if entries is None:
+            entries, self.previous_files = self.__load()
+        else:
+            self.previous_files = sorted(set(f for e in entries.values() for f in e['files']))
+        self.entries = entries
+        self.updated_entries = {}
+
+
+    def __load(self):
+        """Loads (entries, files emitted) from manifest file.
+
+        N.B. Entries of a manifest written by other generator code or features are discarded whilst the files
+        they emitted are retained, hence files no longer generated (e.g. following a change of layout) are removed.
+        Manifests of other formats are discarded entirely.
+
+        """
+        if not os.path.isfile(self.path):
+            return {}, []
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+        except ValueError:
+            return {}, []
+        if manifest.get('format') != _MANIFEST_FORMAT:
+            return {}, []
+        entries = manifest.get('entries', {})
+        files = sorted(set(f for e in entries.values() for f in e['files']))
+        if manifest.get('code') != get_code_fingerprint() or \
+           manifest.get('features', []) != self.__features:
+            return {}, files
+        return entries, files
+
+
+    def save(self):
+        """Saves manifest file and removes files emitted by a previous run but no longer generated.
+
+        """
+        # Remove stale files.
+        current = set(f for e in self.updated_entries.values() for f in e['files'])
+        for path in [self.get_path(f) for f in self.previous_files if f not in current]:
+            if os.path.isfile(path):
+                os.remove(path)
+
+        # Skip write if nothing was regenerated.
+        if self.updated_entries == self.entries and os.path.isfile(self.path):
+            return
+
+        # Write atomically.
+        write_file_atomically(self.path, json.dumps({
+            'code' : get_code_fingerprint(),
+            'entries' : self.updated_entries,
+            'features' : self.__features,
+            'format' : _MANIFEST_FORMAT
+        }, indent=1, sort_keys=True))
+
+
+    def get_path(self, file):
+        """Returns path of a file recorded within the manifest.
+
+        :param file: Path of file relative to output directory.
+        :type file: str
+        :returns: Path of file within output directory.
+        :rtype: str
+
+        """
+        return os.path.join(self.output_dir, *file.split('/'))
+
+
+    def __get_fingerprint(self, element):
+        """Returns (cached) fingerprint of an ontology element."""
+        if id(element) not in self.__fingerprints:
+            self.__fingerprints[id(element)] = get_element_fingerprint(element)
+        return self.__fingerprints[id(element)]
+
+
+    def __get_referencing_classes(self, element):
+        """Returns set of classes with a property referencing an ontology type."""
+        if self.__referencing_classes is None:
+            self.__referencing_classes = {}
+            for cls in self.ontology.classes:
+                for prp in [p for p in cls.properties if p.type.is_complex]:
+                    key = prp.type.name
+                    if cls not in self.__referencing_classes.setdefault(key, []):
+                        self.__referencing_classes[key].append(cls)
+        return self.__referencing_classes.get(_get_type_name(element), [])
+
+
+    def get_dependencies(self, element):
+        """Returns set of ontology elements upon which code emitted for an element depends.
+
+        N.B. Dependencies are deliberately conservative: a class depends upon its base classes, the types
+        referenced by its (inherited) properties and the classes referencing it (see circular imports).
+
+        :param element: An ontology element, i.e. an ontology, package, class or enum.
+        :type element: object
+        :returns: List of ontology elements.
+        :rtype: list
+
+        """
+        if isinstance(element, Ontology):
+            return [element] + list(element.packages) + list(element.types)
+        elif isinstance(element, Package):
+            result = [element]
+            for t in element.types:
+                result += self.get_dependencies(t)
+            return result
+        elif isinstance(element, Enum):
+            return [element]
+        elif isinstance(element, Class):
+            result = [element]
+            base = element.base
+            while isinstance(base, Class):
+                result.append(base)
+                base = base.base
+            for prp in [p for p in element.all_properties if p.type.is_complex]:
+                t = self.ontology.get_type(prp.type.name)
+                if t is not None:
+                    result.append(t)
+            result += self.__get_referencing_classes(element)
+            return result
+
+        raise TypeError("Unsupported ontology element: {0}".format(element))
+
+
+    def get_dependencies_fingerprint(self, element):
+        """Returns fingerprint of set of ontology elements upon which code emitted for an element depends.
+
+        :param element: An ontology element, i.e. an ontology, package, class or enum.
+        :type element: object
+        :returns: Hex digest.
+        :rtype: str
+
+        """
+        fingerprints = set(self.__get_fingerprint(e) for e in self.get_dependencies(element))
+        return _get_digest(*sorted(fingerprints))
+
+
+    def get_event_key(self, generator_key, event_type, element):
+        """Returns key of a parsing event.
+
+        :param generator_key: Key assigned to generator.
+        :param event_type: Type of parsing event.
+        :param element: Ontology element being parsed.
+        :type generator_key: str
+        :type event_type: str
+        :type element: object
+        :returns: Manifest entry key.
+        :rtype: str
+
+        """
+        if isinstance(element, (Class, Enum)):
+            name = _get_type_name(element)
+        else:
+            name = element.name
+        return '{0}:{1}:{2}'.format(generator_key, event_type, name)
+
+
+    def is_current(self, key, dependencies):
+        """Returns flag indicating whether a parsing event need not be re-raised.
+
+        An event is current if its dependencies are unchanged and all the files it previously emitted exist.
+        Current entries are carried over to the updated manifest.
+
+        :param key: Manifest entry key.
+        :param dependencies: Fingerprint of event dependencies.
+        :type key: str
+        :type dependencies: str
+        :returns: True if event is current, False otherwise.
+        :rtype: bool
+
+        """
+        entry = self.entries.get(key)
+        if entry is None or \
+           entry['dependencies'] != dependencies or \
+           not all(os.path.isfile(self.get_path(f)) for f in entry['files']):
+            return False
+
+        self.updated_entries[key] = entry
+        return True
+
+
+    def emit(self, key, dependencies, code, sink):
+        """Emits code to output sink, skipping files whose content is unchanged.
+
+        :param key: Manifest entry key.
+        :param dependencies: Fingerprint of event dependencies.
+        :param code: Set of (code, directory, file name) tuples emitted by a parsing event.
+        :param sink: Output sink to which code is emitted.
+        :type key: str
+        :type dependencies: str
+        :type code: list
+        :type sink: pyesdoc_mp.utils.output.FileSystemSink
+        :returns: Set of (code, directory, file name) tuples written to output sink.
+        :rtype: list
+
+        """
+        previous = self.entries.get(key, {}).get('files', {})
+        entry = {
+            'dependencies' : dependencies,
+            'files' : {}
+        }
+        written = []
+        for code, dir, file in code:
+            # ... N.B. relative to output directory rather than sink root (which may differ if sink was passed).
+            path = os.path.relpath(os.path.join(dir, file), self.output_dir).replace(os.sep, '/')
+            # ... N.B. the generation timestamp is excluded from content hash.
+            content_hash = _get_digest(code.replace(self.__datetime_now, '{datetime-now}'))
+            if previous.get(path) != content_hash or not os.path.isfile(self.get_path(path)):
+                sink.write(code, dir, file)
+                written.append((code, dir, file))
+            entry['files'][path] = content_hash
+        self.updated_entries[key] = entry
+
+        return written
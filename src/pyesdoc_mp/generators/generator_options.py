@@ -8,6 +8,40 @@
 
 """
 
+# Module imports.
+from pyesdoc_mp.utils.output import FileSystemSink
+
+
+
+# Optional generation feature: generated types declare __slots__ rather than carry a per-instance __dict__.
+FEATURE_SLOTS = 'slots'
+
+# Optional generation feature: default values that are expensive to materialise (e.g. clock readings or uuids) are
+# materialised upon first read rather than upon construction.
+FEATURE_LAZY_DEFAULTS = 'lazy-defaults'
+
+# Optional generation feature: package initialisers import names upon first attribute access rather than upon import.
+FEATURE_LAZY_IMPORTS = 'lazy-imports'
+
+# Optional generation feature: the types of each package are emitted as a single module (the package initialiser).
+FEATURE_BUNDLE_PACKAGES = 'bundle-packages'
+
+# Optional generation feature: the types of the ontology are emitted as a single module (the types package initialiser).
+FEATURE_BUNDLE_ONTOLOGY = 'bundle-ontology'
+
+# Optional generation feature: each concrete type is accompanied by a columnar (struct-of-arrays) container of
+# its instances (requires numpy).
+FEATURE_COLUMNAR = 'columnar'
+
+# Set of supported optional generation features.
+FEATURES = (
+    FEATURE_SLOTS,
+    FEATURE_LAZY_DEFAULTS,
+    FEATURE_LAZY_IMPORTS,
+    FEATURE_BUNDLE_PACKAGES,
+    FEATURE_BUNDLE_ONTOLOGY,
+    FEATURE_COLUMNAR,
+)
 
 
 class GeneratorOptions(object):
@@ -16,20 +50,41 @@ class GeneratorOptions(object):
     :ivar generator_key: Key assigned to generator.
     :ivar language: Target code generation programming language.
     :ivar output_dir: Directory to which output will be generated.
+    :ivar template_params: Standard template params shared by all generators of a run.
+    :ivar manifest: Manifest of generated output (incremental generation only).
+    :ivar sink: Output sink to which generated code is emitted.
+    :ivar profiler: Profiler recording generation timings (profiling only).
+    :ivar features: Set of enabled optional generation features.
 
     """
-    def __init__(self, generator_key, language, output_dir):
+    def __init__(self, generator_key, language, output_dir, template_params=None, manifest=None, sink=None, profiler=None,
+                 features=None):
         """Constructor.
 
         :param generator_key: Key assigned to generator.
         :param language: Target code generation programming language.
         :param output_dir: Directory to which output will be generated.
+        :param template_params: Standard template params shared by all generators of a run (optional).
+        :param manifest: Manifest of generated output (optional, enables incremental generation).
+        :param sink: Output sink to which generated code is emitted (defaults to synchronous file system writes).
+        :param profiler: Profiler recording generation timings (optional).
+        :param features: Set of enabled optional generation features (optional, see FEATURES).
         :type generator_key: str
         :type language: str
         :type output_dir: str
+        :type template_params: dict
+        :type manifest: pyesdoc_mp.generators.generator_manifest.GeneratorManifest
+        :type sink: pyesdoc_mp.utils.output.OutputSink
+        :type profiler: pyesdoc_mp.utils.profiling.Profiler
+        :type features: list
 
         """
         self.generator_key = generator_key
         self.language = str(language).lower()
         self.output_dir = str(output_dir)
+        self.template_params = template_params
+        self.manifest = manifest
+        self.sink = sink if sink is not None else FileSystemSink(self.output_dir, threads=0)
+        self.profiler = profiler
+        self.features = frozenset(features or ())
         
\ No newline at end of file
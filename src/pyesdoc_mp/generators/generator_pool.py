@@ -0,0 +1,181 @@
+"""
+.. module:: pyesdoc_mp.generators.generator_pool
+   :platform: Unix, Windows
+   :synopsis: Executes a set of generators across a pool of worker processes.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import multiprocessing
+import os
+
+from pyesdoc_mp.generators.generator import get_events
+from pyesdoc_mp.generators.generator_manifest import GeneratorManifest
+from pyesdoc_mp.generators.generator_options import GeneratorOptions
+from pyesdoc_mp.utils.factory import create_generators
+from pyesdoc_mp.utils.output import (
+    FileSystemSink,
+    MemorySink
+    )
+from pyesdoc_mp.utils.profiling import Profiler
+
+
+
+# Number of tasks into which each parsing event range is split per worker.
+_TASKS_PER_WORKER = 4
+
+# Worker process state (set by pool initializer).
+_worker_state = dict()
+
+
+def _init_worker(ontology, language, output_dir, template_params, manifest_entries, sink_options, profile, features):
+    """Initialises a worker process.
+
+    N.B. On platforms that fork the ontology is inherited rather than pickled.
+
+    """
+    _worker_state['ontology'] = ontology
+    _worker_state['language'] = language
+    _worker_state['output_dir'] = output_dir
+    _worker_state['template_params'] = template_params
+    _worker_state['generators'] = create_generators(language)
+    _worker_state['sink_options'] = sink_options
+    _worker_state['profile'] = profile
+    _worker_state['features'] = features
+    _worker_state['manifest'] = None
+    if manifest_entries is not None:
+        _worker_state['manifest'] = GeneratorManifest(output_dir, ontology, template_params, manifest_entries, features)
+
+
+def _execute_task(task):
+    """Executes a generation task within a worker process.
+
+    :param task: Generator key plus subset of parsing event ranges to raise.
+    :type task: tuple
+    :returns: Manifest entries updated by task (incremental generation only), code emitted
+              to memory (when the parent's output sink does not write to the file system)
+              and task profile (profiling only).
+    :rtype: tuple
+
+    """
+    generator_key, events = task
+
+    # File system output is written directly by workers, other output is returned to the parent.
+    if _worker_state['sink_options'] is not None:
+        sink = FileSystemSink(_worker_state['output_dir'], *_worker_state['sink_options'])
+    else:
+        sink = MemorySink(_worker_state['output_dir'])
+
+    manifest = _worker_state['manifest']
+    if manifest is not None:
+        manifest.updated_entries = {}
+    profiler = Profiler() if _worker_state['profile'] else None
+    options = GeneratorOptions(generator_key,
+                               _worker_state['language'],
+                               _worker_state['output_dir'],
+                               _worker_state['template_params'],
+                               manifest,
+                               sink,
+                               profiler,
+                               _worker_state['features'])
+    generator = _worker_state['generators'][generator_key]()
+    generator.execute(_worker_state['ontology'], options, events)
+    sink.close()
+
+    return (None if manifest is None else manifest.updated_entries,
+            getattr(sink, 'files', None),
+            profiler)
+
+
+def _get_tasks(ontology, generators, jobs):
+    """Returns set of generation tasks.
+
+    :param ontology: Ontology being processed.
+    :param generators: Generators keyed by generator key.
+    :param jobs: Number of worker processes.
+    :type ontology: pyesdoc_mp.ontology.Ontology
+    :type generators: dict
+    :type jobs: int
+    :returns: List of (generator key, event ranges) tuples.
+    :rtype: list
+
+    """
+    tasks = []
+    for generator_key in generators:
+        # Generators that accumulate state are executed as a single task.
+        if not generators[generator_key].is_partitionable:
+            tasks.append((generator_key, None))
+            continue
+
+        # Otherwise each event range is split into chunks.
+        for event_type, start, end in get_events(ontology):
+            chunk_size = max(1, (end - start) // (jobs * _TASKS_PER_WORKER))
+            for chunk_start in range(start, end, chunk_size):
+                chunk_end = min(end, chunk_start + chunk_size)
+                tasks.append((generator_key, [(event_type, chunk_start, chunk_end)]))
+
+    return tasks
+
+
+def execute_generators(ontology, language, output_dir, template_params, jobs, manifest=None, sink=None, profiler=None,
+                       features=None):
+    """Executes the set of generators supported by a language across a pool of worker processes.
+
+    N.B. Each output file is emitted by exactly one task, hence output is identical to that of a serial run
+    with the same standard template params.
+
+    :param ontology: Ontology being processed.
+    :param language: Target programming language.
+    :param output_dir: Target output directory.
+    :param template_params: Standard template params shared by all generators.
+    :param jobs: Number of worker processes.
+    :param manifest: Manifest of generated output (incremental generation only).
+    :param sink: Output sink to which generated code is emitted (defaults to file system).
+    :param profiler: Profiler into which worker timings are merged (profiling only).
+    :param features: Set of enabled optional generation features.
+    :type ontology: pyesdoc_mp.ontology.Ontology
+    :type language: str
+    :type output_dir: str
+    :type template_params: dict
+    :type jobs: int
+    :type manifest: pyesdoc_mp.generators.generator_manifest.GeneratorManifest
+    :type sink: pyesdoc_mp.utils.output.OutputSink
+    :type profiler: pyesdoc_mp.utils.profiling.Profiler
+    :type features: list
+    :returns: Keys of executed generators.
+    :rtype: list
+
+    """
+    generators = create_generators(language)
+    tasks = _get_tasks(ontology, generators, jobs)
+    manifest_entries = None if manifest is None else manifest.entries
+    if sink is None:
+        sink = FileSystemSink(output_dir)
+    sink_options = None
+    if isinstance(sink, FileSystemSink):
+        sink_options = (sink.atomic, sink.threads)
+
+    pool = multiprocessing.Pool(jobs, _init_worker,
+                                (ontology, language, output_dir, template_params, manifest_entries, sink_options,
+                                 profiler is not None, features))
+    try:
+        for updated_entries, files, task_profiler in pool.imap_unordered(_execute_task, tasks):
+            if manifest is not None:
+                manifest.updated_entries.update(updated_entries)
+            if profiler is not None:
+                profiler.merge(task_profiler)
+            if files is not None:
+                for path in sorted(files):
+                    dir, file = os.path.split(os.path.join(output_dir, path))
+                    sink.write(files[path], dir, file)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    return list(generators)
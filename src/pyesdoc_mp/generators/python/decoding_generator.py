@@ -9,15 +9,19 @@
 """
 
 # Module imports.
+import re
+from functools import reduce
 from operator import add
 
 from pyesdoc_mp.generators.generator import Generator
+from pyesdoc_mp.generators.generator_options import FEATURE_LAZY_IMPORTS
 from pyesdoc_mp.utils.generation import (
     emit_indent,
     emit_line_return,
-    get_template
+    render_template
     )
 from pyesdoc_mp.generators.python.utils import (
+    emit_lazy_imports,
     get_class_name,
     get_class_functional_name,
     get_class_doc_string_name,
@@ -42,6 +46,51 @@ _TEMPLATE_DECODER_FUNCTION = "decoder_function.txt"
 # Template for package.
 _TEMPLATE_PACKAGE = "package.txt"
 
+# Template for module of utility functions shared by all decoders.
+_TEMPLATE_DECODER_UTILS = "decoder_xml_utils.txt"
+
+# Name of module of utility functions shared by all decoders.
+_DECODER_UTILS_MODULE = "decoder_xml_utils"
+
+# Template for module of entity decoders keyed by root tag.
+_TEMPLATE_DECODER_REGISTRY = "decoder_xml_registry.txt"
+
+# Name of module of entity decoders keyed by root tag.
+_DECODER_REGISTRY_MODULE = "decoder_xml_registry"
+
+# Names of entity decoder registry functions.
+_DECODER_REGISTRY_FUNCTIONS = ("decode_document", "get_decoder", "sniff_decoder")
+
+# Template for module of streaming entity decoders.
+_TEMPLATE_DECODER_STREAM = "decoder_xml_stream.txt"
+
+# Name of module of streaming entity decoders.
+_DECODER_STREAM_MODULE = "decoder_xml_stream"
+
+# Name of streaming entity decoder function.
+_DECODER_STREAM_FUNCTION = "decode_stream"
+
+# Template for module of batch decoders.
+_TEMPLATE_DECODER_BATCH = "decoder_xml_batch.txt"
+
+# Name of module of batch decoders.
+_DECODER_BATCH_MODULE = "decoder_xml_batch"
+
+# Names of batch decoder functions.
+_DECODER_BATCH_FUNCTIONS = ("decode_directory", "decode_files")
+
+# Template for command line batch decoder (i.e. package main module).
+_TEMPLATE_DECODER_MAIN = "main.txt"
+
+# Name of command line batch decoder (i.e. package main module).
+_DECODER_MAIN_MODULE = "__main__"
+
+# Step of a simple decoding path (dispatched by qualified tag), i.e. [child::]prefix:tag.
+_SIMPLE_DECODING_STEP = re.compile(r'^(?:child::)?(\w+:[\w.-]+)$')
+
+# Attribute of a simple decoding path, i.e. [prefix:]name.
+_SIMPLE_DECODING_ATTRIBUTE = re.compile(r'^(?:\w+:)?[\w.-]+$')
+
 
 
 
@@ -57,10 +106,63 @@ def get_class_decoder_function_name(name):
     return 'decode_{0}'.format(name)
 
 
+def _get_root_functions():
+    """Returns set of (module, function) pairs of entity independent decoders exported by package.
+
+    """
+    return [(_DECODER_BATCH_MODULE, f) for f in _DECODER_BATCH_FUNCTIONS] + \
+           [(_DECODER_REGISTRY_MODULE, f) for f in _DECODER_REGISTRY_FUNCTIONS] + \
+           [(_DECODER_STREAM_MODULE, _DECODER_STREAM_FUNCTION)]
+
+
+def get_decoding_dispatch(decoding):
+    """Returns dispatch of a simple decoding path, i.e. an (axis, tags, attribute) tuple, or None.
+
+    N.B. Simple paths are chains of child steps (optionally preceded by a self step) optionally followed by an
+    attribute, e.g. child::cim:name, child::cim:project/@value, self::cim:x/@attr or @attr.  Paths of other
+    shapes (e.g. predicates & other axes) are decoded via xpath.
+
+    Keyword Arguments:
+    decoding - decoding path.
+
+    """
+    steps = (decoding or '').split('/')
+    attribute = steps.pop()[1:] if steps[-1].startswith('@') else None
+    axis = 'child'
+    if steps and steps[0].startswith('self::'):
+        axis = 'self'
+        steps[0] = steps[0][len('self::'):]
+    elif not steps:
+        axis = 'self'
+
+    matches = [_SIMPLE_DECODING_STEP.match(s) for s in steps]
+    if None in matches or (attribute is None and not steps) or \
+       (attribute is not None and _SIMPLE_DECODING_ATTRIBUTE.match(attribute) is None):
+        return None
+
+    return (axis, tuple(m.group(1) for m in matches), attribute)
+
+
+def get_entity_root_tag(cls):
+    """Returns root tag of an entity, i.e. the prefix:tag of its self::prefix:tag document information decoding, or None.
+
+    Keyword Arguments:
+    cls - entity class.
+
+    """
+    for dc in cls.get_property_decodings(cls.get_property('cim_info')):
+        dispatch = get_decoding_dispatch(dc.decoding)
+        if dispatch is not None and dispatch[0] == 'self' and len(dispatch[1]) == 1 and dispatch[2] is None:
+            return dispatch[1][0]
+
+
 class DecodingGenerator(Generator):
     """Generates code to support serialization.
 
     """
+    # Parsing events are independent of each other.
+    is_partitionable = True
+
     def on_start(self, ctx):
         """Event handler for the parsing start event.
 
@@ -82,7 +184,14 @@ class DecodingGenerator(Generator):
         dir = self.output_dir
         file = get_package_init_file_name()
 
-        return (code, dir, file)
+        return [
+            (code, dir, file),
+            (self.emit_utils_module(ctx), dir, _DECODER_UTILS_MODULE + '.py'),
+            (self.emit_registry_module(ctx), dir, _DECODER_REGISTRY_MODULE + '.py'),
+            (self.emit_stream_module(ctx), dir, _DECODER_STREAM_MODULE + '.py'),
+            (self.emit_batch_module(ctx), dir, _DECODER_BATCH_MODULE + '.py'),
+            (self.emit_main_module(ctx), dir, _DECODER_MAIN_MODULE + '.py')
+        ]
 
 
     def on_package_parse(self, ctx):
@@ -106,13 +215,13 @@ class DecodingGenerator(Generator):
                 get_package_name(ctx.pkg))
             append_import(imp)
 
-            # Set type decoding imports.
-            for type in [t for t in ctx.pkg.external_types if t.is_class]:
-                imp = 'from {0}.v{1}.serialization.{2} import *'.format(
-                    get_ontology_name(ctx.ontology),
-                    get_ontology_version(ctx.ontology),
-                    get_package_module_name(type.name_of_package, 'decoder'))
-                append_import(imp)
+            # Set decoding utility imports.
+            # N.B. class decoders of other packages are resolved upon first use (see Decodings).
+            imp = 'from {0}.v{1}.serialization.{2} import Decodings, set_attributes'.format(
+                get_ontology_name(ctx.ontology),
+                get_ontology_version(ctx.ontology),
+                _DECODER_UTILS_MODULE)
+            append_import(imp)
 
             if len(imports) > 0:
                 return reduce(add, map(lambda i : i + emit_line_return(), sorted(imports)))
@@ -120,48 +229,53 @@ class DecodingGenerator(Generator):
                 return ''
 
         def get_functions():
-            fns = ''
+            fns = []
             for cls in ctx.pkg.classes:
-                dcs = self.get_decodings(cls)
-                fn = get_template(ctx, _TEMPLATE_DECODER_FUNCTION)
-                fn = fn.replace('{class-name}', get_class_name(cls))
-                fn = fn.replace('{class-function-name}', get_class_functional_name(cls))
-                fn = fn.replace('{class-doc-name}', get_class_doc_string_name(cls))
-                fn = fn.replace('{class-decodings}', dcs)
-                fn += emit_line_return(3)
-                fns += fn
-            return fns
-
-        code = get_template(ctx, _TEMPLATE_DECODER_MODULE)
-        code = code.replace('{module-imports}', get_imports())
-        code = code.replace('{decoding-functions}', get_functions())
+                fns.append(render_template(ctx, _TEMPLATE_DECODER_FUNCTION, {
+                    'class-name' : get_class_name(cls),
+                    'class-function-name' : get_class_functional_name(cls),
+                    'class-doc-name' : get_class_doc_string_name(cls),
+                    'class-decodings' : self.get_decodings(ctx, cls)
+                }))
+                fns.append(emit_line_return(3))
+            return ''.join(fns)
+
         dir = self.output_dir
         file = get_package_module_file_name(ctx.pkg, 'decoder')
+        code = render_template(ctx, _TEMPLATE_DECODER_MODULE, {
+            'file-name' : file,
+            'module-imports' : get_imports(),
+            'decoding-functions' : get_functions()
+        })
 
         return (code, dir, file)
 
 
-    def get_decodings(self, cls):
+    def get_decodings(self, ctx, cls):
         """Returns class level decodings.
 
+        :param ctx: Generation context information.
         :param cls: Ontology class being processed.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
         :type cls: pyesdoc_mp.ontology.class_.Class
 
         """
-        code = ''
+        code = []
         for p in cls.all_properties:
             for dc in cls.get_property_decodings(p):
                 if dc.decoding is not None:
-                    code += self.emit_decoding(p, dc.decoding, dc.type)
-        return code
+                    code.append(self.emit_decoding(ctx, p, dc.decoding, dc.type))
+        return ''.join(code)
 
 
-    def emit_decoding(self, prp, decoding, type):
+    def emit_decoding(self, ctx, prp, decoding, type):
         """Emits code corresponding to a class property decoding.
 
+        :param ctx: Generation context information.
         :param prp: Ontology class property definition.
         :param decoding: Ontology class property decoding definition.
         :param type: Ontology class property type definition.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
         :type prp: pyesdoc_mp.ontology.property.Property
         :type decoding: pyesdoc_mp.ontology.decoding.Decoding
         :type type: pyesdoc_mp.ontology.type.Type
@@ -171,19 +285,133 @@ class DecodingGenerator(Generator):
             # ... simple/enum types - return type functional name
             #     (is directly mapped to a convertor function).
             if prp.type.is_simple or prp.type.is_enum:
-                return '\'{0}\''.format(get_type_functional_name(prp.type))
-            # ... complex classes - return class functional name.
+                return get_type_functional_name(prp.type)
+            # ... complex classes - return fully qualified class decoder function name.
             elif prp.type.is_class:
                 type_name = prp.type.name if type is None else type
-                return get_class_decoder_function_name(type_name)
+                return '{0}.v{1}.serialization.{2}.{3}'.format(
+                    get_ontology_name(ctx.ontology),
+                    get_ontology_version(ctx.ontology),
+                    get_package_module_name(type_name.split('.')[0], 'decoder'),
+                    get_class_decoder_function_name(type_name))
 
-        tmpl = '{0}(\'{1}\', {2}, {3}, \'{4}\'),'
+        tmpl = '{0}(\'{1}\', {2}, \'{3}\', \'{4}\', {5}),'
         return tmpl.format(
-            emit_line_return() + emit_indent(2),
+            emit_line_return() + emit_indent(1),
             prp.name,
             prp.is_iterative,
             get_decoding_function(),
-            '' if decoding is None else decoding)
+            '' if decoding is None else decoding,
+            get_decoding_dispatch(decoding))
+
+
+    def emit_utils_module(self, ctx):
+        """Emits module of utility functions shared by all decoders.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        return render_template(ctx, _TEMPLATE_DECODER_UTILS, {
+            'file-name' : _DECODER_UTILS_MODULE + '.py'
+        })
+
+
+    def get_entity_decoders(self, ctx):
+        """Returns set of (root tag, entity) pairs.
+
+        N.B. When entities share a root tag the entity whose name corresponds to the tag is listed first.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        def get_sort_key(item):
+            tag, e = item
+            return (tag, tag.split(':')[-1].lower() != e.name.replace('_', '').lower())
+
+        entities = [(get_entity_root_tag(e), e) for e in ctx.ontology.entities]
+
+        return sorted([(tag, e) for tag, e in entities if tag is not None], key=get_sort_key)
+
+
+    def emit_registry_module(self, ctx):
+        """Emits module of entity decoders keyed by root tag.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        def get_entity_decoders():
+            tmpl = '{0}(\'{1}\', \'{2}.v{3}.serialization.{4}.{5}\'),'
+
+            return ''.join([tmpl.format(
+                emit_line_return() + emit_indent(1),
+                tag,
+                get_ontology_name(ctx.ontology),
+                get_ontology_version(ctx.ontology),
+                get_package_module_name(e.package, 'decoder'),
+                get_class_decoder_function_name(e)) for tag, e in self.get_entity_decoders(ctx)])
+
+        return render_template(ctx, _TEMPLATE_DECODER_REGISTRY, {
+            'file-name' : _DECODER_REGISTRY_MODULE + '.py',
+            'entity-decoders' : get_entity_decoders()
+        })
+
+
+    def emit_stream_module(self, ctx):
+        """Emits module of streaming entity decoders.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        imp = 'from {0}.v{1}.serialization.{2} import get_entity_decoders, get_nsmap, get_registry'.format(
+            get_ontology_name(ctx.ontology),
+            get_ontology_version(ctx.ontology),
+            _DECODER_REGISTRY_MODULE)
+
+        return render_template(ctx, _TEMPLATE_DECODER_STREAM, {
+            'file-name' : _DECODER_STREAM_MODULE + '.py',
+            'module-imports' : imp + emit_line_return()
+        })
+
+
+    def emit_batch_module(self, ctx):
+        """Emits module of batch decoders.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        imp = 'from {0}.v{1}.serialization.{2} import {3}'.format(
+            get_ontology_name(ctx.ontology),
+            get_ontology_version(ctx.ontology),
+            _DECODER_STREAM_MODULE,
+            _DECODER_STREAM_FUNCTION)
+
+        return render_template(ctx, _TEMPLATE_DECODER_BATCH, {
+            'file-name' : _DECODER_BATCH_MODULE + '.py',
+            'module-imports' : imp + emit_line_return()
+        })
+
+
+    def emit_main_module(self, ctx):
+        """Emits command line batch decoder, i.e. package main module.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        imp = 'from {0}.v{1}.serialization.{2} import DEFAULT_PATTERN, decode_files, get_files'.format(
+            get_ontology_name(ctx.ontology),
+            get_ontology_version(ctx.ontology),
+            _DECODER_BATCH_MODULE)
+
+        return render_template(ctx, _TEMPLATE_DECODER_MAIN, {
+            'file-name' : _DECODER_MAIN_MODULE + '.py',
+            'module-imports' : imp + emit_line_return()
+        })
 
 
     def emit_root_init_file(self, ctx):
@@ -207,10 +435,34 @@ class DecodingGenerator(Generator):
                     get_package_module_name(e.package, 'decoder'),
                     get_class_decoder_function_name(e))
                 is_first = False
-                
+            for module, name in _get_root_functions():
+                imports += emit_line_return()
+                imports += tmpl.format(
+                    get_ontology_name(ctx.ontology),
+                    get_ontology_version(ctx.ontology),
+                    module,
+                    name)
+
             return imports
 
-        code = get_template(ctx, _TEMPLATE_PACKAGE)
-        code = code.replace('{module-imports}', get_imports())
+        def get_lazy_imports():
+            tmpl = "{0}.v{1}.serialization.{2}"
+
+            return emit_lazy_imports(ctx, [
+                (tmpl.format(get_ontology_name(ctx.ontology),
+                             get_ontology_version(ctx.ontology),
+                             get_package_module_name(e.package, 'decoder')),
+                 get_class_decoder_function_name(e))
+                for e in ctx.ontology.entities] + [
+                (tmpl.format(get_ontology_name(ctx.ontology),
+                             get_ontology_version(ctx.ontology),
+                             module),
+                 name)
+                for module, name in _get_root_functions()])
+
+        code = render_template(ctx, _TEMPLATE_PACKAGE, {
+            'file-name' : get_package_init_file_name(),
+            'module-imports' : get_lazy_imports() if ctx.has_feature(FEATURE_LAZY_IMPORTS) else get_imports()
+        })
 
         return code
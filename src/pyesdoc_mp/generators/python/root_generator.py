@@ -10,7 +10,7 @@
 
 # Module imports.
 from pyesdoc_mp.generators.generator import Generator
-from pyesdoc_mp.utils.generation import get_template
+from pyesdoc_mp.utils.generation import render_template
 from pyesdoc_mp.generators.python.utils import (
     get_ontology_directory,
     get_package_init_file_name
@@ -38,9 +38,10 @@ class RootGenerator(Generator):
 
         """
         def get_code(template, include_version):
-            return (get_template(ctx, template), \
+            file = get_package_init_file_name()
+            return (render_template(ctx, template, {'file-name' : file}), \
                     get_ontology_directory(ctx, include_version=include_version), \
-                    get_package_init_file_name())
+                    file)
 
         return [
             get_code(_TEMPLATE_PACKAGE_1, False),
@@ -10,12 +10,22 @@
 
 # Module imports.
 from pyesdoc_mp.generators.generator import Generator
+from pyesdoc_mp.generators.generator_options import (
+    FEATURE_BUNDLE_ONTOLOGY,
+    FEATURE_BUNDLE_PACKAGES,
+    FEATURE_COLUMNAR,
+    FEATURE_LAZY_DEFAULTS,
+    FEATURE_LAZY_IMPORTS,
+    FEATURE_SLOTS
+    )
 from pyesdoc_mp.utils.generation import (
     emit_indent,
     emit_line_return,
-    get_template
+    render_template
     )
+from pyesdoc_mp.ontology.ontology import get_classes_in_inheritance_order
 from pyesdoc_mp.generators.python.utils import (
+    emit_lazy_imports,
     get_class_base_name,
     get_class_file_name,
     get_class_import_name,
@@ -30,7 +40,8 @@ from pyesdoc_mp.generators.python.utils import (
     get_package_name,
     get_package_path,
     get_property_ctor,
-    get_property_field_name,
+    get_property_lazy_default_factory,
+    get_property_lazy_slot_name,
     get_property_name,
     get_type_doc_name,
     get_type_functional_name
@@ -41,26 +52,83 @@ from pyesdoc_mp.generators.python.utils import (
 # Template for a concrete class.
 _TEMPLATE_CLASS_CONCRETE = "class_concrete.txt"
 
+# Template for a concrete class body.
+_TEMPLATE_CLASS_CONCRETE_BODY = "class_concrete_body.txt"
+
 # Template for an abstract class.
 _TEMPLATE_CLASS_ABSTRACT = "class_abstract.txt"
 
+# Template for an abstract class body.
+_TEMPLATE_CLASS_ABSTRACT_BODY = "class_abstract_body.txt"
+
 # Template for an abstract class.
 _TEMPLATE_CLASS_REPRESENTATIONS = "class_representations.txt"
 
 # Template for an enumeration.
 _TEMPLATE_ENUM = "enum.txt"
 
+# Template for an enumeration body.
+_TEMPLATE_ENUM_BODY = "enum_body.txt"
+
+# Template for module of functions shared by all type representations.
+_TEMPLATE_REPRESENTATIONS = "representations.txt"
+
+# Name of module of functions shared by all type representations.
+_REPRESENTATIONS_MODULE = "representations"
+
+# Set of functions imported from module of functions shared by all type representations.
+_REPRESENTATIONS_FUNCTIONS = (
+    'convert_from_dict',
+    'convert_from_dict_list',
+    'convert_to_dict',
+    'decode_json',
+    'encode_json',
+    'get_fingerprint',
+    'is_equivalent'
+    )
+
+# Set of names imported by enums from module of functions shared by all type representations.
+_ENUM_REPRESENTATIONS_FUNCTIONS = (
+    'Enumeration',
+    'get_member_codes',
+    'get_members'
+    )
+
+# Template for module of columnar containers shared by all types.
+_TEMPLATE_COLUMNS = "columns.txt"
+
+# Name of module of columnar containers shared by all types.
+_COLUMNS_MODULE = "columns"
+
+# Template for a columnar container of class instances.
+_TEMPLATE_CLASS_COLUMNS = "class_columns.txt"
+
+# Column kinds keyed by simple type (other simple types are held in object columns).
+_COLUMN_KINDS = {
+    'bool' : 'bool',
+    'float' : 'float',
+    'int' : 'int',
+    'str' : 'str',
+    'uri' : 'str',
+}
+
 # Template for package.
 _TEMPLATE_PACKAGE = "package.txt"
 
 # Template for sub package.
 _TEMPLATE_PACKAGE_SUB = "package_sub.txt"
 
+# Template for a bundle of types emitted as a single module.
+_TEMPLATE_PACKAGE_BUNDLE = "package_bundle.txt"
+
 
 class TypesGenerator(Generator):
     """Generates code to represent an ontology as a set of types.
 
     """
+    # Parsing events are independent of each other.
+    is_partitionable = True
+
     def on_ontology_parse(self, ctx):
         """Event handler for the ontology parse event.
 
@@ -72,11 +140,21 @@ class TypesGenerator(Generator):
         def emit_imports():
             return self.emit_imports_for_root_package(ctx)
 
-        code = self.emit_package_init_file(ctx, _TEMPLATE_PACKAGE, emit_imports)
+        if ctx.has_feature(FEATURE_BUNDLE_ONTOLOGY):
+            code = self.emit_bundle(ctx, 'types', ctx.ontology.classes, ctx.ontology.enums)
+        else:
+            code = self.emit_package_init_file(ctx, _TEMPLATE_PACKAGE, emit_imports)
         dir = get_ontology_directory(ctx, 'types')
         file = get_package_init_file_name()
 
-        return (code, dir, file)
+        result = [
+            (code, dir, file),
+            (self.emit_representations_module(ctx), dir, _REPRESENTATIONS_MODULE + '.py')
+        ]
+        if ctx.has_feature(FEATURE_COLUMNAR):
+            result.append((self.emit_columns_module(ctx), dir, _COLUMNS_MODULE + '.py'))
+
+        return result
 
 
 
@@ -91,7 +169,10 @@ class TypesGenerator(Generator):
         def emit_imports():
             return self.emit_imports_for_sub_package(ctx)
 
-        code = self.emit_package_init_file(ctx, _TEMPLATE_PACKAGE_SUB, emit_imports)
+        if ctx.has_feature(FEATURE_BUNDLE_PACKAGES):
+            code = self.emit_bundle(ctx, 'types.' + get_package_name(ctx.pkg), ctx.pkg.classes, ctx.pkg.enums)
+        else:
+            code = self.emit_package_init_file(ctx, _TEMPLATE_PACKAGE_SUB, emit_imports)
         dir = get_package_directory(ctx.pkg, ctx.output_dir, 'types')
         file = get_package_init_file_name()
 
@@ -105,6 +186,10 @@ class TypesGenerator(Generator):
         :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
 
         """
+        # N.B. bundled classes are emitted upon package (or ontology) parse.
+        if self.is_bundled(ctx):
+            return None
+
         code = self.emit_class(ctx)
         dir = get_package_directory(ctx.pkg, ctx.output_dir, 'types')
         file = get_class_file_name(ctx.cls)
@@ -119,6 +204,10 @@ class TypesGenerator(Generator):
         :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
 
         """
+        # N.B. bundled enums are emitted upon package (or ontology) parse.
+        if self.is_bundled(ctx):
+            return None
+
         code = self.emit_enum(ctx)
         dir = get_package_directory(ctx.pkg, ctx.output_dir, 'types')
         file = get_enum_file_name(ctx.enum)
@@ -137,13 +226,38 @@ class TypesGenerator(Generator):
         :type package_imports_fn: function
 
         """
-        code = get_template(ctx, template)
-
+        params = {
+            'file-name' : get_package_init_file_name(),
+            'module-imports' : package_imports_fn()
+        }
         if ctx.pkg is not None:
-            code = code.replace('{package-name}', get_package_name(ctx.pkg))
-        code = code.replace('{module-imports}', package_imports_fn())
+            params['package-name'] = get_package_name(ctx.pkg)
+
+        return render_template(ctx, template, params)
 
-        return code
+
+    def emit_representations_module(self, ctx):
+        """Emits module of functions shared by all type representations.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        return render_template(ctx, _TEMPLATE_REPRESENTATIONS, {
+            'file-name' : _REPRESENTATIONS_MODULE + '.py'
+        })
+
+
+    def emit_columns_module(self, ctx):
+        """Emits module of columnar containers shared by all types.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        return render_template(ctx, _TEMPLATE_COLUMNS, {
+            'file-name' : _COLUMNS_MODULE + '.py'
+        })
 
 
     def emit_imports_for_root_package(self, ctx):
@@ -153,6 +267,12 @@ class TypesGenerator(Generator):
         :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
         
         """
+        if ctx.has_feature(FEATURE_LAZY_IMPORTS):
+            imports = []
+            for pkg in ctx.ontology.packages:
+                imports += self.get_imports_for_sub_package(ctx, pkg)
+            return emit_lazy_imports(ctx, imports)
+
         code = ''
 
         for pkg in ctx.ontology.packages:
@@ -168,21 +288,80 @@ class TypesGenerator(Generator):
         :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
 
         """
+        imports = self.get_imports_for_sub_package(ctx, pkg)
+        if ctx.has_feature(FEATURE_LAZY_IMPORTS):
+            return emit_lazy_imports(ctx, imports)
+
         code = ''
 
-        pkg = pkg if pkg is not None else ctx.pkg
-        for cls in pkg.classes:
-            code += 'from py{0}.v{1}.types.{2}.{3} import {4}{5}'.format(
-                get_ontology_name(ctx.ontology),
-                get_ontology_version(ctx.ontology),
-                get_package_name(pkg),
-                get_class_import_name(cls),
-                get_class_name(cls),
-                emit_line_return())
+        for module, name in imports:
+            code += 'from {0} import {1}{2}'.format(module, name, emit_line_return())
                 
         return code
 
 
+    def get_imports_for_sub_package(self, ctx, pkg=None):
+        """Returns set of sub package imports.
+
+        :param ctx: Generation context information.
+        :param pkg: Package being processed (defaults to package in context).
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+        :type pkg: pyesdoc_mp.ontology.package.Package
+        :returns: Set of (module name, imported name) tuples.
+        :rtype: list
+
+        """
+        pkg = pkg if pkg is not None else ctx.pkg
+        result = []
+        for cls in pkg.classes:
+            result.append((self.get_type_module_name(ctx, pkg.name, cls.name), get_class_name(cls)))
+            if self.has_columns(ctx, cls):
+                result.append((self.get_type_module_name(ctx, pkg.name, cls.name), get_class_name(cls) + 'Columns'))
+
+        return result
+
+
+    def has_columns(self, ctx, cls):
+        """Returns flag indicating whether a class is accompanied by a columnar container of its instances.
+
+        :param ctx: Generation context information.
+        :param cls: Class being processed.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+        :type cls: pyesdoc_mp.ontology.class.Class
+
+        """
+        return ctx.has_feature(FEATURE_COLUMNAR) and not cls.is_abstract
+
+
+    def is_bundled(self, ctx):
+        """Returns flag indicating whether types are emitted as bundles (i.e. a single module per package or ontology).
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        return ctx.has_feature(FEATURE_BUNDLE_PACKAGES) or ctx.has_feature(FEATURE_BUNDLE_ONTOLOGY)
+
+
+    def get_type_module_name(self, ctx, package, type):
+        """Returns fully qualified name of the python module in which a type is declared.
+
+        :param ctx: Generation context information.
+        :param package: Name of package in which type is declared.
+        :param type: Name of type.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+        :type package: str
+        :type type: str
+
+        """
+        if ctx.has_feature(FEATURE_BUNDLE_ONTOLOGY):
+            return 'py{0}.v{1}.types'.format(get_ontology_name(ctx.ontology), get_ontology_version(ctx.ontology))
+        elif ctx.has_feature(FEATURE_BUNDLE_PACKAGES):
+            return 'py{0}'.format(get_package_path(ctx.ontology, 'types', package))
+        else:
+            return 'py{0}.{1}'.format(get_package_path(ctx.ontology, 'types', package), get_class_import_name(type))
+
+
     def emit_class(self, ctx):
         """Emits code corresponding to a python class.
 
@@ -191,32 +370,99 @@ class TypesGenerator(Generator):
 
         """
         # Set helper vars.
-        class_imports = self.emit_class_imports(ctx, ctx.cls.imports)
+        class_imports = self.emit_class_representation_imports(ctx)
+        class_imports += self.emit_class_imports(ctx, ctx.cls.imports)
         class_circular_imports = self.emit_class_imports(ctx, ctx.cls.circular_imports)
+
+        # Set template.
+        if ctx.cls.is_abstract:
+            template = _TEMPLATE_CLASS_ABSTRACT
+        else:
+            template = _TEMPLATE_CLASS_CONCRETE
+
+        # Generate code.
+        return render_template(ctx, template, {
+            'file-name' : get_class_file_name(ctx.cls),
+            'package-name' : get_package_name(ctx.pkg),
+            'class-body' : self.emit_class_body(ctx),
+            'class-imports' : class_imports,
+            'class-circular-imports' : class_circular_imports
+        })
+
+
+    def emit_class_body(self, ctx):
+        """Emits code corresponding to a python class declaration (excluding module level imports).
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        # Set helper vars.
         class_properties = self.emit_class_properties(ctx)
         class_property_constants = self.emit_class_property_constants(ctx)
         class_representations = self.emit_class_representations(ctx)
+        class_slots = self.emit_class_slots(ctx) if ctx.has_feature(FEATURE_SLOTS) else ''
+        class_lazy_defaults = self.emit_class_lazy_defaults(ctx)
 
-        # Open template.
+        # Set template.
         if ctx.cls.is_abstract:
-            code = get_template(ctx, _TEMPLATE_CLASS_ABSTRACT)
+            template = _TEMPLATE_CLASS_ABSTRACT_BODY
         else:
-            code = get_template(ctx, _TEMPLATE_CLASS_CONCRETE)
+            template = _TEMPLATE_CLASS_CONCRETE_BODY
 
         # Generate code.        
-        code = code.replace('{package-name}', get_package_name(ctx.pkg))
-        code = code.replace('{class-name}', get_class_name(ctx.cls))
-        code = code.replace('{base-class-name}', get_class_base_name(ctx.cls.base))
-        code = code.replace('{class-doc-string}', ctx.cls.doc_string)
-        code = code.replace('{class_constants}', class_property_constants)
-        code = code.replace('{class-imports}', class_imports)
-        code = code.replace('{class-circular-imports}', class_circular_imports)
-        code = code.replace('{class-properties}', class_properties)
-        code = code.replace('{class-representations}', class_representations)
+        code = render_template(ctx, template, {
+            'class-name' : get_class_name(ctx.cls),
+            'base-class-name' : get_class_base_name(ctx.cls.base),
+            'class-doc-string' : ctx.cls.doc_string,
+            'class-slots' : class_slots,
+            'class-lazy-defaults' : class_lazy_defaults,
+            'class_constants' : class_property_constants,
+            'class-properties' : class_properties,
+            'class-representations' : class_representations
+        })
+        if self.has_columns(ctx, ctx.cls):
+            code += emit_line_return(3) + self.emit_class_columns(ctx)
 
         return code
 
 
+    def emit_class_columns(self, ctx):
+        """Emits code corresponding to a columnar (struct-of-arrays) container of class instances.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        # Set column descriptors (own properties take precedence over inherited properties).
+        class_columns = ''
+        emitted = set()
+        for prp in ctx.cls.all_properties:
+            prp = ctx.cls.get_property(prp.name)
+            if prp.name in emitted:
+                continue
+            emitted.add(prp.name)
+            if prp.is_iterative:
+                kind = 'list'
+            elif prp.type.is_enum:
+                kind = 'enum'
+            elif prp.type.is_simple:
+                kind = _COLUMN_KINDS.get(prp.type.name, 'object')
+            else:
+                kind = 'object'
+            class_columns += "{0}('{1}', '{2}', {3}),".format(
+                emit_line_return() + emit_indent(2),
+                get_property_name(prp),
+                kind,
+                self.get_value_type_name(ctx, prp.type) if kind == 'enum' else None)
+
+        # Generate code.
+        return render_template(ctx, _TEMPLATE_CLASS_COLUMNS, {
+            'class-name' : get_class_name(ctx.cls),
+            'class-columns' : class_columns
+        })
+
+
     def emit_enum(self, ctx):
         """Emits code corresponding to a python class.
 
@@ -224,12 +470,90 @@ class TypesGenerator(Generator):
         :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
 
         """
-        code = get_template(ctx, _TEMPLATE_ENUM)
+        return render_template(ctx, _TEMPLATE_ENUM, {
+            'file-name' : get_enum_file_name(ctx.enum),
+            'enum-imports' : 'from py{0}.v{1}.types.{2} import {3}'.format(
+                get_ontology_name(ctx.ontology),
+                get_ontology_version(ctx.ontology),
+                _REPRESENTATIONS_MODULE,
+                ', '.join(_ENUM_REPRESENTATIONS_FUNCTIONS)),
+            'enum-body' : self.emit_enum_body(ctx)
+        })
 
-        code = code.replace('{enum-name}', get_enum_name(ctx.enum))
-        code = code.replace('{enum-doc-string}', ctx.enum.doc_string)
 
-        return code
+    def emit_enum_body(self, ctx):
+        """Emits code corresponding to a python enum declaration.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        members = ''
+        for member in ctx.enum.members:
+            members += "{0}'{1}',".format(emit_line_return() + emit_indent(2), member.name)
+
+        return render_template(ctx, _TEMPLATE_ENUM_BODY, {
+            'enum-name' : get_enum_name(ctx.enum),
+            'enum-doc-string' : ctx.enum.doc_string,
+            'enum-is-open' : str(ctx.enum.is_open),
+            'enum-members' : members
+        })
+
+
+    def emit_bundle(self, ctx, module, classes, enums):
+        """Emits code corresponding to a set of types declared within a single module.
+
+        N.B. Classes are declared in inheritance order, hence only base classes declared within other
+        bundles are imported and the circular import workaround is unnecessary.
+
+        :param ctx: Generation context information.
+        :param module: Name of module relative to ontology version package, e.g. types.shared.
+        :param classes: Set of classes being declared.
+        :param enums: Set of enums being declared.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+        :type module: str
+        :type classes: list
+        :type enums: list
+
+        """
+        pkg = ctx.pkg
+        module_name = 'py{0}.v{1}.{2}'.format(get_ontology_name(ctx.ontology), get_ontology_version(ctx.ontology), module)
+        functions = set()
+        imports = set()
+        declarations = []
+
+        for cls in get_classes_in_inheritance_order(classes):
+            ctx.set_class(cls)
+            functions.update(self.get_representation_functions(ctx))
+            if cls.base is not None:
+                base_module_name = self.get_type_module_name(ctx, cls.base.package.name, cls.base.name)
+                if base_module_name != module_name:
+                    imports.add('from {0} import {1}'.format(base_module_name, get_class_name(cls.base)))
+            declarations.append(self.emit_class_body(ctx))
+        for enum in enums:
+            ctx.set_enum(enum)
+            functions.update(_ENUM_REPRESENTATIONS_FUNCTIONS)
+            declarations.append(self.emit_enum_body(ctx))
+        ctx.set_package(pkg)
+
+        code = 'from py{0}.v{1}.types.{2} import {3}'.format(
+            get_ontology_name(ctx.ontology),
+            get_ontology_version(ctx.ontology),
+            _REPRESENTATIONS_MODULE,
+            ', '.join(sorted(functions)))
+        code += emit_line_return()
+        if [cls for cls in classes if self.has_columns(ctx, cls)]:
+            code += self.emit_columns_import(ctx)
+        for imp in sorted(imports):
+            code += imp + emit_line_return()
+
+        return render_template(ctx, _TEMPLATE_PACKAGE_BUNDLE, {
+            'file-name' : get_package_init_file_name(),
+            'module-name' : '{0}.{1}'.format(module, get_package_init_file_name()),
+            'module-description' : '' if pkg is None else ' ' + get_package_name(pkg),
+            'module-imports' : code,
+            'module-types' : emit_line_return(3).join(declarations) + emit_line_return()
+        })
 
 
     def emit_class_properties(self, ctx):
@@ -243,8 +567,9 @@ class TypesGenerator(Generator):
         prp_ctor = ''
         tmpl = '{0}{1}{2}# type = {3}{4}'
 
-        # Initialise property fields.
-        for prp in ctx.cls.properties:
+        # Initialise property fields (N.B. lazily defaulted properties are materialised upon first read).
+        lazy_properties = self.get_lazy_properties(ctx)
+        for prp in [p for p in ctx.cls.properties if p not in lazy_properties]:
             prp_ctor = get_property_ctor(prp)
             if code == '':
                 code += emit_line_return(1)
@@ -257,6 +582,89 @@ class TypesGenerator(Generator):
         return code
 
 
+    def emit_class_slots(self, ctx):
+        """Emits class __slots__ declaration.
+
+        N.B. Each class declares slots for its own properties only (inherited properties
+        being slotted by base classes), root classes additionally declare a weak reference slot.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        slots = []
+        if ctx.cls.base is None:
+            slots.append('__weakref__')
+        lazy_properties = self.get_lazy_properties(ctx)
+        for prp in ctx.cls.properties:
+            if prp in lazy_properties:
+                slots.append(get_property_lazy_slot_name(prp))
+            elif ctx.cls.base is None or ctx.cls.base.get_property(prp.name) is None:
+                slots.append(get_property_name(prp))
+
+        code = emit_line_return()
+        code += '{0}# Instance attributes (N.B. instances do not carry a __dict__).'.format(emit_indent())
+        code += emit_line_return()
+        if not slots:
+            code += '{0}__slots__ = ()'.format(emit_indent())
+        else:
+            code += '{0}__slots__ = ('.format(emit_indent())
+            code += emit_line_return()
+            for slot in slots:
+                code += "{0}'{1}',{2}".format(emit_indent(2), slot, emit_line_return())
+            code += '{0})'.format(emit_indent())
+        code += emit_line_return()
+
+        return code
+
+
+    def get_lazy_properties(self, ctx):
+        """Returns set of class properties whose default values are materialised upon first read.
+
+        N.B. Only properties declared by the class itself (i.e. not redeclared from a base class) are lazily
+        defaulted, hence the construction of base classes never overwrites a lazily defaulted value.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        if not ctx.has_feature(FEATURE_LAZY_DEFAULTS):
+            return []
+
+        return [p for p in ctx.cls.properties
+                if get_property_lazy_default_factory(p) is not None and
+                   (ctx.cls.base is None or ctx.cls.base.get_property(p.name) is None)]
+
+
+    def emit_class_lazy_defaults(self, ctx):
+        """Emits set of class level descriptors materialising property default values upon first read.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        lazy_properties = self.get_lazy_properties(ctx)
+        if not lazy_properties:
+            return ''
+
+        code = emit_line_return()
+        code += '{0}# Lazily materialised default values.'.format(emit_indent())
+        code += emit_line_return()
+        for prp in lazy_properties:
+            if ctx.has_feature(FEATURE_SLOTS):
+                code += "{0}{1} = LazySlotDefault('{2}', {3})".format(emit_indent(),
+                                                                     get_property_name(prp),
+                                                                     get_property_lazy_slot_name(prp),
+                                                                     get_property_lazy_default_factory(prp))
+            else:
+                code += "{0}{1} = LazyDefault('{1}', {2})".format(emit_indent(),
+                                                               get_property_name(prp),
+                                                               get_property_lazy_default_factory(prp))
+            code += emit_line_return()
+
+        return code
+
+
     def emit_class_property_constants(self, ctx):
         """Emits set of class property constants.
 
@@ -304,6 +712,55 @@ class TypesGenerator(Generator):
         return code
 
 
+    def emit_class_representation_imports(self, ctx):
+        """Emits code corresponding to the import of functions shared by all type representations.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        code = 'from py{0}.v{1}.types.{2} import {3}'.format(
+            get_ontology_name(ctx.ontology),
+            get_ontology_version(ctx.ontology),
+            _REPRESENTATIONS_MODULE,
+            ', '.join(sorted(self.get_representation_functions(ctx))))
+        code += emit_line_return()
+        if self.has_columns(ctx, ctx.cls):
+            code += self.emit_columns_import(ctx)
+
+        return code
+
+
+    def emit_columns_import(self, ctx):
+        """Emits code corresponding to the import of the base class of columnar containers.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        code = 'from py{0}.v{1}.types.{2} import Columns'.format(
+            get_ontology_name(ctx.ontology),
+            get_ontology_version(ctx.ontology),
+            _COLUMNS_MODULE)
+        code += emit_line_return()
+
+        return code
+
+
+    def get_representation_functions(self, ctx):
+        """Returns set of names imported by a class from the module of functions shared by all type representations.
+
+        :param ctx: Generation context information.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+
+        """
+        result = list(_REPRESENTATIONS_FUNCTIONS)
+        if self.get_lazy_properties(ctx):
+            result.append('LazySlotDefault' if ctx.has_feature(FEATURE_SLOTS) else 'LazyDefault')
+
+        return result
+
+
     def emit_class_representations(self, ctx):
         """Emits code corresponding to the set of representations of the class.
 
@@ -316,35 +773,74 @@ class TypesGenerator(Generator):
 
 
     def emit_class_representation_as_dict(self, ctx):
-        """Emits code corresponding to a dictionary representation of the class.
+        """Emits code corresponding to a dictionary representation of the class (encoding & decoding).
+
+        N.B. The representation is driven by tables of field descriptors covering all (inherited)
+        properties, hence base class representations are not invoked.
 
         :param ctx: Generation context information.
         :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
 
         """
-        # Set dict ctor.
-        dict_ctor = ''
-        if ctx.cls.base is not None:
-            dict_ctor = 'super({class-name}, self).as_dict()'
-
-        # Set dict items.
-        dict_items = ''
-        for prp in ctx.cls.properties:
-            dict_items += "{0}append(d, '{1}', {2}, {3}, {4}, {5})".format(
+        # Set dict fields (own properties take precedence over inherited properties).
+        dict_fields = ''
+        from_dict_fields = ''
+        emitted = set()
+        for prp in ctx.cls.all_properties:
+            prp = ctx.cls.get_property(prp.name)
+            if prp.name in emitted:
+                continue
+            emitted.add(prp.name)
+            dict_fields += "{0}('{1}', {2}, {3}),".format(
                 emit_line_return() + emit_indent(2),
                 get_property_name(prp),
-                get_property_field_name(prp),
                 prp.is_iterative,
-                prp.type.is_simple,
-                prp.type.is_enum)
-
-        # Open template.
-        code = get_template(ctx, _TEMPLATE_CLASS_REPRESENTATIONS)
+                not (prp.type.is_simple or prp.type.is_enum))
+            from_dict_fields += "{0}('{1}', {2}, {3}, {4}),".format(
+                emit_line_return() + emit_indent(2),
+                get_property_name(prp),
+                prp.is_iterative,
+                self.get_value_type_name(ctx, prp.type),
+                repr(self.get_class_type_name(ctx, prp.type)) if prp.type.is_class else None)
 
         # Generate code.
-        code = code.replace('{dict-ctor}', dict_ctor)
-        code = code.replace('{dict-items}', dict_items)
-        code = code.replace('{class-name}', get_class_name(ctx.cls))
+        return render_template(ctx, _TEMPLATE_CLASS_REPRESENTATIONS, {
+            'dict-fields' : dict_fields,
+            'from-dict-fields' : from_dict_fields,
+            'type-key' : '{0}.{1}'.format(ctx.cls.package.name, ctx.cls.name),
+            'is-entity' : str(ctx.cls.is_entity),
+            'class-name' : get_class_name(ctx.cls)
+        })
 
-        return code
 
+    def get_value_type_name(self, ctx, type):
+        """Returns name of the type of a simple or enum value (fully qualified in the case of enums).
+
+        :param ctx: Generation context information.
+        :param type: A type declaration.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+        :type type: pyesdoc_mp.ontology.type.Type
+
+        """
+        if type.is_simple:
+            return repr(type.name)
+        elif type.is_enum:
+            return repr('{0}.{1}'.format(
+                self.get_type_module_name(ctx, type.name_of_package, type.name_of_type),
+                get_enum_name(type.name_of_type)))
+
+        return None
+
+
+    def get_class_type_name(self, ctx, type):
+        """Returns fully qualified name of the python class corresponding to a complex type.
+
+        :param ctx: Generation context information.
+        :param type: A complex type declaration.
+        :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+        :type type: pyesdoc_mp.ontology.type.Type
+
+        """
+        return '{0}.{1}'.format(
+            self.get_type_module_name(ctx, type.name_of_package, type.name_of_type),
+            get_class_name(type.name_of_type))
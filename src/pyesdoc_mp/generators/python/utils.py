@@ -20,6 +20,9 @@ FILE_EXTENSION = '.py'
 # Python package initialisation file name.
 _PACKAGE_INIT_FILE = '__init__'
 
+# Template for lazy package imports (N.B. shared by all generators hence relative to generator template folders).
+_TEMPLATE_LAZY_IMPORTS = '../package_lazy.txt'
+
 # Python clas property field prefix.
 _PROPERTY_FIELD_PREFIX = 'self.'
 
@@ -59,6 +62,15 @@ _SIMPLE_DEFAULT_VALUES = {
     'uuid.UUID' : 'uuid.uuid4()',
 }
 
+# Factories of default values that are expensive to materialise (keyed by default value).
+_LAZY_DEFAULT_FACTORIES = {
+    'datetime.datetime.now()' : 'datetime.datetime.now',
+    'uuid.uuid4()' : 'uuid.uuid4',
+}
+
+# Python class lazy property slot prefix.
+_PROPERTY_LAZY_SLOT_PREFIX = '_lazy_'
+
 # Iterative type default value.
 _ITERATIVE_DEFAULT_VALUE = '[]'
 
@@ -358,6 +370,25 @@ def get_property_default_value(property):
                               property.type.is_enum)
 
 
+def get_property_lazy_default_factory(property):
+    """Returns factory of a property default value that is expensive to materialise (or None).
+
+    """
+    if property.is_iterative or not property.type.is_simple:
+        return None
+    return _LAZY_DEFAULT_FACTORIES.get(get_property_default_value(property), None)
+
+
+def get_property_lazy_slot_name(name):
+    """Converts name to the name of the slot in which a lazily defaulted property value is held.
+
+    Keyword Arguments:
+    name - name being converted.
+
+    """
+    return _PROPERTY_LAZY_SLOT_PREFIX + get_property_name(name)
+
+
 def get_type_name(type):
     """Returns python type name.
 
@@ -570,3 +601,21 @@ def get_package_module_file_name(name, prefix):
     """
     return get_package_module_name(name, prefix) + FILE_EXTENSION
    
+
+
+def emit_lazy_imports(ctx, imports):
+    """Emits code corresponding to a set of package imports resolved upon first attribute access (see PEP 562).
+
+    :param ctx: Generation context information.
+    :param imports: Set of (module name, imported name) tuples.
+    :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+    :type imports: list
+
+    """
+    code = ''
+    for module, name in sorted(imports, key=lambda i: i[1]):
+        code += "{0}'{1}' : '{2}',".format(emit_line_return() + emit_indent(), name, module)
+
+    return render_template(ctx, _TEMPLATE_LAZY_IMPORTS, {
+        'lazy-imports' : code
+    })
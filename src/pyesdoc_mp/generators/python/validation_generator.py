@@ -9,14 +9,17 @@
 """
 
 # Module imports.
+from functools import reduce
 from operator import add
 
 from pyesdoc_mp.generators.generator import Generator
+from pyesdoc_mp.generators.generator_options import FEATURE_LAZY_IMPORTS
 from pyesdoc_mp.utils.generation import (
     emit_line_return,
-    get_template
+    render_template
     )
 from pyesdoc_mp.generators.python.utils import (
+    emit_lazy_imports,
     get_class_name,
     get_class_functional_name,
     get_class_doc_string_name,
@@ -56,6 +59,9 @@ class ValidationGenerator(Generator):
     """Generates code to perform type instance validation.
 
     """
+    # Parsing events are independent of each other.
+    is_partitionable = True
+
     def on_start(self, ctx):
         """Event handler for the parsing start event.
 
@@ -116,23 +122,26 @@ class ValidationGenerator(Generator):
 
 
         def get_functions():
-            fns = ''
+            fns = []
             for cls in ctx.pkg.classes:
-                fn = get_template(ctx, _TEMPLATE_VALIDATOR_FUNCTION)
-                fn = fn.replace('{class-name}', get_class_name(cls))
-                fn = fn.replace('{class-function-name}', get_class_functional_name(cls))
-                fn = fn.replace('{class-doc-name}', get_class_doc_string_name(cls))
-                fn += emit_line_return(3)
-                fns += fn
-            return fns
+                fns.append(render_template(ctx, _TEMPLATE_VALIDATOR_FUNCTION, {
+                    'class-name' : get_class_name(cls),
+                    'class-function-name' : get_class_functional_name(cls),
+                    'class-doc-name' : get_class_doc_string_name(cls),
+                    'package-name' : get_package_name(ctx.pkg)
+                }))
+                fns.append(emit_line_return(3))
+            return ''.join(fns)
         
 
-        code = get_template(ctx, _TEMPLATE_VALIDATOR_MODULE)
-        code = code.replace('{module-imports}', get_imports())
-        code = code.replace('{validation-functions}', get_functions())
-        code = code.replace('{package-name}', get_package_name(ctx.pkg))
         dir = self.output_dir
         file = get_package_module_file_name(ctx.pkg, 'validator')
+        code = render_template(ctx, _TEMPLATE_VALIDATOR_MODULE, {
+            'file-name' : file,
+            'module-imports' : get_imports(),
+            'validation-functions' : get_functions(),
+            'package-name' : get_package_name(ctx.pkg)
+        })
 
         return (code, dir, file)
 
@@ -161,7 +170,19 @@ class ValidationGenerator(Generator):
                 
             return imports
 
-        code = get_template(ctx, _TEMPLATE_PACKAGE)
-        code = code.replace('{module-imports}', get_imports())
+        def get_lazy_imports():
+            tmpl = "py{0}.v{1}.validation.{2}"
+
+            return emit_lazy_imports(ctx, [
+                (tmpl.format(get_ontology_name(ctx.ontology),
+                             get_ontology_version(ctx.ontology),
+                             get_package_module_name(cls.package, 'validator')),
+                 get_class_validator_function_name(cls))
+                for cls in ctx.ontology.classes])
+
+        code = render_template(ctx, _TEMPLATE_PACKAGE, {
+            'file-name' : get_package_init_file_name(),
+            'module-imports' : get_lazy_imports() if ctx.has_feature(FEATURE_LAZY_IMPORTS) else get_imports()
+        })
         
         return code
@@ -20,6 +20,27 @@ class Class(object):
     :ivar decodings: Set of associated property decodings.
 
     """
+    # N.B. slotted as an ontology may contain many thousands of instances.
+    __slots__ = (
+        '__all_constants',
+        '__all_decodings',
+        '__all_properties',
+        '__constant_table',
+        '__decoding_table',
+        '__property_index',
+        '__property_table',
+        'base',
+        'circular_imports',
+        'constants',
+        'decodings',
+        'doc_string',
+        'imports',
+        'is_abstract',
+        'is_entity',
+        'name',
+        'properties',
+        'package'
+        )
 
     def __init__(self, name, base, is_abstract, doc_string, properties, constants, decodings):
         """Constructor.
@@ -45,20 +66,27 @@ class Class(object):
             prp.cls = self        
 
         # Set attributes.
+        self.__all_constants = None
         self.__all_decodings = None
         self.__all_properties = None
+        self.__constant_table = None
+        self.__decoding_table = None
+        self.__property_table = None
         self.base = base
         self.circular_imports = []
-        self.constants = constants
-        self.decodings = sorted(decodings, key=lambda dc: dc.property_name)
+        self.constants = tuple(constants)
+        self.decodings = tuple(sorted(decodings, key=lambda dc: dc.property_name))
         self.doc_string = doc_string if doc_string is not None else ''
         self.imports = []
         self.is_abstract = is_abstract
         self.is_entity = False
         self.name = name
-        self.properties = sorted(properties, key=lambda p: p.name)
+        self.properties = tuple(sorted(properties, key=lambda p: p.name))
         self.package = None
-        
+
+        # Set property index (own properties only).
+        self.__property_index = dict((p.name, p) for p in self.properties)
+
         # Set is entity flag.
         self.is_entity = is_abstract == False and self.has_property('cim_info')
 
@@ -70,41 +98,72 @@ class Class(object):
 
     @property
     def all_constants(self):
-        """Gets all associated constants including those of base class (sorted by name)."""
-        # JIT instantiation.
+        """Gets all associated constants including those of base class."""
         if self.__all_constants is None:
-            self.__all_constants = list(self.constants)
-            if self.base is not None:
-                self.__all_constants += self.base.all_constants
-
+            self.set_inheritance_tables()
         return self.__all_constants
 
 
     @property
     def all_properties(self):
         """Gets all associated properties including those of base class (sorted by name)."""
-        # JIT instantiation.
         if self.__all_properties is None:
-            self.__all_properties = list(self.properties)
-            if self.base is not None:
-                self.__all_properties += self.base.all_properties
-            self.__all_properties = sorted(self.__all_properties, key=lambda p: p.name)
-
+            self.set_inheritance_tables()
         return self.__all_properties
 
 
     @property
     def all_decodings(self):
         """Gets class plus base class decodings."""
-        # JIT instantiation.
         if self.__all_decodings is None:
-            self.__all_decodings = list(self.decodings)
-            if self.base is not None:
-                self.__all_decodings += self.base.all_decodings
-                
+            self.set_inheritance_tables()
         return self.__all_decodings
 
 
+    def set_inheritance_tables(self):
+        """Sets flattened tables of properties, constants & decodings including those inherited from base class.
+
+        N.B. The base class tables are reused, hence when called over a set of classes
+        the classes should be processed in inheritance order, i.e. base classes first.
+
+        """
+        # Base class tables.
+        if isinstance(self.base, Class):
+            base_constants = self.base.all_constants
+            base_decodings = self.base.all_decodings
+            base_properties = self.base.all_properties
+            constant_table = dict(self.base.__constant_table)
+            decoding_table = dict(self.base.__decoding_table)
+            property_table = dict(self.base.__property_table)
+        else:
+            base_constants = ()
+            base_decodings = ()
+            base_properties = ()
+            constant_table = {}
+            decoding_table = {}
+            property_table = {}
+
+        # Supersets.
+        self.__all_constants = self.constants + base_constants
+        self.__all_decodings = self.decodings + base_decodings
+        self.__all_properties = tuple(sorted(self.properties + base_properties, key=lambda p: p.name))
+
+        # Name indexed tables (own members take precedence over inherited members).
+        for cnt in self.constants:
+            constant_table[cnt[0]] = cnt[1]
+        for prp in self.properties:
+            property_table[prp.name] = prp
+        own_decodings = {}
+        for dc in self.decodings:
+            own_decodings.setdefault(dc.property_name, []).append(dc)
+        for prp_name, dcs in own_decodings.items():
+            decoding_table[prp_name] = tuple(dcs) + decoding_table.get(prp_name, ())
+
+        self.__constant_table = constant_table
+        self.__decoding_table = decoding_table
+        self.__property_table = property_table
+
+
     def get_property_decodings(self, prp):
         """Returns set of property decodings.
 
@@ -112,10 +171,9 @@ class Class(object):
         :type prp: pyesdoc_mp.decoding.Decodings
 
         """
-        result = []
-        for dc in [dc for dc in self.all_decodings if dc.property_name == prp.name]:
-            result.append(dc)
-        return result
+        if self.__decoding_table is None:
+            self.set_inheritance_tables()
+        return list(self.__decoding_table.get(prp.name, ()))
 
 
     def has_property(self, name):
@@ -125,10 +183,7 @@ class Class(object):
         :type name: str
 
         """
-        for prp in self.properties:
-            if prp.name == name:
-                return True
-        return False
+        return name in self.__property_index
 
 
     def get_property(self, name):
@@ -138,15 +193,18 @@ class Class(object):
         :type name: str
 
         """
-        # Return from self.
-        for prp in self.properties:
-            if prp.name == name:
-                return prp
+        if self.__property_table is None:
+            self.set_inheritance_tables()
+        return self.__property_table.get(name, None)
 
-        # Return from base.
-        if self.base is not None:
-            return self.base.get_property(name)
 
-        # Unsupported.
-        return None
-        
\ No newline at end of file
+    def get_constant(self, name):
+        """Gets associated constant value either from self or from base.
+
+        :param name: Name of a property constant.
+        :type name: str
+
+        """
+        if self.__constant_table is None:
+            self.set_inheritance_tables()
+        return self.__constant_table.get(name, None)
@@ -16,6 +16,12 @@ class Decoding(object):
     :ivar type: Target type to be decoded (either a class or enum).
 
     """
+    # N.B. slotted as an ontology may contain many thousands of instances.
+    __slots__ = (
+        'property_name',
+        'decoding',
+        'type'
+        )
 
     def __init__(self, property_name, decoding, type):
         """Constructor.
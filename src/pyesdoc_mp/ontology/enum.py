@@ -17,6 +17,15 @@ class Enum(object):
     :ivar members: Set of associated enumeration members.
 
     """
+    # N.B. slotted as an ontology may contain many thousands of instances.
+    __slots__ = (
+        'name',
+        'is_open',
+        'doc_string',
+        'members',
+        'package'
+        )
+
     def __init__(self, name, is_open, doc_string, members):
         """Constructor.
 
@@ -38,7 +47,7 @@ class Enum(object):
         self.name = name
         self.is_open = is_open
         self.doc_string = doc_string if doc_string is not None else ''
-        self.members = sorted(members, key=lambda m: m.name)
+        self.members = tuple(sorted(members, key=lambda m: m.name))
         self.package = None
         
 
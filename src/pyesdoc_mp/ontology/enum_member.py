@@ -15,6 +15,13 @@ class EnumMember(object):
     :ivar name: Enumeration member documentation string.
 
     """
+    # N.B. slotted as an ontology may contain many thousands of instances.
+    __slots__ = (
+        'enum',
+        'name',
+        'doc_string'
+        )
+
     def __init__(self, name, doc_string):
         """Constructor.
 
@@ -9,13 +9,62 @@
 """
 
 # Module imports.
-from operator import add
-from functools import reduce
-
 from pyesdoc_mp.ontology.class_ import Class
 
 
 
+def get_classes_in_inheritance_order(classes):
+    """Returns classes sorted topologically, i.e. base classes precede sub-classes.
+
+    :param classes: Set of classes to be sorted.
+    :type classes: list
+    :returns: Sorted set of classes.
+    :rtype: list
+    :raises ValueError: If a class inherits (directly or indirectly) from itself.
+
+    """
+    depths = {}
+
+    def get_name(cls):
+        return cls.name if cls.package is None else cls.package.name + '.' + cls.name
+
+    def get_depth(cls):
+        chain = []
+        visited = set()
+        while isinstance(cls, Class) and cls not in depths:
+            if cls in visited:
+                cycle = chain[chain.index(cls):] + [cls]
+                raise ValueError("Inheritance cycle: {0}".format(' -> '.join(get_name(c) for c in cycle)))
+            chain.append(cls)
+            visited.add(cls)
+            cls = cls.base
+        depth = depths[cls] if isinstance(cls, Class) else -1
+        for cls in reversed(chain):
+            depth += 1
+            depths[cls] = depth
+        return depth
+
+    return sorted(classes, key=get_depth)
+
+
+def get_distinct_types(properties):
+    """Returns set of distinct type instances referenced by a set of properties.
+
+    :param properties: Set of properties.
+    :type properties: list
+    :returns: Set of types (in order of first reference).
+    :rtype: list
+
+    """
+    result = []
+    seen = set()
+    for prp in properties:
+        if id(prp.type) not in seen:
+            seen.add(id(prp.type))
+            result.append(prp.type)
+    return result
+
+
 class Ontology(object):
     """Represents an ontology, i.e. a set of classes organised into packages.
 
@@ -23,6 +72,8 @@ class Ontology(object):
     :ivar version: Ontology version.
     :ivar doc_string: Ontology documentation string.
     :ivar packages: Set of associated packages.
+    :ivar type_registry: Map of fully qualified type names to types.
+    :ivar package_type_registry: Map of package names to maps of type names to types.
 
     """
 
@@ -50,13 +101,23 @@ class Ontology(object):
         self.packages = sorted(packages, key=lambda p: p.name)
 
         # Set supersets.
-        self.classes = reduce(add, map(lambda p : p.classes, packages))
-        self.enums = reduce(add, map(lambda p : p.enums, packages))
-        self.enum_members = reduce(add, map(lambda e : e.members, self.enums))
-        self.entities = reduce(add, map(lambda p : p.entities, packages))
-        self.properties = reduce(add, map(lambda c : c.properties, self.classes))
-        self.property_types = map(lambda p : p.type, self.properties)
-        self.types = sorted(self.classes + self.enums)
+        # N.B. flattened via comprehensions as reduce(add, ...) re-copies the accumulated list per item.
+        self.classes = tuple(c for p in packages for c in p.classes)
+        self.enums = tuple(e for p in packages for e in p.enums)
+        self.enum_members = tuple(m for e in self.enums for m in e.members)
+        self.entities = tuple(e for p in packages for e in p.entities)
+        self.properties = tuple(prp for c in self.classes for prp in c.properties)
+        self.property_types = tuple(get_distinct_types(self.properties))
+        self.types = tuple(sorted(self.classes + self.enums, key=lambda t: (t.package.name, t.name)))
+
+        # Set type registries.
+        self.type_registry = {}
+        self.package_type_registry = {}
+        for pkg in self.packages:
+            self.package_type_registry[pkg.name] = {}
+        for t in self.types:
+            self.type_registry[t.package.name + '.' + t.name] = t
+            self.package_type_registry[t.package.name][t.name] = t
 
         # Set base classes.
         for c in [c for c in self.classes if c.base is not None]:
@@ -64,6 +125,10 @@ class Ontology(object):
             if t is not None:
                 c.base = t
 
+        # Set class inheritance tables (base classes first so that their tables are reused).
+        for cls in get_classes_in_inheritance_order(self.classes):
+            cls.set_inheritance_tables()
+
         # Set property type is_class flag.
         for pt in [pt for pt in self.property_types if pt.is_complex]:
             t = self.get_type(pt.name)
@@ -92,7 +157,7 @@ class Ontology(object):
         for cls in self.classes:
             cls_import = (cls.package.name, cls.name)
             for prp in [p for p in cls.properties if p.type.is_class]:
-                prp_type = self.get_type(prp.type.name)
+                prp_type = self.get_package_type(prp.type.name_of_package, prp.type.name_of_type)
                 if cls_import in prp_type.imports:
                     prp_type.imports.remove(cls_import)
                     prp_type.circular_imports.append(cls_import)
@@ -110,10 +175,18 @@ class Ontology(object):
         :type name: str
 
         """
-        pkg_name = name.split('.')[0]
-        type_name = name.split('.')[1]
-        for t in self.types:
-            if t.package.name == pkg_name and t.name == type_name:
-                return t
-        return None
-            
\ No newline at end of file
+        return self.type_registry.get(name, None)
+
+
+    def get_package_type(self, package_name, type_name):
+        """Returns type with matching package and type name.
+
+        :param package_name: Name of package with which target type is associated.
+        :param type_name: Name of target type.
+        :type package_name: str
+        :type type_name: str
+
+        """
+        if package_name not in self.package_type_registry:
+            return None
+        return self.package_type_registry[package_name].get(type_name, None)
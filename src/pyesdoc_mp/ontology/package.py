@@ -38,32 +38,32 @@ class Package(object):
             enum.package = self
 
         # Set attributes.
-        self.classes = sorted(classes, key=lambda c: c.name)
+        self.classes = tuple(sorted(classes, key=lambda c: c.name))
         self.doc_string = doc_string
-        self.entities = []
-        self.enums = sorted(enums, key=lambda e: e.name)
-        self.external_types = []
+        self.entities = ()
+        self.enums = tuple(sorted(enums, key=lambda e: e.name))
+        self.external_types = ()
         self.name = name
-        self.properties = []
-        self.types = []
+        self.properties = ()
+        self.types = ()
         
         # Derive superset of entities.
-        self.entities = sorted([c for c in classes if c.is_entity])
+        self.entities = tuple(sorted([c for c in classes if c.is_entity], key=lambda c: c.name))
 
         # Derive superset of types.
-        self.types = sorted(classes + enums, key=lambda t: t.name)
+        self.types = tuple(sorted(self.classes + self.enums, key=lambda t: t.name))
 
         # Derive superset of properties.
-        for cls in self.classes:
-            for prp in cls.properties:
-                self.properties.append(prp)
+        self.properties = tuple(prp for cls in self.classes for prp in cls.properties)
         
         # Derive superset of external types.
+        external_types = []
         for prp in self.properties:
             if prp.type.is_complex and \
                prp.type.name_of_package != self.name and \
-               prp.type not in self.external_types:
-                self.external_types.append(prp.type)
+               prp.type not in external_types:
+                external_types.append(prp.type)
+        self.external_types = tuple(external_types)
 
 
     def __repr__(self):
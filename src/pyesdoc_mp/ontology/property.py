@@ -9,7 +9,10 @@
 """
 
 # Module imports.
-from pyesdoc_mp.ontology.type import Type
+from pyesdoc_mp.ontology.type import (
+    intern_type,
+    Type
+    )
 
 
 
@@ -22,28 +25,41 @@ class Property(object):
     :ivar cardinality: Type of relationship to associated class (i.e. 0.1 | 1.1 | 0.N | 1.N).
 
     """
+    # N.B. slotted as an ontology may contain many thousands of instances.
+    __slots__ = (
+        'cls',
+        'decodings',
+        'doc_string',
+        'max_occurs',
+        'min_occurs',
+        'name',
+        'type',
+        'is_required',
+        'is_iterative'
+        )
 
-    def __init__(self, name, doc_string, type_name, cardinality):
+    def __init__(self, name, doc_string, type_name, cardinality, type_pool=None):
         """Constructor.
 
         :param name: Property name.
         :param doc_string: Property docuemtnation string.
         :param type_name: Property type name.
         :param cardinality: Type of relationship to associated class (i.e. 0.1 | 1.1 | 0.N | 1.N).
+        :param type_pool: Pool of types shared across properties (optional).
         :type name: str
         :type doc_string: str
         :type type_name: str
         :type cardinality: str
+        :type type_pool: dict
 
         """
         # Set attributes.
         self.cls = None
-        self.decodings = []
+        self.decodings = ()
         self.doc_string = doc_string if doc_string is not None else ''
-        self.max_occurs = cardinality.split('.')[1]
-        self.min_occurs = cardinality.split('.')[0]
+        self.min_occurs, self.max_occurs = cardinality.split('.')
         self.name = name
-        self.type = Type(type_name)
+        self.type = Type(type_name) if type_pool is None else intern_type(type_name, type_pool)
 
         # Derived attributes.
         self.is_required = self.min_occurs != '0'
@@ -20,6 +20,17 @@ class Type(object):
     :ivar name: Name of type.
 
     """
+    # N.B. slotted & interned (see intern_type) as an ontology may contain many thousands of type references.
+    __slots__ = (
+        '__complex_type',
+        '__is_enum',
+        'is_class',
+        'is_complex',
+        'is_simple',
+        'name',
+        'name_of_package',
+        'name_of_type'
+        )
 
     def __init__(self, name):
         """Constructor.
@@ -29,14 +40,15 @@ class Type(object):
 
         """
         # Set attributes.
+        name_parts = name.split('.')
         self.__complex_type = None
         self.__is_enum = False
         self.is_class = False
-        self.is_complex = len(name.split('.')) > 1
+        self.is_complex = len(name_parts) > 1
         self.is_simple = not self.is_complex
         self.name = name
-        self.name_of_package = '' if self.is_simple else name.split('.')[0]
-        self.name_of_type = name if self.is_simple else name.split('.')[1]
+        self.name_of_package = '' if self.is_simple else name_parts[0]
+        self.name_of_type = name if self.is_simple else name_parts[1]
 
 
     def __repr__(self):
@@ -70,3 +82,20 @@ class Type(object):
         """Gets flag indicating whether type represents an enumerated type."""
         return self.is_complex and not self.is_class
 
+
+def intern_type(name, pool):
+    """Returns the type instance with matching name from a pool, creating it if necessary.
+
+    N.B. Properties with the same type name thereby share a single (flyweight) type instance.
+
+    :param name: Name of type.
+    :param pool: Pool of types keyed by name.
+    :type name: str
+    :type pool: dict
+    :returns: A pooled type instance.
+    :rtype: pyesdoc_mp.ontology.type.Type
+
+    """
+    if name not in pool:
+        pool[name] = Type(name)
+    return pool[name]
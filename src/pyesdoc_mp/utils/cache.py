@@ -0,0 +1,163 @@
+"""
+.. module:: pyesdoc_mp.utils.cache
+   :platform: Unix, Windows
+   :synopsis: Persists linked ontologies to disk keyed by a schema fingerprint.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import glob
+import hashlib
+import json
+import os
+import sys
+import zlib
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from pyesdoc_mp.utils.output import write_file_atomically
+
+
+
+# Cache file format identifier (written as file header).
+_CACHE_FORMAT = b'ESDOC-ONTOLOGY-CACHE-1'
+
+# Cache file extension.
+_CACHE_FILE_EXTENSION = '.ontology'
+
+# Ontology model source directory (model changes invalidate cached ontologies).
+_ONTOLOGY_MODEL_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ontology')
+
+# Ontology factory source file (changes to how ontologies are built invalidate cached ontologies).
+_ONTOLOGY_FACTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'factory.py')
+
+# Recursion limit applied whilst pickling (linked ontologies are deeply nested object graphs).
+_PICKLE_RECURSION_LIMIT = 20000
+
+
+def get_schema_fingerprint(schema):
+    """Returns fingerprint of an ontology schema declaration.
+
+    :param schema: An ontology schema declaration.
+    :type schema: dict
+    :returns: Hex digest derived from the schema and the ontology model & factory source code.
+    :rtype: str
+
+    """
+    h = hashlib.sha1()
+    h.update(_CACHE_FORMAT)
+    h.update(json.dumps(schema, sort_keys=True, default=repr).encode('utf-8'))
+    for path in sorted(glob.glob(os.path.join(_ONTOLOGY_MODEL_FOLDER, '*.py'))) + [_ONTOLOGY_FACTORY_FILE]:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+
+    return h.hexdigest()
+
+
+def _get_cache_file_prefix(schema):
+    """Returns prefix of cache files associated with a schema.
+
+    :param schema: An ontology schema declaration.
+    :type schema: dict
+
+    """
+    return "{0}-v{1}-".format(schema['name'], schema['version'])
+
+
+def _get_cache_file_path(schema, cache_dir, fingerprint):
+    """Returns path to a cached ontology file.
+
+    :param schema: An ontology schema declaration.
+    :param cache_dir: Directory in which cached ontologies are stored.
+    :param fingerprint: Schema fingerprint.
+    :type schema: dict
+    :type cache_dir: str
+    :type fingerprint: str
+
+    """
+    return os.path.join(cache_dir, _get_cache_file_prefix(schema) + fingerprint + _CACHE_FILE_EXTENSION)
+
+
+def load_ontology(schema, cache_dir, fingerprint=None):
+    """Loads a previously cached ontology.
+
+    :param schema: An ontology schema declaration.
+    :param cache_dir: Directory in which cached ontologies are stored.
+    :param fingerprint: Schema fingerprint (derived if not passed).
+    :type schema: dict
+    :type cache_dir: str
+    :type fingerprint: str
+    :returns: A cached ontology or None if the cache is empty or stale.
+    :rtype: pyesdoc_mp.ontology.Ontology
+
+    """
+    if fingerprint is None:
+        fingerprint = get_schema_fingerprint(schema)
+    path = _get_cache_file_path(schema, cache_dir, fingerprint)
+    if not os.path.isfile(path):
+        return None
+
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, _PICKLE_RECURSION_LIMIT))
+    try:
+        with open(path, 'rb') as f:
+            if f.readline().rstrip() != _CACHE_FORMAT or \
+               f.readline().rstrip().decode('ascii') != fingerprint:
+                return None
+            return pickle.loads(zlib.decompress(f.read()))
+    # ... unreadable entries are treated as cache misses.
+    except Exception:
+        return None
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+
+def save_ontology(schema, ontology, cache_dir, fingerprint=None):
+    """Saves an ontology to the cache, replacing stale entries for the same schema.
+
+    :param schema: An ontology schema declaration.
+    :param ontology: Ontology instantiated from schema.
+    :param cache_dir: Directory in which cached ontologies are stored.
+    :param fingerprint: Schema fingerprint (derived if not passed).
+    :type schema: dict
+    :type ontology: pyesdoc_mp.ontology.Ontology
+    :type cache_dir: str
+    :type fingerprint: str
+    :returns: True if the ontology was cached, False otherwise.
+    :rtype: bool
+
+    """
+    if fingerprint is None:
+        fingerprint = get_schema_fingerprint(schema)
+    path = _get_cache_file_path(schema, cache_dir, fingerprint)
+
+    # Serialize.
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, _PICKLE_RECURSION_LIMIT))
+    try:
+        data = zlib.compress(pickle.dumps(ontology, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return False
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+    # Write atomically so that concurrent runs never read partial entries.
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    write_file_atomically(path, _CACHE_FORMAT + b'\n' + fingerprint.encode('ascii') + b'\n' + data)
+
+    # Invalidate stale entries.
+    pattern = os.path.join(cache_dir, _get_cache_file_prefix(schema) + '*' + _CACHE_FILE_EXTENSION)
+    for stale in [p for p in glob.glob(pattern) if p != path]:
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+
+    return True
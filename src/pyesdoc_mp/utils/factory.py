@@ -8,6 +8,11 @@
 
 """
 from pyesdoc_mp.schemas import schemas as ontology_schemas
+from pyesdoc_mp.utils.cache import (
+    get_schema_fingerprint,
+    load_ontology,
+    save_ontology
+    )
 
 
 
@@ -66,26 +71,63 @@ def create_ontology_schema(name, version):
     return None
 
 
-def create_ontology(schema):
+def create_ontology(schema, cache_dir=None):
     """Factory method to instantiate an ontology instance from a schema declaration.
 
     :param schema: An ontology schema declaration.
+    :param cache_dir: Directory in which linked ontologies are cached (optional).
     :type schema: dict
+    :type cache_dir: str
     :returns: An ontology declaration.
     :rtype: pyesdoc_mp.ontology.Ontology
 
+    """
+    # Load from cache.
+    if cache_dir is not None:
+        fingerprint = get_schema_fingerprint(schema)
+        ontology = load_ontology(schema, cache_dir, fingerprint)
+        if ontology is None:
+            ontology = _create_ontology(schema)
+            save_ontology(schema, ontology, cache_dir, fingerprint)
+        return ontology
+
+    return _create_ontology(schema)
+
+
+def _create_ontology(schema):
+    """Instantiates an ontology instance from a schema declaration.
+
+    :param schema: An ontology schema declaration.
+    :type schema: dict
+    :returns: An ontology declaration.
+    :rtype: pyesdoc_mp.ontology.Ontology
+
+    """
+    from pyesdoc_mp.ontology import Ontology
+
+    return Ontology(schema['name'], schema['version'], schema['doc'], create_packages(schema))
+
+
+def create_packages(schema):
+    """Instantiates the (as yet unlinked) packages declared by an ontology schema.
+
+    :param schema: An ontology schema declaration.
+    :type schema: dict
+    :returns: List of packages from which an ontology is constructed.
+    :rtype: list
+
     """
     from pyesdoc_mp.ontology import (
         Class,
         Decoding,
         Enum,
         EnumMember,
-        Ontology,
         Package,
         Property
         )
 
     o_packages = []
+    o_types = {}
     for p_cfg in schema['packages']:
         # ... package classes
         p_classes = []
@@ -94,7 +136,7 @@ def create_ontology(schema):
             c_properties = []
             if 'properties' in c_cfg:
                 for cp_cfg in c_cfg['properties']:
-                    c_property = Property(cp_cfg[0], cp_cfg[3], cp_cfg[1], cp_cfg[2])
+                    c_property = Property(cp_cfg[0], cp_cfg[3], cp_cfg[1], cp_cfg[2], o_types)
                     c_properties.append(c_property)
 
             # ... class constants
@@ -134,4 +176,4 @@ def create_ontology(schema):
         # ... package
         o_packages.append(Package(p_cfg['name'], p_cfg['doc'], p_classes, p_enums))
 
-    return Ontology(schema['name'], schema['version'], schema['doc'], o_packages)
\ No newline at end of file
+    return o_packages
\ No newline at end of file
@@ -13,10 +13,12 @@ import datetime
 import os
 import pwd
 
+from pyesdoc_mp.utils.template import Template
+
 
 
 # Templates folder.
-TEMPLATE_FOLDER = os.path.dirname(__file__).replace('/utils', '/templates')
+TEMPLATE_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
 
 # Standard 4 character python indent.
 _INDENT = '    '
@@ -24,7 +26,7 @@ _INDENT = '    '
 # Standard line return.
 _LINE_RETURN = '\n'
 
-# Set of loaded templates.
+# Set of loaded (compiled) templates.
 _loaded_templates = dict()
 
 
@@ -75,28 +77,60 @@ def _get_template_path(ctx, filename):
     :type filename: str
 
     """
-    path = TEMPLATE_FOLDER
-    path += "/{0}/{1}/".format(ctx.language, ctx.generator_key)
-    path += filename
-    return path
+    return os.path.join(TEMPLATE_FOLDER, ctx.language, ctx.generator_key, filename)
 
 
-def get_template(ctx, filename):
-    """Returns code template.
+def load_template(ctx, filename):
+    """Returns compiled code template (templates are loaded and compiled once).
 
     :param ctx: Generation context information.
     :param filename: Name of template file.
     :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
     :type filename: str
-
+    :returns: A compiled code template.
+    :rtype: pyesdoc_mp.utils.template.Template
 
     """
     path = _get_template_path(ctx, filename)
     if path not in _loaded_templates:
         tmpl = open(path)
-        _loaded_templates[path] = tmpl.read()
+        _loaded_templates[path] = Template(tmpl.read())
         tmpl.close()
-    return inject_standard_template_params(ctx, _loaded_templates[path])
+    return _loaded_templates[path]
+
+
+def get_template(ctx, filename):
+    """Returns code template injected with standard template params.
+
+    :param ctx: Generation context information.
+    :param filename: Name of template file.
+    :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+    :type filename: str
+
+
+    """
+    return render_template(ctx, filename)
+
+
+def render_template(ctx, filename, params=None):
+    """Renders code template in a single pass.
+
+    :param ctx: Generation context information.
+    :param filename: Name of template file.
+    :param params: Template params keyed by placeholder name (standard params are injected by default).
+    :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+    :type filename: str
+    :type params: dict
+    :returns: Rendered code.
+    :rtype: str
+
+    """
+    if params is None:
+        params = {}
+    if ctx.options.profiler is not None:
+        ctx.options.profiler.record_template(filename)
+
+    return load_template(ctx, filename).render(params, get_standard_template_params(ctx))
 
 
 def get_username():
@@ -116,7 +150,7 @@ def emit_indent(count=1):
     :type count: int
 
     """
-    return reduce(lambda x, y: x + _INDENT, range(count), '')
+    return _INDENT * count
 
 
 def emit_line_return(count=1):
@@ -126,43 +160,45 @@ def emit_line_return(count=1):
     :type count: int
 
     """
-    return reduce(lambda x, y: x + _LINE_RETURN, range(count), '')
+    return _LINE_RETURN * count
 
 
-def create_directory(dir):
-    """Generates a directory into which code will be generated.
+def create_standard_template_params(ontology):
+    """Returns a snapshot of the set of standard template parameters.
 
-    :param dir: Target code generation directory.
-    :type dir: str
+    :param ontology: Ontology being processed.
+    :type ontology: pyesdoc_mp.ontology.Ontology
+    :returns: Standard template params keyed by placeholder name.
+    :rtype: dict
 
     """
-    try:
-        os.makedirs(dir)
-    except:
-        pass
+    now = datetime.datetime.now()
 
+    return {
+        # Ontology related params.
+        'ontology-name' : ontology.name,
+        'ontology-version' : ontology.version,
+        'ontology-version-packagename' : ontology.version.replace('.', '_'),
+        # Misceallaneous params.
+        'datetime-now' : str(now),
+        'datetime-year' : str(now.year),
+        'user-name' : get_username(),
+    }
 
-def write_file(code, dir, file):
-    """Writes code to a file.
 
-    :param code: Code to be written to a file.
-    :param dir: Directory into which code is to be generated.
-    :param file: Name of code file being written.
-    :type code: str
-    :type dir: str
-    :type file: str
+def get_standard_template_params(ctx):
+    """Returns set of standard template parameters (snapshotted once per generation).
 
-    """
-    # Create directory.
-    create_directory(dir)
+    :param ctx: Generation context information.
+    :type ctx: pyesdoc_mp.generators.generator.GeneratorContext
+    :returns: Standard template params keyed by placeholder name.
+    :rtype: dict
 
-    # Update code.
-    code = code.replace('{file-name}', file)
+    """
+    if ctx.template_params is None:
+        ctx.template_params = create_standard_template_params(ctx.ontology)
 
-    # Write file.
-    file = open(dir + "/" + file, 'w')
-    file.writelines(code)
-    file.close()
+    return ctx.template_params
 
 
 def inject_standard_template_params(ctx, code):
@@ -174,14 +210,4 @@ def inject_standard_template_params(ctx, code):
     :type code: str
     
     """
-    # Ontology related params.
-    code = code.replace('{ontology-name}', ctx.ontology.name)
-    code = code.replace('{ontology-version}', ctx.ontology.version)
-    code = code.replace('{ontology-version-packagename}', ctx.ontology.version.replace('.', '_'))
-
-    # Misceallaneous params.
-    code = code.replace('{datetime-now}', str(datetime.datetime.now()))
-    code = code.replace('{datetime-year}', str(datetime.datetime.now().year))
-    code = code.replace('{user-name}', get_username())
-
-    return code
+    return Template(code).render(get_standard_template_params(ctx))
@@ -0,0 +1,489 @@
+"""
+.. module:: pyesdoc_mp.utils.output
+   :platform: Unix, Windows
+   :synopsis: Output sinks to which generated code is emitted.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+from abc import ABCMeta
+from abc import abstractmethod
+import base64
+import hashlib
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+
+# Output path denoting a tar stream written to stdout.
+STDOUT = '-'
+
+# Default number of background writer threads.
+_DEFAULT_THREADS = 4
+
+# Number of pending writes buffered per writer thread before callers block.
+_QUEUE_SIZE_PER_THREAD = 64
+
+# Mode assigned to emitted files.
+_FILE_MODE = 0o644
+
+
+def _get_bytes(code):
+    """Returns code encoded as bytes."""
+    if isinstance(code, bytes):
+        return code
+    return code.encode('utf-8')
+
+
+def _replace_file(src, dst):
+    """Renames a file, atomically replacing the destination file (if any).
+
+    N.B. Python 2 has no os.replace, renaming onto an existing file is however atomic other than on Windows.
+
+    """
+    try:
+        replace = os.replace
+    except AttributeError:
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+    else:
+        replace(src, dst)
+
+
+def write_file_atomically(path, data, mode=_FILE_MODE):
+    """Writes a file atomically (temp file + rename) so that readers never observe partial content.
+
+    N.B. The temp file is removed if writing fails, in which case the file is left untouched.
+
+    :param path: Path of file being written.
+    :param data: File content (written in binary mode if bytes).
+    :param mode: Mode assigned to file.
+    :type path: str
+    :type data: str | bytes
+    :type mode: int
+
+    """
+    dir, file = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=dir or '.', prefix='.' + file, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        _replace_file(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Abstract Base Class module - see http://docs.python.org/library/abc.html
+# N.B. the metaclass is applied by instantiation as python 3 ignores __metaclass__ declarations.
+_AbstractOutputSink = ABCMeta('_AbstractOutputSink', (object, ), {})
+
+
+class OutputSink(_AbstractOutputSink):
+    """Base class of output sinks to which generated code is emitted.
+
+    :ivar root: Root output path, emitted paths are stored relative to it.
+
+    """
+    def __init__(self, root):
+        """Constructor.
+
+        :param root: Root output path.
+        :type root: str
+
+        """
+        self.root = root
+
+
+    def get_relative_path(self, dir, file):
+        """Returns path of an emitted file relative to sink root.
+
+        :param dir: Directory into which code is generated.
+        :param file: Name of code file.
+        :type dir: str
+        :type file: str
+        :returns: Relative path using forward slashes.
+        :rtype: str
+
+        """
+        path = os.path.relpath(os.path.join(dir, file), self.root)
+        return path.replace(os.sep, '/')
+
+
+    @abstractmethod
+    def write(self, code, dir, file):
+        """Emits code to a file.
+
+        :param code: Code to be written to a file.
+        :param dir: Directory into which code is to be generated.
+        :param file: Name of code file being written.
+        :type code: str
+        :type dir: str
+        :type file: str
+
+        """
+
+
+    def close(self):
+        """Flushes pending output and releases resources.
+
+        """
+        pass
+
+
+class FileSystemSink(OutputSink):
+    """Emits code to the file system through a pool of background writer threads.
+
+    Created directories are cached so that each is created once only.  Files are optionally
+    written atomically (temp file + rename) so that readers never observe partial content.
+
+    :ivar atomic: Flag indicating whether files are written atomically.
+    :ivar threads: Number of background writer threads (0 = synchronous writes).
+
+    """
+    def __init__(self, root, atomic=True, threads=_DEFAULT_THREADS):
+        """Constructor.
+
+        :param root: Root output directory.
+        :param atomic: Flag indicating whether files are written atomically.
+        :param threads: Number of background writer threads (0 = synchronous writes).
+        :type root: str
+        :type atomic: bool
+        :type threads: int
+
+        """
+        super(FileSystemSink, self).__init__(root)
+        self.atomic = atomic
+        self.threads = max(0, threads)
+        self.__directories = set()
+        self.__error = None
+        self.__queue = None
+        self.__workers = []
+
+
+    def __create_directory(self, dir):
+        """Creates a directory (once only)."""
+        if dir in self.__directories:
+            return
+        if not os.path.isdir(dir):
+            try:
+                os.makedirs(dir)
+            except OSError:
+                # ... tolerate concurrent creation (e.g. by other worker processes).
+                if not os.path.isdir(dir):
+                    raise
+        self.__directories.add(dir)
+
+
+    def __write(self, code, path):
+        """Writes code to a file."""
+        if self.atomic:
+            write_file_atomically(path, code)
+        else:
+            with open(path, 'w') as f:
+                f.write(code)
+
+
+    def __run_worker(self):
+        """Writer thread loop."""
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                break
+            if self.__error is None:
+                try:
+                    self.__write(*item)
+                except Exception as e:
+                    self.__error = e
+
+
+    def __start_workers(self):
+        """Starts writer threads."""
+        self.__queue = queue.Queue(self.threads * _QUEUE_SIZE_PER_THREAD)
+        for i in range(self.threads):
+            worker = threading.Thread(target=self.__run_worker)
+            worker.daemon = True
+            worker.start()
+            self.__workers.append(worker)
+
+
+    def write(self, code, dir, file):
+        """Emits code to a file.
+
+        :param code: Code to be written to a file.
+        :param dir: Directory into which code is to be generated.
+        :param file: Name of code file being written.
+        :type code: str
+        :type dir: str
+        :type file: str
+
+        """
+        if self.__error is not None:
+            raise self.__error
+
+        self.__create_directory(dir)
+        path = os.path.join(dir, file)
+        if self.threads == 0:
+            self.__write(code, path)
+        else:
+            if self.__queue is None:
+                self.__start_workers()
+            self.__queue.put((code, path))
+
+
+    def close(self):
+        """Waits for pending writes to complete and stops writer threads.
+
+        """
+        if self.__queue is not None:
+            for worker in self.__workers:
+                self.__queue.put(None)
+            for worker in self.__workers:
+                worker.join()
+            self.__queue = None
+            self.__workers = []
+        if self.__error is not None:
+            raise self.__error
+
+
+class MemorySink(OutputSink):
+    """Emits code to an in-memory virtual file system.
+
+    :ivar files: Emitted code keyed by path relative to sink root.
+
+    """
+    def __init__(self, root='.'):
+        """Constructor.
+
+        :param root: Root output path.
+        :type root: str
+
+        """
+        super(MemorySink, self).__init__(root)
+        self.files = {}
+
+
+    def write(self, code, dir, file):
+        """Emits code to a file.
+
+        :param code: Code to be written to a file.
+        :param dir: Directory into which code is to be generated.
+        :param file: Name of code file being written.
+        :type code: str
+        :type dir: str
+        :type file: str
+
+        """
+        self.files[self.get_relative_path(dir, file)] = code
+
+
+    def exists(self, path):
+        """Returns flag indicating whether a file has been emitted.
+
+        :param path: Path relative to sink root.
+        :type path: str
+        :returns: True if file has been emitted, False otherwise.
+        :rtype: bool
+
+        """
+        return path in self.files
+
+
+    def read(self, path):
+        """Returns code emitted to a file.
+
+        :param path: Path relative to sink root.
+        :type path: str
+        :returns: Emitted code.
+        :rtype: str
+
+        """
+        return self.files[path]
+
+
+class ZipSink(OutputSink):
+    """Emits code to a single zip archive.
+
+    If the archive is a wheel (i.e. a .whl file named as per PEP 427) then a dist-info
+    directory (METADATA, WHEEL and RECORD) is appended upon close.
+
+    """
+    def __init__(self, path, root=None):
+        """Constructor.
+
+        :param path: Path to archive.
+        :param root: Root output path (defaults to archive path).
+        :type path: str
+        :type root: str
+
+        """
+        super(ZipSink, self).__init__(path if root is None else root)
+        self.path = path
+        self.__archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        self.__date_time = time.localtime()[:6]
+        self.__records = []
+
+
+    def __write(self, name, data):
+        """Writes an archive member."""
+        info = zipfile.ZipInfo(name, self.__date_time)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = (_FILE_MODE | 0o100000) << 16
+        self.__archive.writestr(info, data)
+        digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b'=')
+        self.__records.append('{0},sha256={1},{2}'.format(name, digest.decode('ascii'), len(data)))
+
+
+    def write(self, code, dir, file):
+        """Emits code to a file.
+
+        :param code: Code to be written to a file.
+        :param dir: Directory into which code is to be generated.
+        :param file: Name of code file being written.
+        :type code: str
+        :type dir: str
+        :type file: str
+
+        """
+        self.__write(self.get_relative_path(dir, file), _get_bytes(code))
+
+
+    def __write_wheel_metadata(self):
+        """Writes wheel dist-info directory."""
+        parts = os.path.basename(self.path)[:-len('.whl')].split('-')
+        name = parts[0]
+        version = parts[1] if len(parts) > 1 else '0'
+        tag = '-'.join(parts[-3:]) if len(parts) >= 5 else 'py2.py3-none-any'
+        dist_info = '{0}-{1}.dist-info'.format(name, version)
+
+        self.__write(dist_info + '/METADATA', _get_bytes(
+            'Metadata-Version: 2.1\nName: {0}\nVersion: {1}\n'.format(name, version)))
+        self.__write(dist_info + '/WHEEL', _get_bytes(
+            'Wheel-Version: 1.0\nGenerator: pyesdoc_mp\nRoot-Is-Purelib: true\nTag: {0}\n'.format(tag)))
+        records = self.__records + [dist_info + '/RECORD,,']
+        self.__archive.writestr(dist_info + '/RECORD', _get_bytes('\n'.join(records) + '\n'))
+
+
+    def close(self):
+        """Finalises archive.
+
+        """
+        if self.__archive is None:
+            return
+        if self.path.endswith('.whl'):
+            self.__write_wheel_metadata()
+        self.__archive.close()
+        self.__archive = None
+
+
+class TarSink(OutputSink):
+    """Emits code to a tar stream, by default written to stdout.
+
+    """
+    def __init__(self, root=STDOUT, stream=None, close_stream=False):
+        """Constructor.
+
+        :param root: Root output path.
+        :param stream: Binary stream to which archive is written (defaults to stdout).
+        :param close_stream: Flag indicating whether stream is closed along with sink.
+        :type root: str
+        :type stream: file
+        :type close_stream: bool
+
+        """
+        super(TarSink, self).__init__(root)
+        if stream is None:
+            stream = getattr(sys.stdout, 'buffer', sys.stdout)
+        self.stream = stream
+        self.close_stream = close_stream
+        self.__archive = tarfile.open(fileobj=stream, mode='w|')
+        self.__mtime = time.time()
+
+
+    def write(self, code, dir, file):
+        """Emits code to a file.
+
+        :param code: Code to be written to a file.
+        :param dir: Directory into which code is to be generated.
+        :param file: Name of code file being written.
+        :type code: str
+        :type dir: str
+        :type file: str
+
+        """
+        data = _get_bytes(code)
+        info = tarfile.TarInfo(self.get_relative_path(dir, file))
+        info.size = len(data)
+        info.mode = _FILE_MODE
+        info.mtime = self.__mtime
+        self.__archive.addfile(info, io.BytesIO(data))
+
+
+    def close(self):
+        """Finalises archive and flushes stream.
+
+        """
+        if self.__archive is None:
+            return
+        self.__archive.close()
+        self.__archive = None
+        if self.close_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+def is_archive_output(output_dir):
+    """Returns flag indicating whether an output path denotes an archive rather than a directory.
+
+    :param output_dir: Target output path.
+    :type output_dir: str
+    :returns: True if output is written to an archive or stream, False otherwise.
+    :rtype: bool
+
+    """
+    return output_dir == STDOUT or output_dir.endswith(('.zip', '.whl', '.tar'))
+
+
+def create_output_sink(output_dir, atomic=True, threads=_DEFAULT_THREADS):
+    """Factory method to instantiate the output sink appropriate to an output path.
+
+    - '-' : tar stream written to stdout
+    - '.tar' suffix : tar archive
+    - '.zip' or '.whl' suffix : zip archive / wheel
+    - otherwise : file system directory
+
+    :param output_dir: Target output path.
+    :param atomic: Flag indicating whether files are written atomically (file system only).
+    :param threads: Number of background writer threads (file system only).
+    :type output_dir: str
+    :type atomic: bool
+    :type threads: int
+    :returns: An output sink.
+    :rtype: pyesdoc_mp.utils.output.OutputSink
+
+    """
+    if output_dir == STDOUT:
+        return TarSink(output_dir)
+    elif output_dir.endswith('.tar'):
+        return TarSink(output_dir, open(output_dir, 'wb'), True)
+    elif output_dir.endswith(('.zip', '.whl')):
+        return ZipSink(output_dir)
+    else:
+        return FileSystemSink(output_dir, atomic, threads)
@@ -0,0 +1,277 @@
+"""
+.. module:: pyesdoc_mp.utils.profiling
+   :platform: Unix, Windows
+   :synopsis: Records timings and output statistics of a generation run.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import json
+import time
+
+
+
+# Wall clock (highest available resolution).
+_get_wall_time = getattr(time, 'perf_counter', time.time)
+
+# Process CPU clock (time.clock measures CPU time on Unix under python 2).
+_get_cpu_time = getattr(time, 'process_time', None) or time.clock
+
+# Profile categories passed to hooks.
+CATEGORY_ONTOLOGY = 'ontology'
+CATEGORY_GENERATOR = 'generator'
+CATEGORY_EVENT = 'event'
+
+
+def _create_timing():
+    """Returns an empty timing record."""
+    return {
+        'count' : 0,
+        'wall' : 0.0,
+        'cpu' : 0.0
+    }
+
+
+def _create_generator_record():
+    """Returns an empty generator record."""
+    result = _create_timing()
+    result['files'] = 0
+    result['bytes'] = 0
+    result['events'] = {}
+    return result
+
+
+def _get_bytes(code):
+    """Returns code encoded as bytes (i.e. as written to file)."""
+    if isinstance(code, bytes):
+        return code
+    return code.encode('utf-8')
+
+
+def _merge_timing(target, source):
+    """Accumulates a timing record into another."""
+    for key in ('count', 'wall', 'cpu'):
+        target[key] += source[key]
+
+
+class Profiler(object):
+    """Records timings and output statistics of a generation run.
+
+    Timings are recorded for ontology construction, for each generator and for each
+    parsing event handler of each generator (e.g. on_class_parse).  Hooks, i.e. callables
+    of the form hook(category, key, wall, cpu), are notified of each timing as it is recorded.
+
+    N.B. In parallel mode a generator is executed (and hence counted) once per task, and timings
+    recorded within worker processes are merged into the parent profiler but are not notified to hooks.
+
+    :ivar ontology: Ontology construction timing.
+    :ivar generators: Generator records keyed by generator key.
+    :ivar templates: Template render counts keyed by template file name.
+    :ivar hooks: Set of callables notified of each recorded timing.
+
+    """
+    def __init__(self):
+        """Constructor.
+
+        """
+        self.ontology = _create_timing()
+        self.generators = {}
+        self.templates = {}
+        self.hooks = []
+
+
+    def __getstate__(self):
+        """Returns pickled state (hooks are process local)."""
+        return {
+            'ontology' : self.ontology,
+            'generators' : self.generators,
+            'templates' : self.templates
+        }
+
+
+    def __setstate__(self, state):
+        """Restores pickled state."""
+        self.__dict__.update(state)
+        self.hooks = []
+
+
+    def add_hook(self, hook):
+        """Registers a hook notified of each recorded timing.
+
+        :param hook: Callable invoked as hook(category, key, wall, cpu).
+        :type hook: function
+
+        """
+        self.hooks.append(hook)
+
+
+    def start(self):
+        """Returns a timing start point to be passed to one of the record functions.
+
+        :returns: Wall and CPU clock readings.
+        :rtype: tuple
+
+        """
+        return _get_wall_time(), _get_cpu_time()
+
+
+    def __record(self, timing, started, category, key):
+        """Accumulates elapsed time since a start point."""
+        wall = _get_wall_time() - started[0]
+        cpu = _get_cpu_time() - started[1]
+        timing['count'] += 1
+        timing['wall'] += wall
+        timing['cpu'] += cpu
+        for hook in self.hooks:
+            hook(category, key, wall, cpu)
+
+
+    def __get_generator(self, generator_key):
+        """Returns record of a generator."""
+        if generator_key not in self.generators:
+            self.generators[generator_key] = _create_generator_record()
+        return self.generators[generator_key]
+
+
+    def record_ontology(self, started):
+        """Records ontology construction time.
+
+        :param started: Start point as returned by start().
+        :type started: tuple
+
+        """
+        self.__record(self.ontology, started, CATEGORY_ONTOLOGY, None)
+
+
+    def record_generator(self, generator_key, started):
+        """Records generator execution time.
+
+        :param generator_key: Key assigned to generator.
+        :param started: Start point as returned by start().
+        :type generator_key: str
+        :type started: tuple
+
+        """
+        self.__record(self.__get_generator(generator_key), started, CATEGORY_GENERATOR, generator_key)
+
+
+    def record_event(self, generator_key, handler_name, started):
+        """Records parsing event handler execution time.
+
+        :param generator_key: Key assigned to generator.
+        :param handler_name: Name of event handler, e.g. on_class_parse.
+        :param started: Start point as returned by start().
+        :type generator_key: str
+        :type handler_name: str
+        :type started: tuple
+
+        """
+        events = self.__get_generator(generator_key)['events']
+        if handler_name not in events:
+            events[handler_name] = _create_timing()
+        self.__record(events[handler_name], started, CATEGORY_EVENT, (generator_key, handler_name))
+
+
+    def record_output(self, generator_key, code):
+        """Records code written by a generator to its output sink.
+
+        :param generator_key: Key assigned to generator.
+        :param code: Set of (code, directory, file name) tuples written to output sink.
+        :type generator_key: str
+        :type code: list
+
+        """
+        record = self.__get_generator(generator_key)
+        for code, dir, file in code:
+            record['files'] += 1
+            record['bytes'] += len(_get_bytes(code))
+
+
+    def record_template(self, filename):
+        """Records a template render.
+
+        :param filename: Name of template file.
+        :type filename: str
+
+        """
+        self.templates[filename] = self.templates.get(filename, 0) + 1
+
+
+    def merge(self, other):
+        """Accumulates records of another profiler (e.g. from a worker process).
+
+        :param other: Profiler whose records are merged.
+        :type other: pyesdoc_mp.utils.profiling.Profiler
+
+        """
+        _merge_timing(self.ontology, other.ontology)
+        for generator_key, source in other.generators.items():
+            target = self.__get_generator(generator_key)
+            _merge_timing(target, source)
+            target['files'] += source['files']
+            target['bytes'] += source['bytes']
+            for handler_name, timing in source['events'].items():
+                if handler_name not in target['events']:
+                    target['events'][handler_name] = _create_timing()
+                _merge_timing(target['events'][handler_name], timing)
+        for filename, count in other.templates.items():
+            self.templates[filename] = self.templates.get(filename, 0) + count
+
+
+    def as_dict(self):
+        """Returns profile as a (JSON serializable) dictionary.
+
+        :returns: Profile records.
+        :rtype: dict
+
+        """
+        return {
+            'ontology' : self.ontology,
+            'generators' : self.generators,
+            'templates' : self.templates
+        }
+
+
+    def save(self, path):
+        """Writes profile to a JSON file.
+
+        :param path: Path to JSON file.
+        :type path: str
+
+        """
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=4, sort_keys=True, separators=(',', ': '))
+
+
+    def get_report(self):
+        """Returns profile formatted as a set of report lines.
+
+        :returns: Report lines.
+        :rtype: list
+
+        """
+        line = "{0:<40} {1:>8} {2:>10} {3:>10} {4:>8} {5:>12}"
+        result = [
+            line.format('STAGE', 'COUNT', 'WALL (s)', 'CPU (s)', 'FILES', 'BYTES'),
+            line.format('ontology', self.ontology['count'],
+                        '{0:.4f}'.format(self.ontology['wall']),
+                        '{0:.4f}'.format(self.ontology['cpu']), '', '')
+        ]
+        for generator_key in sorted(self.generators):
+            record = self.generators[generator_key]
+            result.append(line.format(generator_key, record['count'],
+                                      '{0:.4f}'.format(record['wall']),
+                                      '{0:.4f}'.format(record['cpu']),
+                                      record['files'], record['bytes']))
+            for handler_name in sorted(record['events']):
+                timing = record['events'][handler_name]
+                result.append(line.format('  ' + handler_name, timing['count'],
+                                          '{0:.4f}'.format(timing['wall']),
+                                          '{0:.4f}'.format(timing['cpu']), '', ''))
+        for filename in sorted(self.templates):
+            result.append(line.format('template ' + filename, self.templates[filename], '', '', '', ''))
+
+        return result
@@ -0,0 +1,75 @@
+"""
+.. module:: pyesdoc_mp.utils.template
+   :platform: Unix, Windows
+   :synopsis: Code templates compiled for single pass rendering.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+
+"""
+
+# Module imports.
+import re
+
+
+
+# Template placeholder pattern, e.g. {class-name}.
+_PLACEHOLDER = re.compile(r'\{([A-Za-z0-9_\-]+)\}')
+
+
+class Template(object):
+    """A code template compiled into alternating literal and placeholder segments.
+
+    N.B. Rendering substitutes all placeholders in a single pass, substituted values are not
+    themselves scanned for placeholders and unmatched placeholders are emitted verbatim.
+
+    :ivar text: Template source text.
+    :ivar placeholders: Set of placeholder names in order of occurrence.
+
+    """
+    __slots__ = (
+        'text',
+        'placeholders',
+        '__segments'
+        )
+
+    def __init__(self, text):
+        """Constructor.
+
+        :param text: Template source text.
+        :type text: str
+
+        """
+        # Compile: even segments are literals, odd segments are placeholder names.
+        self.text = text
+        self.__segments = _PLACEHOLDER.split(text)
+        self.placeholders = tuple(self.__segments[1::2])
+
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return 'Template({0})'.format(', '.join(self.placeholders))
+
+
+    def render(self, params, defaults=None):
+        """Renders template.
+
+        :param params: Placeholder values keyed by placeholder name.
+        :param defaults: Fallback placeholder values keyed by placeholder name (e.g. standard params).
+        :type params: dict
+        :type defaults: dict
+        :returns: Rendered template.
+        :rtype: str
+
+        """
+        result = list(self.__segments)
+        for i in range(1, len(result), 2):
+            name = result[i]
+            if name in params:
+                result[i] = params[name]
+            elif defaults is not None and name in defaults:
+                result[i] = defaults[name]
+            else:
+                result[i] = '{' + name + '}'
+
+        return ''.join(result)
@@ -5,6 +5,16 @@
 import os
 import re
 
+from pyesdoc_mp.generators.generator_options import (
+    FEATURE_BUNDLE_ONTOLOGY,
+    FEATURE_BUNDLE_PACKAGES,
+    FEATURES
+    )
+from pyesdoc_mp.utils.output import (
+    is_archive_output,
+    STDOUT
+    )
+
 
 # Set of supported programming languages.
 _LANGUAGES = [
@@ -305,6 +315,26 @@ def validate_language(language):
     return errors
 
 
+def validate_features(features):
+    """Returns list of optional generation feature validation errors.
+
+    :param features: Set of optional generation features.
+    :type features: list
+    :returns: List of validation errors (if any).
+    :rtype: list
+
+    """
+    errors = []
+
+    for feature in features or ():
+        if not feature in FEATURES:
+            errors.append('Generation feature is unsupported [{0}].  Supported features are {1}.'.format(feature, list(FEATURES)))
+    if features and FEATURE_BUNDLE_PACKAGES in features and FEATURE_BUNDLE_ONTOLOGY in features:
+        errors.append('Generation features are mutually exclusive [{0}, {1}].'.format(FEATURE_BUNDLE_PACKAGES, FEATURE_BUNDLE_ONTOLOGY))
+
+    return errors
+
+
 def validate_output_dir(output_dir):
     """Returns list of target output directory validation errors.
 
@@ -316,7 +346,13 @@ def validate_output_dir(output_dir):
     """
     errors = []
 
-    if not os.path.exists(output_dir):
+    # Archive output is written to a file within an existing directory.
+    if output_dir == STDOUT:
+        pass
+    elif is_archive_output(output_dir):
+        if not os.path.isdir(os.path.dirname(os.path.abspath(output_dir))):
+            errors.append('Output archive directory does not exist [{0}].'.format(output_dir))
+    elif not os.path.exists(output_dir):
         errors.append('Output directory does not exist [{0}].'.format(output_dir))
 
     return errors
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+.. module:: tests.test_cache
+   :platform: Unix, Windows
+   :synopsis: Unit tests of the on-disk ontology cache.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import glob
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.utils import SRC_DIR
+from pyesdoc_mp.utils import cache
+from pyesdoc_mp.utils.factory import (
+    create_ontology,
+    create_ontology_schema
+    )
+
+
+
+class OntologyCacheTestCase(unittest.TestCase):
+    """Tests caching of linked ontologies.
+
+    """
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        self.schema = create_ontology_schema('cim', '1.5')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, True)
+
+
+    def test_model_folder(self):
+        self.assertEqual(os.path.realpath(cache._ONTOLOGY_MODEL_FOLDER),
+                         os.path.realpath(os.path.join(SRC_DIR, 'pyesdoc_mp', 'ontology')))
+        self.assertTrue(glob.glob(os.path.join(cache._ONTOLOGY_MODEL_FOLDER, 'class_.py')))
+        self.assertTrue(os.path.isfile(cache._ONTOLOGY_FACTORY_FILE))
+
+
+    def test_fingerprint_covers_factory(self):
+        factory_file = cache._ONTOLOGY_FACTORY_FILE
+        fingerprint = cache.get_schema_fingerprint(self.schema)
+        try:
+            cache._ONTOLOGY_FACTORY_FILE = os.path.join(self.cache_dir, 'factory.py')
+            with open(cache._ONTOLOGY_FACTORY_FILE, 'w') as f:
+                f.write('# A changed factory.')
+            self.assertNotEqual(cache.get_schema_fingerprint(self.schema), fingerprint)
+        finally:
+            cache._ONTOLOGY_FACTORY_FILE = factory_file
+
+
+    def test_save_and_load(self):
+        ontology = create_ontology(self.schema)
+        self.assertIsNone(cache.load_ontology(self.schema, self.cache_dir))
+        self.assertTrue(cache.save_ontology(self.schema, ontology, self.cache_dir))
+        self.assertTrue(cache.save_ontology(self.schema, ontology, self.cache_dir))
+        loaded = cache.load_ontology(self.schema, self.cache_dir)
+        self.assertEqual(sorted(c.name for c in loaded.classes), sorted(c.name for c in ontology.classes))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+
+    def test_save_stale_entries_removed(self):
+        ontology = create_ontology(self.schema)
+        cache.save_ontology(self.schema, ontology, self.cache_dir, 'stale')
+        cache.save_ontology(self.schema, ontology, self.cache_dir)
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(cache._get_cache_file_path(
+            self.schema, self.cache_dir, cache.get_schema_fingerprint(self.schema)))])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
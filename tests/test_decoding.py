@@ -0,0 +1,242 @@
+"""
+.. module:: tests.test_decoding
+   :platform: Unix, Windows
+   :synopsis: Unit tests of generated XML decoders.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from tests.utils import (
+    import_generated,
+    skip_unless_importable
+    )
+
+
+
+# Directory containing XML fixtures.
+_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# CIM namespace of XML fixtures.
+_CIM_NAMESPACE = 'http://www.purl.org/org/esmetadata/cim/1.5/schemas'
+
+
+def _get_fixture(name):
+    """Returns path to an XML fixture."""
+    return os.path.join(_FIXTURES_DIR, name)
+
+
+def _read_fixture(name):
+    """Returns bytes of an XML fixture."""
+    with open(_get_fixture(name), 'rb') as f:
+        return f.read()
+
+
+@skip_unless_importable('lxml', 'simplejson')
+class DecoderRegistryTestCase(unittest.TestCase):
+    """Tests sniffing & decoding of entity documents by root tag.
+
+    """
+    def setUp(self):
+        self.serialization = import_generated('cim.v1_5.serialization')
+
+
+    def test_get_decoder(self):
+        nsmap = {'cim' : _CIM_NAMESPACE}
+        self.assertIs(self.serialization.get_decoder('{{{0}}}modelComponent'.format(_CIM_NAMESPACE), nsmap),
+                      self.serialization.decode_model_component)
+        self.assertIsNone(self.serialization.get_decoder('{urn:other}modelComponent', nsmap))
+        self.assertIsNone(self.serialization.get_decoder('{{{0}}}unknownDocument'.format(_CIM_NAMESPACE), nsmap))
+
+
+    def test_sniff_decoder(self):
+        for name, decoder in (
+            ('model_component.xml', self.serialization.decode_model_component),
+            ('simulation_run.xml', self.serialization.decode_simulation_run)
+            ):
+            self.assertEqual(self.serialization.sniff_decoder(_get_fixture(name)), (decoder, {'cim' : _CIM_NAMESPACE}))
+
+
+    def test_sniff_decoder_default_namespace(self):
+        self.assertEqual(self.serialization.sniff_decoder(_get_fixture('model_component_default_namespace.xml')),
+                         (self.serialization.decode_model_component, {'cim' : _CIM_NAMESPACE}))
+
+
+    def test_sniff_decoder_unknown(self):
+        self.assertEqual(self.serialization.sniff_decoder(_get_fixture('unknown.xml')), (None, {'cim' : _CIM_NAMESPACE}))
+
+
+    def test_sniff_decoder_reads_first_chunk(self):
+        data = _read_fixture('model_component.xml')
+        data = data.replace(b'</cim:modelComponent>\n', b'<!--' + b' ' * 8192 + b'-->\n</cim:modelComponent>\n')
+        stream = io.BytesIO(data)
+        self.serialization.sniff_decoder(stream)
+        self.assertTrue(0 < stream.tell() < len(data))
+
+
+    def test_sniff_decoder_empty(self):
+        from lxml import etree as et
+        self.assertRaises(et.XMLSyntaxError, self.serialization.sniff_decoder, io.BytesIO(b''))
+        self.assertRaises(et.XMLSyntaxError, self.serialization.sniff_decoder, io.BytesIO(b'<?xml version="1.0"?>'))
+
+
+    def test_decode_document(self):
+        component = self.serialization.decode_document(_get_fixture('model_component.xml'))
+        self.assertEqual(type(component).__name__, 'ModelComponent')
+        self.assertEqual(component.short_name, 'HadGEM2-ES')
+        self.assertEqual([c.short_name for c in component.children], ['Atmosphere'])
+        self.assertEqual(str(component.cim_info.id), '1d2a6c0e-3f41-4b8e-9c55-7a0e4f2b9c10')
+
+
+    def test_decode_document_default_namespace(self):
+        component = self.serialization.decode_document(_get_fixture('model_component_default_namespace.xml'))
+        self.assertEqual(component.short_name, 'HadGEM2-ES')
+        self.assertEqual([c.short_name for c in component.children], ['Atmosphere'])
+        self.assertEqual(str(component.cim_info.id), '1d2a6c0e-3f41-4b8e-9c55-7a0e4f2b9c10')
+
+
+    def test_decode_document_byte_stream(self):
+        simulation = self.serialization.decode_document(io.BytesIO(_read_fixture('simulation_run.xml')))
+        self.assertEqual(type(simulation).__name__, 'SimulationRun')
+        self.assertEqual(simulation.short_name, 'historical')
+
+
+    def test_decode_document_text_stream(self):
+        data = _read_fixture('simulation_run.xml').decode('utf-8').replace(' encoding="UTF-8"', '')
+        simulation = self.serialization.decode_document(io.StringIO(data))
+        self.assertEqual(simulation.short_name, 'historical')
+
+
+    def test_decode_document_unknown(self):
+        self.assertRaises(ValueError, self.serialization.decode_document, _get_fixture('unknown.xml'))
+
+
+
+
+@skip_unless_importable('lxml', 'simplejson')
+class DecoderStreamTestCase(unittest.TestCase):
+    """Tests streaming decoding of entity documents.
+
+    """
+    def setUp(self):
+        self.serialization = import_generated('cim.v1_5.serialization')
+
+
+    def test_decode_stream(self):
+        component, simulation = list(self.serialization.decode_stream(_get_fixture('document_set.xml')))
+        self.assertEqual(type(component).__name__, 'ModelComponent')
+        self.assertEqual(type(simulation).__name__, 'SimulationRun')
+        self.assertEqual(simulation.short_name, 'historical')
+        self.assertEqual(str(simulation.cim_info.id), '5b7e2f90-8c1d-4e3a-b6f4-0d9a1c2e3f45')
+
+
+    def test_decode_stream_nested(self):
+        # Nested entities are decoded as part of their parent & absolute paths are evaluated against each entity.
+        component = next(self.serialization.decode_stream(_get_fixture('document_set.xml')))
+        self.assertEqual(component.short_name, 'HadGEM2-ES')
+        self.assertEqual([c.short_name for c in component.children], ['Atmosphere'])
+        self.assertEqual(str(component.cim_info.id), '1d2a6c0e-3f41-4b8e-9c55-7a0e4f2b9c10')
+
+
+    def test_decode_stream_byte_stream(self):
+        documents = list(self.serialization.decode_stream(io.BytesIO(_read_fixture('model_component.xml'))))
+        self.assertEqual([d.short_name for d in documents], ['HadGEM2-ES'])
+
+
+    def test_decode_stream_default_namespace(self):
+        documents = list(self.serialization.decode_stream(_get_fixture('model_component_default_namespace.xml')))
+        self.assertEqual([d.short_name for d in documents], ['HadGEM2-ES'])
+
+
+    def test_decode_stream_unknown(self):
+        self.assertEqual(list(self.serialization.decode_stream(_get_fixture('unknown.xml'))), [])
+
+
+
+@skip_unless_importable('lxml', 'simplejson')
+class DecoderBatchTestCase(unittest.TestCase):
+    """Tests batch decoding of XML files.
+
+    """
+    def setUp(self):
+        self.serialization = import_generated('cim.v1_5.serialization')
+        self.dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        self.devnull = open(os.devnull, 'w')
+
+
+    def tearDown(self):
+        self.devnull.close()
+        shutil.rmtree(self.dir, True)
+
+
+    def _write_prefixed(self):
+        """Writes a document binding the entity namespace to another prefix."""
+        path = os.path.join(self.dir, 'prefixed.xml')
+        with open(path, 'wb') as f:
+            f.write(_read_fixture('simulation_run.xml').replace(b'cim:', b'c:').replace(b'xmlns:cim=', b'xmlns:c='))
+        return path
+
+
+    def test_decode_directory(self):
+        results = self.serialization.decode_directory(_FIXTURES_DIR, processes=1)
+        self.assertEqual([os.path.basename(r[0]) for r in results],
+                         ['document_set.xml', 'model_component.xml', 'model_component_default_namespace.xml',
+                          'simulation_run.xml', 'unknown.xml'])
+        self.assertEqual([None if r[1] is None else [d.short_name for d in r[1]] for r in results],
+                         [['HadGEM2-ES', 'historical'], ['HadGEM2-ES'], ['HadGEM2-ES'], ['historical'], None])
+        self.assertEqual([r[2] for r in results][:4], [None] * 4)
+
+
+    def test_decode_files_unknown(self):
+        # A file holding no recognised entity document is a failure.
+        path, documents, error = self.serialization.decode_files([_get_fixture('unknown.xml')])[0]
+        self.assertIsNone(documents)
+        self.assertEqual(error, 'ValueError: No recognised entity documents')
+
+
+    def test_decode_files_nsmap(self):
+        # Documents whose entity namespace is bound to another prefix are decoded against an explicit nsmap.
+        path = self._write_prefixed()
+        self.assertIsNotNone(self.serialization.decode_files([path])[0][2])
+        path, documents, error = self.serialization.decode_files([path], nsmap={'cim' : _CIM_NAMESPACE})[0]
+        self.assertIsNone(error)
+        self.assertEqual([d.short_name for d in documents], ['historical'])
+
+
+    def test_main_nsmap(self):
+        path = self._write_prefixed()
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        main = [sys.executable, '-m', 'cim.v1_5.serialization']
+        self.assertEqual(subprocess.call(main + [path], env=env, stdout=self.devnull), 1)
+        self.assertEqual(subprocess.call(main + ['--nsmap', 'cim=' + _CIM_NAMESPACE, path], env=env, stdout=self.devnull), 0)
+
+
+    def test_decode_files_as_dict(self):
+        path, documents, error = self.serialization.decode_files([_get_fixture('simulation_run.xml')], as_dict=True)[0]
+        self.assertIsNone(error)
+        self.assertEqual(documents[0]['short_name'], 'historical')
+
+
+    def test_decode_files_error(self):
+        # A file failing to decode is reported within its result.
+        path = os.path.join(self.dir, 'malformed.xml')
+        with open(path, 'wb') as f:
+            f.write(b'<cim:modelComponent')
+        results = self.serialization.decode_files([path, _get_fixture('simulation_run.xml')], processes=1)
+        self.assertIsNone(results[0][1])
+        self.assertTrue(results[0][2].startswith('XMLSyntaxError'))
+        self.assertEqual([d.short_name for d in results[1][1]], ['historical'])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
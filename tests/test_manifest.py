@@ -0,0 +1,170 @@
+"""
+.. module:: tests.test_manifest
+   :platform: Unix, Windows
+   :synopsis: Unit tests of incremental regeneration driven by an output manifest.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import copy
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import tests.utils
+from pyesdoc_mp import generate
+from pyesdoc_mp.generators.generator_manifest import MANIFEST_FILE
+from pyesdoc_mp.utils.factory import create_ontology_schema
+
+
+
+# Modification time assigned to generated files so as to detect rewrites.
+_AGED_MTIME = 1000000000
+
+
+class IncrementalGenerationTestCase(unittest.TestCase):
+    """Tests incremental regeneration of python code.
+
+    """
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        self.schema = copy.deepcopy(create_ontology_schema('cim', '1.5'))
+
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, True)
+
+
+    def _generate(self, features=None):
+        generate(self.schema, 'python', self.output_dir, incremental=True, features=features)
+
+
+    def _get_files(self):
+        """Returns set of generated files relative to output directory."""
+        result = []
+        for root, dirs, files in os.walk(self.output_dir):
+            result += [os.path.relpath(os.path.join(root, f), self.output_dir).replace(os.sep, '/') for f in files]
+
+        return sorted(result)
+
+
+    def _age_files(self):
+        """Assigns an old modification time to all generated files."""
+        for f in self._get_files():
+            os.utime(os.path.join(self.output_dir, f), (_AGED_MTIME, _AGED_MTIME))
+
+
+    def _get_rewritten_files(self):
+        """Returns set of generated files (re)written since files were aged."""
+        return [f for f in self._get_files() if os.path.getmtime(os.path.join(self.output_dir, f)) != _AGED_MTIME]
+
+
+    def _get_class(self, package_name, class_name):
+        """Returns schema declaration of a class."""
+        for package in self.schema['packages']:
+            if package['name'] == package_name:
+                for cls in package['classes']:
+                    if cls['name'] == class_name:
+                        return cls
+
+
+    def test_manifest(self):
+        self._generate()
+        self.assertIn(MANIFEST_FILE, os.listdir(self.output_dir))
+        with open(os.path.join(self.output_dir, MANIFEST_FILE)) as f:
+            self.assertTrue(json.load(f)['entries'])
+        self.assertEqual([f for f in self._get_files() if f.endswith('.tmp')], [])
+
+
+    def test_rerun_unchanged(self):
+        self._generate()
+        self._age_files()
+        self._generate()
+        self.assertEqual(self._get_rewritten_files(), [])
+
+
+    def test_rerun_changed_class(self):
+        self._generate()
+        self._age_files()
+        self._get_class('shared', 'calendar')['doc'] = 'A changed calendar.'
+        self._generate()
+        rewritten = self._get_rewritten_files()
+        self.assertIn('cim/v1_5/types/shared/calendar.py', rewritten)
+        self.assertNotIn('cim/v1_5/types/software/model_component.py', rewritten)
+        self.assertIn(MANIFEST_FILE, rewritten)
+        with open(os.path.join(self.output_dir, 'cim/v1_5/types/shared/calendar.py')) as f:
+            self.assertIn('A changed calendar.', f.read())
+
+
+    def test_rerun_changed_features(self):
+        self._generate()
+        self._age_files()
+        self._generate(['slots'])
+        self.assertIn('cim/v1_5/types/software/model_component.py', self._get_rewritten_files())
+
+
+    def test_rerun_deleted_file(self):
+        self._generate()
+        os.remove(os.path.join(self.output_dir, 'cim/v1_5/types/shared/calendar.py'))
+        self._age_files()
+        self._generate()
+        self.assertEqual(self._get_rewritten_files(), ['cim/v1_5/types/shared/calendar.py'])
+
+
+    def test_rerun_removes_stale_files(self):
+        # Files of a previous layout are removed even though the manifest of the previous run is discarded.
+        self._generate()
+        self._generate(['bundle-packages'])
+        files = self._get_files()
+        self.assertIn('cim/v1_5/types/shared/__init__.py', files)
+        self.assertNotIn('cim/v1_5/types/shared/calendar.py', files)
+        self._generate()
+        self.assertIn('cim/v1_5/types/shared/calendar.py', self._get_files())
+
+
+    def test_relative_paths(self):
+        self._generate()
+        with open(os.path.join(self.output_dir, MANIFEST_FILE)) as f:
+            entries = json.load(f)['entries']
+        files = [f for e in entries.values() for f in e['files']]
+        self.assertIn('cim/v1_5/types/shared/calendar.py', files)
+        self.assertFalse([f for f in files if os.path.isabs(f)])
+
+
+    def test_rerun_moved_output(self):
+        # A copied output directory is regenerated independently of the original.
+        self._generate()
+        original_dir = self.output_dir
+        self.output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        try:
+            shutil.rmtree(self.output_dir)
+            shutil.copytree(original_dir, self.output_dir)
+            self._age_files()
+            self._generate()
+            self.assertEqual(self._get_rewritten_files(), [])
+            self._generate(['bundle-packages'])
+            self.assertNotIn('cim/v1_5/types/shared/calendar.py', self._get_files())
+            self.assertTrue(os.path.isfile(os.path.join(original_dir, 'cim/v1_5/types/shared/calendar.py')))
+        finally:
+            shutil.rmtree(original_dir, True)
+
+
+    def test_rerun_relative_output(self):
+        self._generate()
+        self._age_files()
+        cwd = os.getcwd()
+        os.chdir(os.path.dirname(self.output_dir))
+        try:
+            generate(self.schema, 'python', os.path.basename(self.output_dir), incremental=True)
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(self._get_rewritten_files(), [])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+.. module:: tests.test_ontology
+   :platform: Unix, Windows
+   :synopsis: Unit tests of ontology construction.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import copy
+import unittest
+
+import tests.utils
+from pyesdoc_mp.ontology.class_ import Class
+from pyesdoc_mp.ontology.ontology import get_classes_in_inheritance_order
+from pyesdoc_mp.utils.factory import (
+    create_ontology,
+    create_ontology_schema
+    )
+
+
+
+def _create_class(name, base=None):
+    """Returns a class without properties."""
+    return Class(name, base, False, None, [], [], [])
+
+
+class InheritanceOrderTestCase(unittest.TestCase):
+    """Tests sorting of classes in inheritance order.
+
+    """
+    def test_inheritance_order(self):
+        base = _create_class('base')
+        sub = _create_class('sub', base)
+        sub_sub = _create_class('sub_sub', sub)
+        self.assertEqual(get_classes_in_inheritance_order([sub_sub, base, sub]), [base, sub, sub_sub])
+
+
+    def test_inheritance_cycle(self):
+        a = _create_class('a')
+        b = _create_class('b', a)
+        a.base = _create_class('c', b)
+        self.assertRaises(ValueError, get_classes_in_inheritance_order, [a])
+
+
+    def test_self_inheritance(self):
+        a = _create_class('a')
+        a.base = a
+        self.assertRaises(ValueError, get_classes_in_inheritance_order, [a])
+
+
+    def test_ontology_inheritance_cycle(self):
+        schema = copy.deepcopy(create_ontology_schema('cim', '1.5'))
+        for package in schema['packages']:
+            for cls in package['classes']:
+                if (package['name'], cls['name']) == ('shared', 'calendar'):
+                    cls['base'] = 'shared.daily_360'
+        try:
+            create_ontology(schema)
+        except ValueError as e:
+            self.assertIn('shared.calendar -> shared.daily_360 -> shared.calendar', str(e))
+        else:
+            self.fail('Inheritance cycle not detected.')
+
+
+
+if __name__ == '__main__':
+    unittest.main()
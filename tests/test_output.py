@@ -0,0 +1,195 @@
+"""
+.. module:: tests.test_output
+   :platform: Unix, Windows
+   :synopsis: Unit tests of output sinks to which generated code is emitted.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+# N.B. imported so as to add code under test to python path.
+import tests.utils
+from pyesdoc_mp.utils.output import (
+    create_output_sink,
+    FileSystemSink,
+    MemorySink,
+    OutputSink,
+    TarSink,
+    write_file_atomically,
+    ZipSink
+    )
+
+
+
+class WriteFileAtomicallyTestCase(unittest.TestCase):
+    """Tests atomic writes of files.
+
+    """
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        self.path = os.path.join(self.dir, 'file.txt')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, True)
+
+
+    def _read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+
+    def test_write(self):
+        write_file_atomically(self.path, 'text')
+        self.assertEqual(self._read(), b'text')
+        write_file_atomically(self.path, b'\x00bytes')
+        self.assertEqual(self._read(), b'\x00bytes')
+        self.assertEqual(os.listdir(self.dir), ['file.txt'])
+
+
+    def test_mode(self):
+        write_file_atomically(self.path, 'text', 0o600)
+        if os.name != 'nt':
+            self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+
+    def test_failure(self):
+        # A failed write leaves the existing file untouched & removes the temp file.
+        write_file_atomically(self.path, 'text')
+        self.assertRaises(TypeError, write_file_atomically, self.path, 10)
+        self.assertEqual(self._read(), b'text')
+        self.assertEqual(os.listdir(self.dir), ['file.txt'])
+
+
+
+class OutputSinkTestCase(unittest.TestCase):
+    """Tests output sinks.
+
+    """
+    # Emitted (code, relative directory, file name) tuples.
+    _CODE = [
+        ('a = 1\n', '', '__init__.py'),
+        ('b = 2\n', 'package', 'module.py'),
+        ('c = 3\n', 'package/sub', 'module.py')
+    ]
+
+    # Expected files keyed by path relative to sink root.
+    _FILES = {
+        '__init__.py' : 'a = 1\n',
+        'package/module.py' : 'b = 2\n',
+        'package/sub/module.py' : 'c = 3\n'
+    }
+
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        self.root = os.path.join(self.dir, 'output')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, True)
+
+
+    def _emit(self, sink):
+        for code, dir, file in self._CODE:
+            sink.write(code, os.path.join(self.root, dir), file)
+        sink.close()
+
+
+    def _get_files(self):
+        result = {}
+        for dir, dirs, files in os.walk(self.root):
+            for file in files:
+                path = os.path.join(dir, file)
+                with open(path, 'r') as f:
+                    result[os.path.relpath(path, self.root).replace(os.sep, '/')] = f.read()
+        return result
+
+
+    def test_abstract(self):
+        class IncompleteSink(OutputSink):
+            pass
+        self.assertRaises(TypeError, OutputSink, self.root)
+        self.assertRaises(TypeError, IncompleteSink, self.root)
+
+
+    def test_file_system(self):
+        for atomic in (True, False):
+            for threads in (0, 1, 4):
+                shutil.rmtree(self.root, True)
+                self._emit(FileSystemSink(self.root, atomic, threads))
+                self.assertEqual(self._get_files(), self._FILES)
+
+
+    def test_file_system_error(self):
+        # A write failing within a writer thread is raised upon close.
+        sink = FileSystemSink(self.root, threads=2)
+        sink.write(None, self.root, 'module.py')
+        self.assertRaises(TypeError, sink.close)
+        self.assertEqual(os.listdir(self.root), [])
+
+
+    def test_memory(self):
+        sink = MemorySink(self.root)
+        self._emit(sink)
+        self.assertEqual(sink.files, self._FILES)
+        self.assertTrue(sink.exists('package/module.py'))
+        self.assertEqual(sink.read('package/module.py'), 'b = 2\n')
+
+
+    def test_zip(self):
+        path = os.path.join(self.dir, 'output.zip')
+        self._emit(ZipSink(path, self.root))
+        with zipfile.ZipFile(path) as archive:
+            files = dict((n, archive.read(n).decode('utf-8')) for n in archive.namelist())
+        self.assertEqual(files, self._FILES)
+
+
+    def test_wheel(self):
+        path = os.path.join(self.dir, 'pycim-1.5-py2.py3-none-any.whl')
+        self._emit(ZipSink(path, self.root))
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+            records = archive.read('pycim-1.5.dist-info/RECORD').decode('utf-8').splitlines()
+            wheel = archive.read('pycim-1.5.dist-info/WHEEL').decode('utf-8')
+        for name in self._FILES:
+            self.assertIn(name, names)
+        self.assertEqual(sorted(r.split(',')[0] for r in records), sorted(
+            list(self._FILES) + ['pycim-1.5.dist-info/METADATA', 'pycim-1.5.dist-info/WHEEL', 'pycim-1.5.dist-info/RECORD']))
+        self.assertIn('Tag: py2.py3-none-any', wheel)
+
+
+    def test_tar(self):
+        stream = io.BytesIO()
+        self._emit(TarSink(self.root, stream))
+        stream.seek(0)
+        with tarfile.open(fileobj=stream, mode='r') as archive:
+            files = dict((m.name, archive.extractfile(m).read().decode('utf-8')) for m in archive.getmembers())
+        self.assertEqual(files, self._FILES)
+
+
+    def test_create_output_sink(self):
+        for path, cls in (
+            (self.root, FileSystemSink),
+            (os.path.join(self.dir, 'output.zip'), ZipSink),
+            (os.path.join(self.dir, 'output.whl'), ZipSink),
+            (os.path.join(self.dir, 'output.tar'), TarSink)):
+            sink = create_output_sink(path)
+            try:
+                self.assertIsInstance(sink, cls)
+            finally:
+                sink.close()
+
+
+
+if __name__ == '__main__':
+    unittest.main()
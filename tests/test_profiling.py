@@ -0,0 +1,65 @@
+"""
+.. module:: tests.test_profiling
+   :platform: Unix, Windows
+   :synopsis: Unit tests of generation profiling.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import shutil
+import tempfile
+import unittest
+
+import tests.utils
+from pyesdoc_mp import generate
+from pyesdoc_mp.utils.factory import create_ontology_schema
+from pyesdoc_mp.utils.profiling import Profiler
+
+
+
+class ProfilerTestCase(unittest.TestCase):
+    """Tests output statistics recorded by a profiler.
+
+    """
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        self.schema = create_ontology_schema('cim', '1.5')
+
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, True)
+
+
+    def _generate(self):
+        """Returns profiler of an incremental generation run."""
+        profiler = Profiler()
+        generate(self.schema, 'python', self.output_dir, incremental=True, profiler=profiler)
+
+        return profiler
+
+
+    def test_record_output_bytes(self):
+        # Output size is that of encoded code rather than number of characters.
+        profiler = Profiler()
+        profiler.record_output('types', [(u'# \u00e9t\u00e9\n', self.output_dir, 'a.py')])
+        self.assertEqual(profiler.generators['types']['files'], 1)
+        self.assertEqual(profiler.generators['types']['bytes'], 8)
+
+
+    def test_record_output_written(self):
+        profiler = self._generate()
+        self.assertTrue(profiler.generators['types']['files'])
+        self.assertTrue(profiler.generators['types']['bytes'])
+
+        # ... files skipped by the manifest are not recorded.
+        profiler = self._generate()
+        for record in profiler.generators.values():
+            self.assertEqual(record['files'], 0)
+            self.assertEqual(record['bytes'], 0)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
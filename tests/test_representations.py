@@ -0,0 +1,301 @@
+"""
+.. module:: tests.test_representations
+   :platform: Unix, Windows
+   :synopsis: Unit tests of representations (i.e. dictionary & JSON encodings) of generated types.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import datetime
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from tests.utils import (
+    get_generated_dir,
+    import_generated,
+    skip_unless_importable
+    )
+
+
+
+class _Stream(object):
+    """A minimal (python 2 & 3) text stream to which JSON is written."""
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+
+
+def _encode_value(value):
+    """Encodes a simple value as per the JSON encoder of generated types."""
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def _write_json(instance):
+    """Returns JSON representation of a type instance."""
+    stream = _Stream()
+    instance.write_json(stream)
+
+    return ''.join(stream.chunks)
+
+
+def _create_calendar(cls=None):
+    """Returns a calendar whose property values are deterministic."""
+    shared = import_generated('pycim.v1_5.types.shared')
+    calendar = (cls or shared.Daily360)()
+    calendar.description = 'A calendar'
+    calendar.length = 10
+    calendar.range = shared.ClosedDateRange()
+    calendar.range.duration = 'P10Y'
+    calendar.range.start = calendar.range.end = datetime.datetime(2000, 1, 1)
+
+    return calendar
+
+
+@skip_unless_importable('simplejson')
+class CyclicGraphTestCase(unittest.TestCase):
+    """Tests representations of object graphs containing references to ancestors.
+
+    """
+    def setUp(self):
+        software = import_generated('pycim.v1_5.types.software')
+        self.parent = software.ModelComponent()
+        self.parent.short_name = 'parent'
+        self.child = software.ModelComponent()
+        self.child.short_name = 'child'
+        self.child.parent = self.parent
+        self.parent.children.append(self.child)
+
+
+    def test_as_dict_back_reference(self):
+        d = self.parent.as_dict()
+        self.assertEqual(d['children'][0]['short_name'], 'child')
+        self.assertEqual(d['children'][0]['parent'], {'__ref__': 1})
+
+
+    def test_as_dict_self_reference(self):
+        self.parent.parent = self.parent
+        self.assertEqual(self.parent.as_dict()['parent'], {'__ref__': 0})
+
+
+    def test_as_dict_shared_instance(self):
+        # A shared instance that is not an ancestor is not a cycle & is therefore represented in full.
+        sibling = type(self.child)()
+        sibling.activity = self.child.activity = import_generated('pycim.v1_5.types.activity').SimulationRun()
+        self.parent.children.append(sibling)
+        children = self.parent.as_dict()['children']
+        self.assertEqual(children[0]['activity'], children[1]['activity'])
+        self.assertNotIn('__ref__', children[0]['activity'])
+
+
+    def test_from_dict_back_reference(self):
+        parent = type(self.parent).from_dict(self.parent.as_dict())
+        self.assertIs(parent.children[0].parent, parent)
+        self.assertEqual(parent.children[0].short_name, 'child')
+
+
+    def test_json_back_reference(self):
+        d = json.loads(_write_json(self.parent))
+        self.assertEqual(d['children'][0]['parent'], {'__ref__': 1})
+        self.assertEqual(d, json.loads(json.dumps(self.parent.as_dict(True), default=_encode_value)))
+
+
+    def test_json_round_trip(self):
+        parent = type(self.parent).read_json(_write_json(self.parent))
+        self.assertIs(parent.children[0].parent, parent)
+
+
+    def test_from_dict_invalid_back_reference(self):
+        d = self.parent.as_dict()
+        d['children'][0]['parent'] = {'__ref__': 5}
+        self.assertRaises(ValueError, type(self.parent).from_dict, d)
+
+
+
+@skip_unless_importable('simplejson')
+class PolymorphicTypeTestCase(unittest.TestCase):
+    """Tests that representations of instances of subclasses of declared types preserve their type.
+
+    N.B. Subclasses & their base classes often share a set of fields, e.g. shared.Calendar & shared.Daily360.
+
+    """
+    def setUp(self):
+        self.activity = import_generated('pycim.v1_5.types.activity')
+        self.shared = import_generated('pycim.v1_5.types.shared')
+        self.experiment = self.activity.NumericalExperiment()
+        self.experiment.requirements = [
+            self.activity.BoundaryCondition(),
+            self.activity.InitialCondition(),
+            self.activity.OutputRequirement(),
+            self.activity.NumericalRequirement()
+        ]
+
+
+    def test_as_dict_untyped(self):
+        # Type discriminators are emitted upon request only.
+        self.assertNotIn('__type__', self.shared.Daily360().as_dict())
+        self.assertNotIn('__type__', self.experiment.as_dict()['requirements'][0])
+
+
+    def test_as_dict_type_discriminator(self):
+        self.assertEqual(self.shared.Daily360().as_dict(typed=True)['__type__'], 'shared.daily_360')
+        self.assertEqual(self.experiment.as_dict(typed=True)['requirements'][0]['__type__'], 'activity.boundary_condition')
+
+
+    def test_json_type_discriminator(self):
+        self.assertEqual(json.loads(_write_json(self.shared.Daily360()))['__type__'], 'shared.daily_360')
+        stream = _Stream()
+        self.shared.Daily360().write_json(stream, typed=False)
+        self.assertNotIn('__type__', json.loads(''.join(stream.chunks)))
+
+
+    def test_from_dict_subclass(self):
+        for cls in (self.shared.Daily360, self.shared.PerpetualPeriod, self.shared.RealCalendar, self.shared.Calendar):
+            self.assertIs(type(self.shared.Calendar.from_dict(cls().as_dict(typed=True))), cls)
+
+
+    def test_from_dict_polymorphic_property(self):
+        simulation = self.activity.SimulationRun()
+        simulation.calendar = self.shared.Daily360()
+        result = type(simulation).from_dict(simulation.as_dict(typed=True))
+        self.assertIs(type(result), self.activity.SimulationRun)
+        self.assertIs(type(result.calendar), self.shared.Daily360)
+
+
+    def test_from_dict_polymorphic_list(self):
+        result = type(self.experiment).from_dict(self.experiment.as_dict(typed=True))
+        self.assertEqual([type(r) for r in result.requirements], [type(r) for r in self.experiment.requirements])
+        self.assertTrue(result.is_equivalent(self.experiment))
+
+
+    def test_json_polymorphic_list(self):
+        result = type(self.experiment).read_json(_write_json(self.experiment))
+        self.assertEqual([type(r) for r in result.requirements], [type(r) for r in self.experiment.requirements])
+
+
+    def test_from_dict_invalid_type_discriminator(self):
+        d = self.shared.Daily360().as_dict(typed=True)
+        d['__type__'] = 'software.model_component'
+        self.assertRaises(ValueError, self.shared.Calendar.from_dict, d)
+
+
+    def test_from_dict_untyped(self):
+        # Dictionaries without a type discriminator are decoded by matching dictionary keys to fields.
+        d = self.experiment.as_dict()
+        result = type(self.experiment).from_dict(d)
+        self.assertIs(type(result), type(self.experiment))
+        self.assertEqual(result.as_dict(), self.experiment.as_dict())
+
+
+
+@skip_unless_importable('simplejson')
+class FingerprintTestCase(unittest.TestCase):
+    """Tests content fingerprints & interning of type instances.
+
+    """
+    def setUp(self):
+        self.shared = import_generated('pycim.v1_5.types.shared')
+
+
+    def test_fingerprint_is_digest(self):
+        fingerprint = _create_calendar().get_fingerprint()
+        self.assertEqual(len(fingerprint), 64)
+        int(fingerprint, 16)
+
+
+    def test_fingerprint_is_structural(self):
+        calendar = _create_calendar()
+        self.assertEqual(calendar.get_fingerprint(), _create_calendar().get_fingerprint())
+        calendar.range.duration = 'P20Y'
+        self.assertNotEqual(calendar.get_fingerprint(), _create_calendar().get_fingerprint())
+        self.assertNotEqual(_create_calendar(self.shared.PerpetualPeriod).get_fingerprint(),
+                            _create_calendar().get_fingerprint())
+
+
+    def test_fingerprint_is_stable_across_processes(self):
+        code = '; '.join([
+            'import sys',
+            'sys.path[:0] = {0!r}'.format([get_generated_dir(), os.path.dirname(__file__) + '/..']),
+            'from tests.test_representations import _create_calendar',
+            'print(_create_calendar().get_fingerprint())'
+            ])
+        env = dict(os.environ, PYTHONHASHSEED='123')
+        output = subprocess.check_output([sys.executable, '-c', code], env=env).decode('ascii').strip()
+        self.assertEqual(output.splitlines()[-1], _create_calendar().get_fingerprint())
+
+
+    def test_intern_pool(self):
+        representations = import_generated('pycim.v1_5.types.representations')
+        pool = representations.InternPool()
+        calendars = pool.intern_list([_create_calendar(), _create_calendar()])
+        self.assertIs(calendars[0], calendars[1])
+        self.assertIs(calendars[0].range, calendars[1].range)
+
+
+    def _create_documents(self):
+        """Returns a pair of structurally identical documents."""
+        software = import_generated('pycim.v1_5.types.software')
+        result = []
+        for _ in range(2):
+            document = software.ModelComponent()
+            document.short_name = 'HadGEM2-ES'
+            document.cim_info = None
+            document.release_date = datetime.datetime(2000, 1, 1)
+            document.citations = [self.shared.Citation()]
+            document.citations[0].title = 'A citation'
+            document.citations[0].date = datetime.datetime(2000, 1, 1)
+            result.append(document)
+
+        return result
+
+
+    def test_intern_pool_documents(self):
+        # Structurally identical documents remain distinct whilst their value like sub-objects are shared.
+        representations = import_generated('pycim.v1_5.types.representations')
+        documents = self._create_documents()
+        interned = representations.InternPool().intern_list(documents)
+        self.assertIs(interned[0], documents[0])
+        self.assertIs(interned[1], documents[1])
+        self.assertIs(documents[0].citations[0], documents[1].citations[0])
+
+
+    def test_intern_pool_document_types(self):
+        representations = import_generated('pycim.v1_5.types.representations')
+        documents = self._create_documents()
+        # Entity documents are pooled upon request.
+        pool = representations.InternPool([type(documents[0]), self.shared.Citation])
+        interned = pool.intern_list(documents)
+        self.assertIs(interned[0], interned[1])
+        self.assertEqual(len(pool), 2)
+
+
+    def test_intern_pool_in_place(self):
+        # References to nested instances are replaced in place by references to canonical instances.
+        representations = import_generated('pycim.v1_5.types.representations')
+        pool = representations.InternPool()
+        calendar = pool.intern(_create_calendar())
+        other = _create_calendar()
+        other_range = other.range
+        self.assertIs(pool.intern(other), calendar)
+        self.assertIs(other.range, calendar.range)
+        self.assertIsNot(other.range, other_range)
+
+
+    def test_intern_pool_distinguishes_types_of_same_name(self):
+        # Types of different packages may share a name.
+        other_type = type('Daily360', (self.shared.Calendar, ), {})
+        representations = import_generated('pycim.v1_5.types.representations')
+        pool = representations.InternPool()
+        calendars = pool.intern_list([_create_calendar(), _create_calendar(other_type)])
+        self.assertIsNot(calendars[0], calendars[1])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
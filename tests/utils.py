@@ -0,0 +1,76 @@
+"""
+.. module:: tests.utils
+   :platform: Unix, Windows
+   :synopsis: Utility functions shared by unit tests.
+
+.. moduleauthor:: Mark Conway-Greenslade (formerly Morgan) <momipsl@ipsl.jussieu.fr>
+
+"""
+
+# Module imports.
+import atexit
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+
+
+# Directory containing code under test.
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Directory into which code is generated (once per test run).
+_generated_dir = None
+
+
+def skip_unless_importable(*modules):
+    """Returns decorator skipping a test (case) unless a set of (third party) modules are importable.
+
+    :param modules: Names of modules upon which a test depends.
+
+    """
+    missing = []
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            missing.append(module)
+
+    return unittest.skipIf(missing, 'Requires {0}.'.format(', '.join(missing)))
+
+
+def get_generated_dir():
+    """Returns directory into which cim v1.5 python code is generated (once per test run) & added to python path.
+
+    N.B. Generated types are imported as pycim whilst generated decoders are imported as cim.
+
+    """
+    global _generated_dir
+
+    if _generated_dir is None:
+        from pyesdoc_mp import generate
+        from pyesdoc_mp.utils.factory import create_ontology_schema
+
+        output_dir = tempfile.mkdtemp(prefix='pyesdoc_mp-tests-')
+        atexit.register(shutil.rmtree, output_dir, True)
+        generate(create_ontology_schema('cim', '1.5'), 'python', output_dir)
+        shutil.copytree(os.path.join(output_dir, 'cim'), os.path.join(output_dir, 'pycim'))
+        sys.path.insert(0, output_dir)
+        _generated_dir = output_dir
+
+    return _generated_dir
+
+
+def import_generated(module):
+    """Returns a generated module (code being generated upon first use).
+
+    :param module: Name of generated module.
+
+    """
+    get_generated_dir()
+
+    return importlib.import_module(module)